@@ -1,5 +1,7 @@
 import rich_click as click
+from rich import box
 from rich.console import Console
+from rich.panel import Panel
 from src.database.init_db import init_database
 from src.views.auth_view import AuthView
 from src.views.client_view import ClientView
@@ -76,8 +78,6 @@ def init():
         success = init_database()
 
     if success:
-        from rich.panel import Panel
-        from rich import box
         success_content = """
 [bold green]Base de données initialisée avec succès ![/bold green]
 
@@ -105,10 +105,13 @@ def user():
 @user.command('list')
 @click.option('--department', type=click.Choice(['commercial', 'support', 'gestion']),
               help='Filtrer par département')
-def list_users(department):
+@click.option('--page', default=1, type=click.IntRange(min=1), help='Page à afficher (défaut: 1)')
+@click.option('--page-size', default=50, type=click.IntRange(min=1),
+              help='Collaborateurs par page (défaut: 50)')
+def list_users(department, page, page_size):
     """Lister les utilisateurs"""
     user_view = UserView()
-    user_view.list_users_command(department)
+    user_view.list_users_command(department, page, page_size)
 
 
 @user.command('create')
@@ -143,10 +146,15 @@ def change_password(user_id):
 
 
 @user.command('search')
-def search_users():
-    """Rechercher des collaborateurs"""
+@click.option('--name', help='Nom (ou partie du nom) du collaborateur')
+@click.option('--email', help='Email (ou partie de l\'email)')
+@click.option('--employee', help='Numéro d\'employé (ou partie du numéro)')
+@click.option('--department', type=click.Choice(['commercial', 'support', 'gestion']),
+              help='Département')
+def search_users(name, email, employee, department):
+    """Rechercher des collaborateurs (saisie interactive sans option)"""
     user_view = UserView()
-    user_view.search_users_command()
+    user_view.search_users_command(name, email, employee, department)
 
 
 # === GROUPE CLIENTS ===
@@ -309,10 +317,11 @@ def create_event(contract_id):
 
 @event.command('update')
 @click.argument('event_id', type=int)
-def update_event(event_id):
+@click.option('--editor', is_flag=True, help="Modifier tous les champs dans l'éditeur ($VISUAL / $EDITOR)")
+def update_event(event_id, editor):
     """Modifier un événement"""
     event_view = EventView()
-    event_view.update_event_command(event_id)
+    event_view.update_event_command(event_id, use_editor=editor)
 
 
 @event.command('assign')
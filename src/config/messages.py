@@ -53,6 +53,9 @@ USER_MESSAGES = {
     'password_change_success': "Mot de passe changé avec succès",
     'user_not_found': "Utilisateur non trouvé",
     'no_users_found': "Aucun collaborateur trouvé",
+    'page_footer': "Page {page}/{pages} - {total} collaborateur(s)",
+    'page_next_hint': "Page suivante : --page {page}",
+    'page_out_of_range': "Page {page} inexistante (dernière page : {pages})",
     'no_search_results': "Aucun collaborateur correspondant trouvé",
     'no_search_criteria': "Aucun critère de recherche fourni",
     'no_modifications': "Aucune modification apportée",
@@ -129,6 +132,13 @@ CONTRACT_MESSAGES = {
     'no_contracts_found': "Aucun contrat trouvé",
     'permission_commercial_only': "Cette commande est réservée aux commerciaux",
     'no_my_contracts': "Aucun contrat trouvé",
+    'no_search_criteria': "Aucun critère de recherche fourni",
+    'no_search_results': "Aucun contrat ne correspond aux critères",
+    'search_results_count': "{count} contrat(s) trouve(s)",
+    'search_too_many_results': "{count} contrats correspondent : seuls les {limit} premiers seront affichés",
+    'search_results_partial': "{shown} contrat(s) affiché(s) sur {count} trouvé(s)",
+    'search_refine_confirm': "Afficher quand même ? (non pour affiner la recherche)",
+    'search_refine': "Affinez les critères de recherche",
 }
 
 # ===== MESSAGES ÉVÉNEMENTS =====
@@ -144,6 +154,14 @@ EVENT_MESSAGES = {
     'event_not_found': "Événement non trouvé",
     'no_events_found': "Aucun événement trouvé",
     'no_support_available': "Aucun utilisateur support disponible",
+    'all_events_header': "=== TOUS LES EVENEMENTS ===",
+    'unassigned_header': "=== EVENEMENTS SANS SUPPORT ===",
+    'no_unassigned_events': "Aucun événement sans support",
+    'not_found_or_access_denied': "Événement non trouvé ou accès refusé",
+    'signed_contract_not_found': "Contrat {contract_id} introuvable ou non signé",
+    'no_search_criteria': "Aucun critère de recherche fourni",
+    'no_search_results': "Aucun événement ne correspond aux critères",
+    'show_next_page': "Afficher la suite ?",
 }
 
 # ===== MESSAGES DE STATUS/ACTIONS =====
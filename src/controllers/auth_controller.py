@@ -411,7 +411,7 @@ class AuthController(BaseController):
             raise AuthorizationError("Vous n'avez pas l'autorisation de modifier les utilisateurs")
 
         try:
-            user = self.db.query(User).filter(User.id == user_id).first()
+            user = self.db.get(User, user_id)
             if not user:
                 raise ValueError(AUTH_MESSAGES["user_not_found"])
 
@@ -434,7 +434,7 @@ class AuthController(BaseController):
 
     def change_password(self, user_id: int, old_password: str, new_password: str) -> bool:
         """Changer le mot de passe d'un utilisateur"""
-        user = self.db.query(User).filter(User.id == user_id).first()
+        user = self.db.get(User, user_id)
         if not user:
             raise ValueError(AUTH_MESSAGES["user_not_found"])
 
@@ -535,7 +535,7 @@ class AuthController(BaseController):
             raise ValueError("Vous ne pouvez pas supprimer votre propre compte")
 
         try:
-            user = self.db.query(User).filter(User.id == user_id).first()
+            user = self.db.get(User, user_id)
             if not user:
                 raise ValueError(AUTH_MESSAGES["user_not_found"])
 
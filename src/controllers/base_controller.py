@@ -32,6 +32,7 @@ Version: 1.0.0
 from typing import Optional
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
+from src.models.client import Client
 from src.models.user import User, Department
 from src.utils.auth_utils import PermissionChecker, AuthorizationError
 from src.utils.validators import DataValidator, ValidationError
@@ -92,6 +93,20 @@ class BaseController:
         self.permission_checker = PermissionChecker()
         self.validator = DataValidator()
 
+    def _entity_cache(self, name: str) -> dict:
+        """
+        Cache d'entités partagé par tous les contrôleurs de la même session.
+
+        Stocké dans ``session.info`` : une écriture faite par un contrôleur
+        (ex: création d'un événement) invalide aussi les entités mises en
+        cache par les autres (ex: le contrat et sa liste d'événements).
+        """
+        return self.db.info.setdefault('entity_cache', {}).setdefault(name, {})
+
+    def clear_entity_cache(self):
+        """Vider le cache d'entités de la session (après toute écriture)"""
+        self.db.info.pop('entity_cache', None)
+
     def set_current_user(self, user: User):
         """Définir l'utilisateur actuel pour les vérifications de permissions"""
         self.current_user = user
@@ -175,6 +190,9 @@ class BaseController:
         except SQLAlchemyError as e:
             self.db.rollback()
             raise Exception(f"Erreur lors de la sauvegarde: {e}")
+        finally:
+            # Toute écriture, réussie ou non, invalide les entités en cache
+            self.clear_entity_cache()
 
     def safe_rollback(self):
         """Effectuer un rollback sécurisé"""
@@ -182,6 +200,8 @@ class BaseController:
             self.db.rollback()
         except SQLAlchemyError:
             pass
+        finally:
+            self.clear_entity_cache()
 
     def has_permission(self, required_departments: list) -> bool:
         """Vérifier les permissions utilisateur"""
@@ -366,7 +386,6 @@ class BaseController:
         if resource_type == 'client' and self.current_user.is_commercial:
             return query.filter_by(commercial_contact_id=self.current_user.id)
         if resource_type == 'contract' and self.current_user.is_commercial:
-            from src.models.client import Client
             return query.join(Client).filter(
                 Client.commercial_contact_id == self.current_user.id
             )
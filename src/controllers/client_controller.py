@@ -37,6 +37,8 @@ Fichier: src/controllers/client_controller.py
 from typing import List, Optional
 from sqlalchemy.orm import Session, joinedload
 from src.models.client import Client
+from src.models.contract import Contract
+from src.models.event import Event
 from src.models.user import Department
 from src.utils.auth_utils import AuthorizationError
 from src.utils.validators import ValidationError
@@ -503,8 +505,6 @@ class ClientController(BaseController):
         # Appliquer le filtre par rôle utilisateur
         if self.current_user.is_support:
             # Support peut rechercher dans les clients avec des événements assignés
-            from src.models.contract import Contract
-            from src.models.event import Event
             query = query.join(Contract).join(Event).filter(
                 Event.support_contact_id == self.current_user.id
             )
@@ -523,8 +523,6 @@ class ClientController(BaseController):
 
         if self.current_user.is_support:
             # Support peut voir les clients avec des événements assignés
-            from src.models.contract import Contract
-            from src.models.event import Event
             return self.db.query(Contract).join(Event).filter(
                 Contract.client_id == client.id,
                 Event.support_contact_id == self.current_user.id
@@ -35,11 +35,16 @@ Date: 2024
 Version: 1.0
 """
 
-from typing import List, Optional
+import time
+import traceback
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime, timezone
+from sqlalchemy import distinct, func, select
 from sqlalchemy.orm import Session, joinedload
 from src.models.contract import Contract, ContractStatus
 from src.models.client import Client
+from src.models.event import Event
+from src.models.user import User
 from src.utils.auth_utils import AuthorizationError
 from src.utils.validators import ValidationError
 from src.services.logging_service import SentryLogger
@@ -73,6 +78,9 @@ class ContractController(BaseController):
         en cas d'erreur pour maintenir l'intégrité des données.
     """
 
+    # Durée de validité (secondes) d'un contrat mis en cache
+    CONTRACT_CACHE_TTL = 30
+
     def __init__(self, db_session: Session):
         """
         Initialise le contrôleur de contrats avec session base de données
@@ -93,6 +101,24 @@ class ContractController(BaseController):
         # Ajout du logger Sentry pour traçabilité spécifique aux contrats
         self.sentry_logger = SentryLogger()
 
+    @property
+    def _contract_cache(self) -> Dict[int, Tuple[Contract, float]]:
+        """Contrats déjà chargés : id -> (contrat, date d'expiration), vidé par safe_commit"""
+        return self._entity_cache('contract')
+
+    def clear_contract_cache(self, contract_id: Optional[int] = None):
+        """
+        Invalider le cache des contrats.
+
+        Args:
+            contract_id (int, optional): Contrat à invalider. Si None, vide
+                entièrement le cache (ex: fermeture de la session).
+        """
+        if contract_id is None:
+            self._contract_cache.clear()
+        else:
+            self._contract_cache.pop(contract_id, None)
+
     def create_contract(self, client_id: int, total_amount: float,
                         amount_due: float = None) -> Contract:
         """
@@ -296,7 +322,6 @@ class ContractController(BaseController):
                     self.sentry_logger.log_contract_signature(contract, self.current_user)
                 except Exception as e:
                     print(f"ERREUR lors du log: {e}")
-                    import traceback
                     traceback.print_exc()
 
             return contract
@@ -308,42 +333,117 @@ class ContractController(BaseController):
             self.db.rollback()
             raise Exception(f"Erreur lors de la mise à jour: {e}")
 
-    def get_all_contracts(self) -> List[Contract]:
+    def _role_filters(self) -> list:
         """
-        Récupérer tous les contrats du système (accès GESTION uniquement)
+        Prédicats SQL des contrats visibles par l'utilisateur courant.
 
-        Cette méthode permet aux gestionnaires d'accéder à la liste complète
-        de tous les contrats de l'entreprise pour supervision et reporting.
+        Règle d'accès unique des listes et de la recherche : la gestion voit
+        tout, un commercial ses contrats, un support les contrats ayant un
+        événement qui lui est assigné (EXISTS : pas de doublons à dédoublonner,
+        compter ou limiter). Même règle que _can_access_contract.
+        """
+        if self.current_user.is_commercial:
+            return [Contract.commercial_contact_id == self.current_user.id]
+        if self.current_user.is_support:
+            return [Contract.events.any(Event.support_contact_id == self.current_user.id)]
+        return []
 
-        Returns:
-            List[Contract]: Liste complète de tous les contrats avec relations
+    def _contract_table_select(self):
+        """
+        Construire le SELECT de projection utilisé pour le tableau des contrats.
 
-        Raises:
-            AuthorizationError: Si l'utilisateur n'est pas du département GESTION
+        Seules les colonnes affichées sont sélectionnées ; le résultat est
+        exécuté en Core : aucune instance Contract, Client ou User n'est
+        construite. Les noms sont tronqués au formatage par la vue.
+        """
+        return select(
+            Contract.id,
+            Client.full_name.label('client_name'),
+            Client.company_name,
+            Contract.total_amount,
+            Contract.amount_due,
+            Contract.status,
+            User.full_name.label('commercial_name')
+        ).join(
+            Client, Contract.client_id == Client.id
+        ).join(
+            User, Contract.commercial_contact_id == User.id
+        )
 
-        Permissions:
-        - GESTION: Accès complet à tous les contrats
-        - COMMERCIAL/SUPPORT: Accès refusé (doivent utiliser get_my_contracts)
+    def _fetch_table_rows(self, stmt) -> list:
+        """
+        Exécuter un SELECT de tableau filtré selon le rôle (voir _role_filters).
 
-        Relations incluses:
-        - Client associé au contrat
-        - Commercial responsable du contrat
+        Args:
+            stmt: SELECT issu de _contract_table_select()
+
+        Returns:
+            list: Lignes (id, client_name, company_name, total_amount,
+                amount_due, status, commercial_name) triées par id
+        """
+        stmt = stmt.where(*self._role_filters())
+        return self.db.execute(stmt.order_by(Contract.id)).all()
+
+    def get_contracts_for_table(self) -> list:
+        """
+        Récupérer tous les contrats sous forme de lignes prêtes pour l'affichage
+        (accès GESTION uniquement).
 
-        Usage:
-            Pour génération de rapports globaux et supervision managériale
+        Retourne des lignes projetées : id, client_name, company_name,
+        total_amount, amount_due, status, commercial_name.
+
+        Raises:
+            AuthorizationError: Si l'utilisateur n'est pas du département GESTION
         """
-        # Vérification permission de lecture générique
         self.require_read_access('contract')
 
-        # Restriction stricte : seule la GESTION a accès global
         if not self.current_user.is_gestion:
             raise AuthorizationError("Seule la gestion peut consulter tous les contrats")
 
-        # Récupération avec eager loading des relations importantes
-        return self.db.query(Contract).options(
-            joinedload(Contract.client),             # Client pour infos entreprise
-            joinedload(Contract.commercial_contact)  # Commercial pour suivi
-        ).all()
+        return self._fetch_table_rows(self._contract_table_select())
+
+    def get_my_contracts_for_table(self) -> list:
+        """
+        Récupérer les contrats du commercial connecté (lignes projetées).
+
+        Raises:
+            AuthorizationError: Si utilisateur non authentifié ou non-commercial
+        """
+        if not self.current_user:
+            raise AuthorizationError("Authentification requise")
+
+        if not self.current_user.is_commercial:
+            raise AuthorizationError("Seuls les commerciaux peuvent consulter leurs contrats")
+
+        return self._fetch_table_rows(self._contract_table_select())
+
+    def get_unsigned_contracts_for_table(self) -> list:
+        """
+        Récupérer les contrats non signés (DRAFT) visibles (lignes projetées).
+
+        Raises:
+            AuthorizationError: Si permission read_contract non accordée
+        """
+        if not self.permission_checker.has_permission(self.current_user, 'read_contract'):
+            raise AuthorizationError("Permission requise pour consulter les contrats")
+
+        return self._fetch_table_rows(
+            self._contract_table_select().where(Contract.status == ContractStatus.DRAFT)
+        )
+
+    def get_unpaid_contracts_for_table(self) -> list:
+        """
+        Récupérer les contrats avec un montant encore dû (lignes projetées).
+
+        Raises:
+            AuthorizationError: Si permission read_contract non accordée
+        """
+        if not self.permission_checker.has_permission(self.current_user, 'read_contract'):
+            raise AuthorizationError("Permission requise pour consulter les contrats")
+
+        return self._fetch_table_rows(
+            self._contract_table_select().where(Contract.amount_due > 0)
+        )
 
     def get_contract_by_id(self, contract_id: int) -> Optional[Contract]:
         """
@@ -378,60 +478,30 @@ class ContractController(BaseController):
         """
         self.require_read_access('contract')
 
-        contract = self.db.query(Contract).options(
-            joinedload(Contract.client),
-            joinedload(Contract.commercial_contact),
-            joinedload(Contract.events)
-        ).filter(Contract.id == contract_id).first()
+        # Réutilisation du contrat déjà chargé (ex: consultation puis mise à jour)
+        cached = self._contract_cache.get(contract_id)
+        if cached and cached[1] > time.monotonic():
+            contract = cached[0]
+        else:
+            # Les supports des événements sont joints dans la même requête :
+            # la fiche du contrat n'émet aucune requête par événement.
+            # populate_existing : la session n'expire pas ses objets au commit,
+            # sans cela le contrat déjà chargé garderait ses anciens événements
+            contract = self.db.query(Contract).options(
+                joinedload(Contract.client),
+                joinedload(Contract.commercial_contact),
+                joinedload(Contract.events).joinedload(Event.support_contact)
+            ).populate_existing().filter(Contract.id == contract_id).first()
+            if contract:
+                self._contract_cache[contract_id] = (
+                    contract, time.monotonic() + self.CONTRACT_CACHE_TTL
+                )
 
         if contract and not self._can_access_contract(contract):
             raise AuthorizationError("Accès refusé à ce contrat")
 
         return contract
 
-    def get_my_contracts(self) -> List[Contract]:
-        """
-        Récupérer les contrats assignés à l'utilisateur commercial connecté.
-
-        Cette méthode spécialisée permet aux commerciaux de consulter
-        uniquement les contrats dont ils sont responsables.
-
-        Restrictions d'accès:
-            - Réservé exclusivement au département COMMERCIAL
-            - Filtrage automatique par commercial_contact_id
-            - Authentification utilisateur obligatoire
-
-        Relations incluses:
-            - Client: Informations complètes de l'entreprise cliente
-            - Commercial: Données du responsable commercial (soi-même)
-            - Événements: Liste des événements liés aux contrats
-
-        Returns:
-            List[Contract]: Liste des contrats assignés au commercial connecté
-
-        Raises:
-            AuthorizationError: Si utilisateur non authentifié ou non-commercial
-
-        Usage typique:
-            Utilisé par l'interface commercial pour afficher le portefeuille
-            client et le suivi des affaires en cours.
-
-        Exemple:
-            >>> mes_contrats = controller.get_my_contracts()
-            >>> print(f"Je gère {len(mes_contrats)} contrats")
-        """
-        if not self.current_user:
-            raise AuthorizationError("Authentification requise")
-
-        if not self.current_user.is_commercial:
-            raise AuthorizationError("Seuls les commerciaux peuvent consulter leurs contrats")
-
-        return self.db.query(Contract).options(
-            joinedload(Contract.client),
-            joinedload(Contract.commercial_contact),
-            joinedload(Contract.events)
-        ).filter(Contract.commercial_contact_id == self.current_user.id).all()
-
     def sign_contract(self, contract_id: int) -> Contract:
         """
         Signer électroniquement un contrat (GESTION uniquement)
@@ -548,143 +618,7 @@ class ContractController(BaseController):
             self.db.rollback()
             raise Exception(f"Erreur lors de la suppression: {e}")
 
-    def get_contracts_by_status(self, status: ContractStatus) -> List[Contract]:
-        """
-        Récupérer tous les contrats ayant un statut spécifique.
-
-        Cette méthode de filtrage permet de récupérer les contrats selon
-        leur statut avec application automatique des permissions utilisateur.
-
-        Filtrage par statut disponible:
-            - DRAFT: Contrats en brouillon (non signés)
-            - SIGNED: Contrats signés et validés
-            - CANCELLED: Contrats annulés ou résiliés
-
-        Permissions par département:
-            - GESTION: Accès à tous les contrats du statut demandé
-            - COMMERCIAL: Contrats du statut filtré par leur responsabilité
-            - SUPPORT: Contrats du statut avec événements assignés
-
-        Relations chargées:
-            - Client associé pour informations entreprise
-            - Commercial responsable pour suivi et contact
-
-        Args:
-            status (ContractStatus): Statut des contrats à récupérer
-
-        Returns:
-            List[Contract]: Liste des contrats correspondant au statut et permissions
-
-        Raises:
-            AuthorizationError: Si utilisateur sans permission read_contract
-
-        Usage typique:
-            - Suivi des contrats en attente de signature
-            - Reporting des contrats validés
-            - Gestion des contrats annulés
-
-        Exemple:
-            >>> drafts = controller.get_contracts_by_status(ContractStatus.DRAFT)
-            >>> print(f"{len(drafts)} contrats en attente de signature")
-        """
-        if not self.permission_checker.has_permission(self.current_user, 'read_contract'):
-            raise AuthorizationError("Permission requise pour consulter les contrats")
-
-        query = self.db.query(Contract).options(
-            joinedload(Contract.client),
-            joinedload(Contract.commercial_contact)
-        ).filter(Contract.status == status)
-
-        # Filtre par role utilisateur
-        if self.current_user.is_commercial:
-            query = query.filter(Contract.commercial_contact_id == self.current_user.id)
-        elif self.current_user.is_support:
-            # Support peut voir les contrats avec des evenements assignes
-            from src.models.event import Event
-            query = query.join(Event).filter(Event.support_contact_id == self.current_user.id)
-
-        return query.all()
-
-    def get_unsigned_contracts(self) -> List[Contract]:
-        """
-        Récupérer tous les contrats non signés (statut DRAFT).
-
-        Méthode de convenance qui utilise get_contracts_by_status()
-        pour récupérer spécifiquement les contrats en attente de signature.
-
-        Cas d'usage principal:
-            - Vue managériale des contrats en attente
-            - Suivi commercial des affaires à finaliser
-            - Relances clients pour signature
-
-        Returns:
-            List[Contract]: Contrats avec statut DRAFT selon permissions utilisateur
-
-        Permissions:
-            Hérite des mêmes règles que get_contracts_by_status()
-
-        Exemple:
-            >>> unsigned = controller.get_unsigned_contracts()
-            >>> for contract in unsigned:
-            ...     print(f"Contrat {contract.id} - {contract.client.company_name}")
-        """
-        return self.get_contracts_by_status(ContractStatus.DRAFT)
-
-    def get_unpaid_contracts(self) -> List[Contract]:
-        """
-        Récupérer tous les contrats avec des montants encore dus.
-
-        Cette méthode spécialisée identifie les contrats nécessitant
-        un suivi de recouvrement ou de facturation.
-
-        Critère de sélection:
-            - amount_due > 0 (montant encore dû supérieur à zéro)
-            - Tous statuts confondus (DRAFT, SIGNED, CANCELLED)
-
-        Applications métier:
-            - Suivi commercial des paiements en attente
-            - Reporting financier des créances clients
-            - Relances de facturation et recouvrement
-            - Tableau de bord trésorerie
-
-        Permissions par département:
-            - GESTION: Tous les contrats impayés du système
-            - COMMERCIAL: Leurs contrats clients avec solde dû
-            - SUPPORT: Contrats impayés avec événements assignés
-
-        Relations incluses:
-            - Client: Pour coordonnées et relances
-            - Commercial: Pour suivi et responsabilité
-
-        Returns:
-            List[Contract]: Contrats avec montants dus selon permissions
-
-        Raises:
-            AuthorizationError: Si permission read_contract non accordée
-
-        Exemple:
-            >>> unpaid = controller.get_unpaid_contracts()
-            >>> total_due = sum(c.amount_due for c in unpaid)
-            >>> print(f"Créances totales: {total_due} EUR")
-        """
-        if not self.permission_checker.has_permission(self.current_user, 'read_contract'):
-            raise AuthorizationError("Permission requise pour consulter les contrats")
-
-        query = self.db.query(Contract).options(
-            joinedload(Contract.client),
-            joinedload(Contract.commercial_contact)
-        ).filter(Contract.amount_due > 0)
-
-        # Filtre par role utilisateur
-        if self.current_user.is_commercial:
-            query = query.filter(Contract.commercial_contact_id == self.current_user.id)
-        elif self.current_user.is_support:
-            from src.models.event import Event
-            query = query.join(Event).filter(Event.support_contact_id == self.current_user.id)
-
-        return query.all()
-
-    def search_contracts(self, **criteria) -> List[Contract]:
+    def search_contracts(self, limit: Optional[int] = None, **criteria) -> List[Contract]:
         """
         Rechercher des contrats selon des critères multiples et flexibles.
 
@@ -708,6 +642,7 @@ class ContractController(BaseController):
             - SUPPORT: Recherche dans contrats avec événements assignés
 
         Args:
+            limit (int, optional): Nombre maximal de contrats retournés
             **criteria: Critères de recherche sous forme de mots-clés
                 - client_name (str): Nom ou partie du nom client
                 - company_name (str): Nom ou partie du nom entreprise
@@ -733,23 +668,58 @@ class ContractController(BaseController):
             ...     status=ContractStatus.SIGNED
             ... )
         """
+        query = self._search_contracts_query(**criteria).options(
+            joinedload(Contract.client),
+            joinedload(Contract.commercial_contact)
+        ).order_by(Contract.id)
+
+        if limit is not None:
+            query = query.limit(limit)
+
+        return query.all()
+
+    def search_contracts_count(self, **criteria) -> int:
+        """
+        Compter les contrats correspondant aux critères sans les charger.
+
+        Émet un unique SELECT COUNT avec les mêmes filtres (critères et
+        permissions) que search_contracts().
+
+        Args:
+            **criteria: Mêmes critères que search_contracts()
+
+        Returns:
+            int: Nombre de contrats trouvés
+        """
+        return self._search_contracts_query(**criteria).with_entities(
+            func.count(distinct(Contract.id))
+        ).scalar()
+
+    def _search_contracts_query(self, **criteria):
+        """
+        Construire la requête filtrée commune à la recherche et au comptage.
+
+        Raises:
+            AuthorizationError: Si permission read_contract non accordée
+        """
         if not self.permission_checker.has_permission(self.current_user, 'read_contract'):
             raise AuthorizationError("Permission requise pour consulter les contrats")
 
-        query = self.db.query(Contract).options(
-            joinedload(Contract.client),
-            joinedload(Contract.commercial_contact)
-        )
+        query = self.db.query(Contract)
+
+        # Filtres client/entreprise : une seule jointure sur Client
+        if criteria.get('client_name') or criteria.get('company_name'):
+            query = query.join(Client, Contract.client_id == Client.id)
 
         # Filtre par client
         if 'client_name' in criteria and criteria['client_name']:
-            query = query.join(Client).filter(
+            query = query.filter(
                 Client.full_name.ilike(f"%{criteria['client_name']}%")
             )
 
         # Filtre par entreprise
         if 'company_name' in criteria and criteria['company_name']:
-            query = query.join(Client).filter(
+            query = query.filter(
                 Client.company_name.ilike(f"%{criteria['company_name']}%")
             )
 
@@ -758,13 +728,7 @@ class ContractController(BaseController):
             query = query.filter(Contract.status == criteria['status'])
 
         # Filtre par role utilisateur
-        if self.current_user.is_commercial:
-            query = query.filter(Contract.commercial_contact_id == self.current_user.id)
-        elif self.current_user.is_support:
-            from src.models.event import Event
-            query = query.join(Event).filter(Event.support_contact_id == self.current_user.id)
-
-        return query.all()
+        return query.filter(*self._role_filters())
 
     def _can_access_contract(self, contract: Contract) -> bool:
         """
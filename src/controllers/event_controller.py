@@ -36,9 +36,12 @@ Architecture:
 Fichier: src/controllers/event_controller.py
 """
 
-from typing import List, Optional
-from datetime import datetime, timedelta
-from sqlalchemy.orm import Session, joinedload
+import time
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional, Tuple
+from datetime import datetime
+from sqlalchemy import Row, bindparam, func, select
+from sqlalchemy.orm import Session, aliased, joinedload
 from src.models.event import Event
 from src.models.contract import Contract, ContractStatus
 from src.models.client import Client
@@ -48,6 +51,132 @@ from src.utils.validators import ValidationError
 from .base_controller import BaseController
 
 
+@dataclass
+class EventRow:
+    """
+    Ligne à plat d'un événement pour l'affichage en tableau.
+
+    Les lignes sont projetées par les requêtes Core du contrôleur (client
+    et support déjà joints) : l'affichage ne lit que des attributs simples.
+    __slots__ est déclaré à la main (dataclass(slots=True) exige Python 3.10,
+    le projet supporte 3.9).
+    """
+    __slots__ = ("id", "name", "client_name", "date", "location", "support_name")
+
+    id: int
+    name: str
+    client_name: str
+    date: str
+    location: str
+    support_name: str
+
+
+def _build_event_rows_select():
+    """
+    Requête Core des colonnes du tableau des événements (ordre des champs d'EventRow).
+
+    Les noms du client et du support sont lus directement dans leurs
+    tables : aucun objet Client/User n'est instancié. La date de début est
+    formatée en Python (voir _event_row) : la forme texte d'une date en
+    base dépend du SGBD et de sa configuration (DateStyle de PostgreSQL).
+    """
+    support = aliased(User)
+    return (
+        select(
+            Event.id,
+            Event.name,
+            Client.full_name,
+            Event.start_date,
+            Event.location,
+            func.coalesce(support.full_name, "Non assigné"),
+        )
+        .join(Contract, Event.contract_id == Contract.id)
+        .join(Client, Contract.client_id == Client.id)
+        .outerjoin(support, Event.support_contact_id == support.id)
+    )
+
+
+def _event_row(row) -> EventRow:
+    """Convertir une ligne de _EVENT_ROWS en EventRow (date au format 'AAAA-MM-JJ')"""
+    event_id, name, client_name, start_date, location, support_name = row
+    return EventRow(event_id, name, client_name, start_date.date().isoformat(),
+                    location, support_name)
+
+
+# Requêtes des tableaux construites une seule fois à l'import ; les filtres
+# de rôle y sont ajoutés à chaque appel, leurs valeurs restent des paramètres
+# liés et la forme compilée est réutilisée par le cache de SQLAlchemy
+_EVENT_ROWS = _build_event_rows_select()
+_ALL_ROWS = _EVENT_ROWS.order_by(Event.id)
+_UNASSIGNED_ROWS = _EVENT_ROWS.where(Event.support_contact_id.is_(None)).order_by(Event.id)
+
+
+def _build_event_detail_select():
+    """
+    Requête Core de la fiche d'un événement (:event_id), pour simple consultation.
+
+    Le résultat est une ligne nommée : ni Event ni objets liés ne sont
+    hydratés ni placés dans la session.
+    """
+    support = aliased(User)
+    commercial = aliased(User)
+    return (
+        select(
+            Event.id,
+            Event.name,
+            Event.location,
+            Event.attendees,
+            Event.start_date,
+            Event.end_date,
+            Event.notes,
+            Event.created_at,
+            Event.updated_at,
+            Event.contract_id,
+            Event.support_contact_id,
+            support.full_name.label('support_name'),
+            Contract.commercial_contact_id,
+            commercial.full_name.label('commercial_name'),
+            Client.full_name.label('client_name'),
+            Client.company_name,
+        )
+        .join(Contract, Event.contract_id == Contract.id)
+        .join(Client, Contract.client_id == Client.id)
+        .join(commercial, Contract.commercial_contact_id == commercial.id)
+        .outerjoin(support, Event.support_contact_id == support.id)
+        .where(Event.id == bindparam('event_id'))
+    )
+
+
+_EVENT_DETAIL = _build_event_detail_select()
+
+
+def _build_contract_summary_select():
+    """
+    Requête Core du résumé d'un contrat signé (:contract_id) avant création d'événement.
+
+    Une lecture par clé primaire, filtrée sur le statut SIGNED : un contrat
+    absent ou non signé ne renvoie aucune ligne. Ni le contrat ni ses
+    relations ne sont chargés comme objets ORM.
+    """
+    commercial = aliased(User)
+    return (
+        select(
+            Contract.id,
+            Contract.commercial_contact_id,
+            Client.full_name.label('client_name'),
+            Client.company_name,
+            commercial.full_name.label('commercial_name'),
+        )
+        .join(Client, Contract.client_id == Client.id)
+        .join(commercial, Contract.commercial_contact_id == commercial.id)
+        .where(Contract.id == bindparam('contract_id'),
+               Contract.status == ContractStatus.SIGNED)
+    )
+
+
+_CONTRACT_SUMMARY = _build_contract_summary_select()
+
+
 class EventController(BaseController):
     """
     Contrôleur spécialisé pour la gestion des événements avec workflow métier.
@@ -89,9 +218,30 @@ class EventController(BaseController):
         la finalité opérationnelle du processus commercial Epic Events.
     """
 
+    # Durée de validité (secondes) d'un événement mis en cache
+    EVENT_CACHE_TTL = 30
+
     def __init__(self, db_session: Session):
         super().__init__(db_session)
 
+    @property
+    def _event_cache(self) -> Dict[int, Tuple[Event, float]]:
+        """Événements déjà chargés : id -> (événement, date d'expiration), vidé par safe_commit"""
+        return self._entity_cache('event')
+
+    def clear_event_cache(self, event_id: Optional[int] = None):
+        """
+        Invalider le cache des événements.
+
+        Args:
+            event_id (int, optional): Événement à invalider. Si None, vide
+                entièrement le cache.
+        """
+        if event_id is None:
+            self._event_cache.clear()
+        else:
+            self._event_cache.pop(event_id, None)
+
     def create_event(self, contract_id: int, name: str, start_date: datetime,
                      end_date: datetime, location: str, attendees: int,
                      notes: str = None, support_contact_id: int = None) -> Event:
@@ -273,7 +423,10 @@ class EventController(BaseController):
                     setattr(event, key, value)
 
             self.safe_commit()
-            self.db.refresh(event)
+            # Rechargement limité aux attributs modifiés côté base (updated_at)
+            # et au support si son id a changé : le contrat et le client déjà
+            # chargés restent valides
+            self.db.refresh(event, self._refresh_attributes(update_data))
             return event
 
         except ValidationError:
@@ -283,6 +436,14 @@ class EventController(BaseController):
             self.db.rollback()
             raise Exception(f"Erreur lors de la mise à jour: {e}")
 
+    @staticmethod
+    def _refresh_attributes(update_data: dict) -> List[str]:
+        """Attributs à recharger après la mise à jour d'un événement"""
+        attributes = ['updated_at']
+        if 'support_contact_id' in update_data:
+            attributes.append('support_contact')
+        return attributes
+
     def assign_support_to_event(self, event_id: int, support_user_id: int) -> Event:
         """
         Assigner un collaborateur support à un événement spécifique.
@@ -350,175 +511,252 @@ class EventController(BaseController):
             raise ValueError("Événement non trouvé")
 
         # Vérifier que l'utilisateur est bien du support
-        support_user = self.db.query(User).filter(User.id == support_user_id).first()
+        support_user = self.db.get(User, support_user_id)
         if not support_user or not support_user.is_support:
             raise ValueError("L'utilisateur doit être du département SUPPORT")
 
         try:
             event.support_contact_id = support_user_id
-            self.db.commit()
-            self.db.refresh(event)
+            self.safe_commit()
+            self.db.refresh(event, self._refresh_attributes({'support_contact_id': support_user_id}))
             return event
         except Exception as e:
             self.db.rollback()
             raise Exception(f"Erreur lors de l'assignation: {e}")
 
-    def get_all_events(self) -> List[Event]:
-        """Recuperer tous les evenements avec verification des permissions"""
-        if not self.permission_checker.has_permission(self.current_user, 'read_event'):
-            raise AuthorizationError("Permission requise pour consulter les événements")
-
-        # Seule la gestion peut voir TOUS les evenements
-        if not self.current_user.is_gestion:
-            raise AuthorizationError("Seule la gestion peut consulter tous les événements")
+    def _query_with_relations(self):
+        """
+        Requête Event avec chargement anticipé des relations affichées.
 
+        Contrat (avec client et commercial) et support sont chargés dans la
+        même requête (JOIN) : la modification d'un événement puis l'affichage
+        de son résumé n'émettent aucune requête supplémentaire.
+        """
         return self.db.query(Event).options(
-            joinedload(Event.contract).joinedload(Contract.client),
-            joinedload(Event.contract).joinedload(Contract.commercial_contact),
+            joinedload(Event.contract).options(
+                joinedload(Contract.client),
+                joinedload(Contract.commercial_contact)
+            ),
             joinedload(Event.support_contact)
-        ).all()
+        )
 
-    def get_event_by_id(self, event_id: int) -> Optional[Event]:
-        """Recuperer un evenement par son ID avec verification d'acces"""
+    def _require_read_event(self):
+        """Vérifier la permission de consulter les événements"""
         if not self.permission_checker.has_permission(self.current_user, 'read_event'):
             raise AuthorizationError("Permission requise pour consulter les événements")
 
-        event = self.db.query(Event).options(
-            joinedload(Event.contract).joinedload(Contract.client),
-            joinedload(Event.contract).joinedload(Contract.commercial_contact),
-            joinedload(Event.support_contact)
-        ).filter(Event.id == event_id).first()
+    def _role_filters(self, unassigned: bool = False) -> list:
+        """
+        Prédicats SQL des événements visibles par l'utilisateur courant.
 
-        if event and not self._can_access_event(event):
-            raise AuthorizationError("Accès refusé à cet événement")
+        Règle d'accès unique des listes (la permission read_event est
+        vérifiée ici) : la gestion voit tout, un commercial les événements
+        de ses contrats, un support ceux qui lui sont assignés. Les
+        prédicats portent sur Event et Contract : la requête qui les
+        applique doit joindre le contrat (c'est le cas de _EVENT_ROWS).
 
-        return event
+        Args:
+            unassigned: Liste des événements sans support, qu'un support
+                        voit tous pour pouvoir les prendre en charge
+        """
+        self._require_read_event()
+
+        if self.current_user.is_gestion:
+            return []
+        if self.current_user.is_support:
+            return [] if unassigned else [Event.support_contact_id == self.current_user.id]
+        if self.current_user.is_commercial:
+            return [Contract.commercial_contact_id == self.current_user.id]
+        raise AuthorizationError("Rôle non autorisé")
+
+    def _can_access(self, support_contact_id: Optional[int],
+                    commercial_contact_id: int) -> bool:
+        """Même règle que _role_filters, appliquée à un événement déjà lu"""
+        if self.current_user.is_gestion:
+            return True
+        if self.current_user.is_support:
+            return support_contact_id == self.current_user.id
+        if self.current_user.is_commercial:
+            return commercial_contact_id == self.current_user.id
+        return False
+
+    def iter_all_event_rows(self, chunk: int = 200) -> Iterator[List[EventRow]]:
+        """
+        Parcourir tous les événements par lots de lignes à plat (gestion uniquement).
 
-    def get_my_events(self) -> List[Event]:
-        """Recuperer les evenements selon le role de l'utilisateur"""
+        Pagination par clé (id croissant) : chaque lot est une requête LIMIT
+        indépendante qui ne sélectionne que les colonnes affichées (sans
+        instancier d'objets ORM), la mémoire reste bornée à un lot. Les
+        permissions sont vérifiées dès l'appel.
+        """
+        self._require_read_event()
+
+        if not self.current_user.is_gestion:
+            raise AuthorizationError("Seule la gestion peut consulter tous les événements")
+
+        return self._iter_event_row_batches(chunk, _ALL_ROWS)
+
+    def iter_my_event_rows(self, chunk: int = 200) -> Iterator[List[EventRow]]:
+        """Lignes des evenements de l'utilisateur, par lots de chunk (pagination par cle)"""
         if not self.current_user:
             raise AuthorizationError("Authentification requise")
 
-        query = self.db.query(Event).options(
-            joinedload(Event.contract).joinedload(Contract.client),
-            joinedload(Event.contract).joinedload(Contract.commercial_contact),
-            joinedload(Event.support_contact)
+        return self._iter_event_row_batches(chunk, _ALL_ROWS.where(*self._role_filters()))
+
+    def iter_event_rows_without_support(self, chunk: int = 200) -> Iterator[List[EventRow]]:
+        """Lignes des evenements sans support, par lots de chunk (pagination par cle)"""
+        return self._iter_event_row_batches(
+            chunk, _UNASSIGNED_ROWS.where(*self._role_filters(unassigned=True))
         )
 
-        if self.current_user.is_support:
-            # Support voit uniquement les evenements qui lui sont assignes
-            query = query.filter(Event.support_contact_id == self.current_user.id)
-        elif self.current_user.is_commercial:
-            # Commercial voit les evenements des contrats de ses clients
-            query = query.join(Contract).filter(
-                Contract.commercial_contact_id == self.current_user.id
-            )
-        elif self.current_user.is_gestion:
-            # Gestion voit tous les evenements
-            pass
-        else:
-            raise AuthorizationError("Rôle non autorisé")
+    def get_upcoming_event_rows_range(self, start: datetime, end: datetime,
+                                      include_end: bool = False) -> List[EventRow]:
+        """
+        Lignes de tableau des evenements debutant dans l'intervalle [start, end[.
 
-        return query.all()
+        Utilisée pour parcourir une longue période par tranches successives
+        sans charger tous les événements en une fois ; les colonnes sont
+        projetées en SQL, sans parcours contrat -> client par ligne.
 
-    def get_upcoming_events(self, days_ahead: int = 30) -> List[Event]:
-        """Recuperer les evenements a venir selon les permissions"""
-        if not self.permission_checker.has_permission(self.current_user, 'read_event'):
-            raise AuthorizationError("Permission requise pour consulter les événements")
+        Args:
+            start: Début de l'intervalle (inclus)
+            end: Fin de l'intervalle (exclue sauf si include_end)
+            include_end: Inclure les événements débutant exactement à end
+        """
+        end_filter = Event.start_date <= end if include_end else Event.start_date < end
+        stmt = _EVENT_ROWS.where(Event.start_date >= start, end_filter, *self._role_filters())
+        return self._fetch_event_rows(stmt.order_by(Event.start_date))
 
-        end_date = datetime.now() + timedelta(days=days_ahead)
+    def iter_search_event_rows(self, chunk: int = 200, **criteria) -> Iterator[List[EventRow]]:
+        """
+        Parcourir les resultats d'une recherche par lots de lignes EventRow.
 
-        query = self.db.query(Event).options(
-            joinedload(Event.contract).joinedload(Contract.client),
-            joinedload(Event.contract).joinedload(Contract.commercial_contact),
-            joinedload(Event.support_contact)
-        ).filter(
-            Event.start_date >= datetime.now(),
-            Event.start_date <= end_date
-        )
+        Les criteres (name, location, client_name, start_date) et le filtre
+        de role sont appliques a la requete Core _EVENT_ROWS (qui joint deja
+        contrat et client), sans instancier d'objets ORM ; les lignes sont
+        lues au fil de l'eau (yield_per).
+        """
+        stmt = _EVENT_ROWS.where(*self._search_filters(**criteria)).order_by(Event.id)
+        result = self.db.execute(stmt, execution_options={'yield_per': chunk})
+        return self._iter_result_rows(result)
 
-        # Filtre par role utilisateur
-        if self.current_user.is_support:
-            query = query.filter(Event.support_contact_id == self.current_user.id)
-        elif self.current_user.is_commercial:
-            query = query.join(Contract).filter(
-                Contract.commercial_contact_id == self.current_user.id
-            )
-        elif not self.current_user.is_gestion:
-            raise AuthorizationError("Rôle non autorisé")
+    def _fetch_event_rows(self, stmt, params: Optional[dict] = None) -> List[EventRow]:
+        """Exécuter une requête de tableau (voir _EVENT_ROWS) en lignes EventRow"""
+        return [_event_row(row) for row in self.db.execute(stmt, params)]
 
-        return query.order_by(Event.start_date).all()
+    def _iter_event_row_batches(self, chunk: int, stmt) -> Iterator[List[EventRow]]:
+        """
+        Générateur de lots de lignes EventRow triés par id (pagination par clé).
 
-    def get_events_without_support(self) -> List[Event]:
-        """Recuperer les evenements sans support assigne"""
-        if not self.permission_checker.has_permission(self.current_user, 'read_event'):
-            raise AuthorizationError("Permission requise pour consulter les événements")
+        stmt est l'une des requêtes de tableau triées par Event.id (_ALL_ROWS,
+        _UNASSIGNED_ROWS, avec leurs filtres) ; chaque lot ne lit que chunk lignes.
+        """
+        stmt = stmt.where(Event.id > bindparam('last_id')).limit(chunk)
+        last_id = 0
+        while True:
+            batch = self._fetch_event_rows(stmt, {'last_id': last_id})
+            if batch:
+                yield batch
+            if len(batch) < chunk:
+                return
+            last_id = batch[-1].id
+
+    @staticmethod
+    def _iter_result_rows(result) -> Iterator[List[EventRow]]:
+        """
+        Lots EventRow d'un résultat lu au fil de l'eau (yield_per).
 
-        query = self.db.query(Event).options(
-            joinedload(Event.contract).joinedload(Contract.client),
-            joinedload(Event.contract).joinedload(Contract.commercial_contact)
-        ).filter(Event.support_contact_id.is_(None))
+        Le curseur est fermé dès la fin du parcours, y compris s'il est
+        interrompu (fermeture du générateur) avant la dernière ligne.
+        """
+        try:
+            for part in result.partitions():
+                yield [_event_row(row) for row in part]
+        finally:
+            result.close()
 
-        # Filtre par role utilisateur
-        if self.current_user.is_commercial:
-            query = query.join(Contract).filter(
-                Contract.commercial_contact_id == self.current_user.id
-            )
-        elif self.current_user.is_support:
-            # Support peut voir tous les evenements non assignes
-            pass
-        elif not self.current_user.is_gestion:
-            raise AuthorizationError("Rôle non autorisé")
+    def _search_filters(self, **criteria) -> list:
+        """
+        Predicats SQL d'une recherche d'evenements (criteres et filtre de role).
 
-        return query.all()
+        Les predicats portent sur Event, Contract et Client : la requete qui
+        les applique doit joindre contrat et client (c'est le cas de _EVENT_ROWS).
+        """
+        filters = self._role_filters()
 
-    def search_events(self, **criteria) -> List[Event]:
-        """Rechercher des evenements selon des criteres et permissions"""
-        if not self.permission_checker.has_permission(self.current_user, 'read_event'):
-            raise AuthorizationError("Permission requise pour consulter les événements")
+        # Tous les critères deviennent des prédicats SQL appliqués en une fois
+        # (le motif est passé à lower() en SQL comme la colonne : SQLite ne
+        # replie que l'ASCII, des deux côtés ; un LIKE '%...%' n'utilise pas d'index)
+        if criteria.get('name'):
+            filters.append(func.lower(Event.name).like(func.lower(f"%{criteria['name']}%")))
 
-        query = self.db.query(Event).options(
-            joinedload(Event.contract).joinedload(Contract.client),
-            joinedload(Event.contract).joinedload(Contract.commercial_contact),
-            joinedload(Event.support_contact)
-        )
+        if criteria.get('location'):
+            filters.append(func.lower(Event.location).like(func.lower(f"%{criteria['location']}%")))
 
-        # Filtres de recherche
-        if 'name' in criteria and criteria['name']:
-            query = query.filter(Event.name.ilike(f"%{criteria['name']}%"))
+        if criteria.get('start_date'):
+            filters.append(Event.start_date >= criteria['start_date'])
 
-        if 'location' in criteria and criteria['location']:
-            query = query.filter(Event.location.ilike(f"%{criteria['location']}%"))
+        if criteria.get('client_name'):
+            filters.append(func.lower(Client.full_name).like(func.lower(f"%{criteria['client_name']}%")))
 
-        if 'client_name' in criteria and criteria['client_name']:
-            query = query.join(Contract).join(Client).filter(
-                Client.full_name.ilike(f"%{criteria['client_name']}%")
-            )
+        return filters
 
-        if 'start_date' in criteria and criteria['start_date']:
-            query = query.filter(Event.start_date >= criteria['start_date'])
+    def get_event_by_id(self, event_id: int) -> Optional[Event]:
+        """Recuperer un evenement par son ID avec verification d'acces"""
+        self._require_read_event()
 
-        # Filtre par role utilisateur
-        if self.current_user.is_support:
-            query = query.filter(Event.support_contact_id == self.current_user.id)
-        elif self.current_user.is_commercial:
-            query = query.join(Contract).filter(
-                Contract.commercial_contact_id == self.current_user.id
-            )
-        elif not self.current_user.is_gestion:
-            raise AuthorizationError("Rôle non autorisé")
+        # Réutilisation de l'événement déjà chargé (ex: consultation puis mise à jour)
+        cached = self._event_cache.get(event_id)
+        if cached and cached[1] > time.monotonic():
+            event = cached[0]
+        else:
+            # populate_existing : la session n'expire pas ses objets au commit,
+            # l'événement déjà chargé est relu avec son contrat à jour
+            event = self._query_with_relations().populate_existing().filter(
+                Event.id == event_id
+            ).first()
+            if event:
+                self._event_cache[event_id] = (
+                    event, time.monotonic() + self.EVENT_CACHE_TTL
+                )
 
-        return query.all()
+        # Contrôle d'accès à chaque appel, même depuis le cache
+        if event and not self._can_access(event.support_contact_id,
+                                          event.contract.commercial_contact_id):
+            raise AuthorizationError("Accès refusé à cet événement")
 
-    def _can_access_event(self, event: Event) -> bool:
-        """Verifier si l'utilisateur peut acceder a cet evenement"""
-        if self.current_user.is_gestion:
-            return True
+        return event
 
-        if self.current_user.is_support:
-            return event.support_contact_id == self.current_user.id
+    def get_event_by_id_flat(self, event_id: int) -> Optional[Row]:
+        """
+        Recuperer la fiche d'un evenement en lecture seule (ligne nommee).
 
-        if self.current_user.is_commercial:
-            return event.contract.commercial_contact_id == self.current_user.id
+        Variante de get_event_by_id pour l'affichage : une seule requête Core,
+        sans objet ORM. Les modifications passent par get_event_by_id.
+        """
+        self._require_read_event()
 
-        return False
+        row = self.db.execute(_EVENT_DETAIL, {'event_id': event_id}).one_or_none()
+        if row and not self._can_access(row.support_contact_id, row.commercial_contact_id):
+            raise AuthorizationError("Accès refusé à cet événement")
+
+        return row
+
+    def get_signed_contract_summary(self, contract_id: int) -> Optional[Row]:
+        """
+        Recuperer le resume du contrat signe cible d'une creation d'evenement.
+
+        Les permissions de creation sont verifiees avant toute saisie, avec la
+        meme regle d'acces que ContractController.get_contract_by_id (un
+        commercial ne voit que ses contrats). None si le contrat est absent
+        ou non signe (filtre applique par la base).
+        """
+        if not self.permission_checker.has_permission(self.current_user, 'create_event'):
+            raise AuthorizationError("Permission requise pour créer des événements")
+
+        row = self.db.execute(_CONTRACT_SUMMARY, {'contract_id': contract_id}).one_or_none()
+        if (row and self.current_user.is_commercial
+                and row.commercial_contact_id != self.current_user.id):
+            raise AuthorizationError("Accès refusé à ce contrat")
+
+        return row
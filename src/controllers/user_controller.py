@@ -27,13 +27,14 @@ Architecture:
 Fichier: src/controllers/user_controller.py
 """
 
-from typing import List, Optional
+from typing import Iterator, List, Optional, Union
+from sqlalchemy import Row, func
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 from src.models.user import User, Department
 from src.utils.auth_utils import (AuthorizationError,
                                   generate_employee_number, validate_password_strength)
-from src.utils.validators import ValidationError
+from src.utils.validators import EMPLOYEE_NUMBER_PATTERN, ValidationError
 from src.services.logging_service import SentryLogger
 from .base_controller import BaseController
 
@@ -71,6 +72,9 @@ class UserController(BaseController):
         sauf la consultation de ses propres données par l'utilisateur.
     """
 
+    # Colonnes affichées dans les tableaux d'utilisateurs (listes et recherches)
+    TABLE_COLUMNS = (User.id, User.full_name, User.email, User.department, User.employee_number)
+
     def __init__(self, db_session: Session):
         super().__init__(db_session)
         self.sentry_logger = SentryLogger()
@@ -139,22 +143,50 @@ class UserController(BaseController):
         query = self.db.query(User)
 
         if department:
-            try:
-                dept_enum = Department(department.lower())
-                query = query.filter(User.department == dept_enum)
-            except ValueError:
-                raise ValidationError(f"Département invalide: {department}")
+            query = query.filter(User.department == self.to_department(department))
 
         return query.all()
 
+    def iter_users(self, department: str = None, chunk: int = 200,
+                   offset: int = 0, limit: Optional[int] = None) -> Iterator[Row]:
+        """
+        Parcourir les utilisateurs au fil de la lecture (gestion uniquement).
+
+        Variante de get_all_users pour l'affichage en tableau : seules les
+        colonnes affichées (TABLE_COLUMNS) sont lues, en lignes sans instance
+        User, par paquets de chunk (yield_per). offset/limit restreignent la
+        lecture à une page (ordre des ids). Les permissions sont vérifiées
+        dès l'appel.
+        """
+        query = self._users_query(department).with_entities(*self.TABLE_COLUMNS)
+        query = query.order_by(User.id).offset(offset)
+        if limit is not None:
+            query = query.limit(limit)
+        return iter(query.yield_per(chunk))
+
+    def count_users(self, department: str = None) -> int:
+        """Compter les utilisateurs (mêmes filtres qu'iter_users), sans les charger"""
+        return self._users_query(department).with_entities(func.count(User.id)).scalar()
+
+    def _users_query(self, department: str = None):
+        """Requête des utilisateurs, filtrée par département, après contrôle des permissions"""
+        if not self.permission_checker.has_permission(self.current_user, 'read_user'):
+            raise AuthorizationError("Permission 'read_user' requise")
+
+        query = self.db.query(User)
+        if department:
+            query = query.filter(User.department == self.to_department(department))
+        return query
+
     def get_user_by_id(self, user_id: int) -> Optional[User]:
         """Récupérer un utilisateur par ID (gestion uniquement)"""
         if not self.permission_checker.has_permission(self.current_user, 'read_user'):
             raise AuthorizationError("Permission 'read_user' requise")
 
-        return self.db.query(User).filter(User.id == user_id).first()
+        return self.db.get(User, user_id)
 
-    def create_user(self, email: str, password: str, full_name: str, department: str) -> User:
+    def create_user(self, email: str, password: str, full_name: str,
+                    department: Union[Department, str]) -> User:
         """
         Créer un nouveau compte utilisateur collaborateur avec validation complète.
 
@@ -184,7 +216,8 @@ class UserController(BaseController):
             email (str): Adresse email professionnelle unique
             password (str): Mot de passe initial (sera haché)
             full_name (str): Nom complet collaborateur
-            department (str): Département d'affectation ('commercial'/'support'/'gestion')
+            department (Department | str): Département d'affectation (enum ou
+                'commercial'/'support'/'gestion')
 
         Returns:
             User: Nouveau collaborateur créé avec credentials sécurisés
@@ -406,7 +439,7 @@ class UserController(BaseController):
                 "une majuscule, une minuscule, un chiffre et un caractère spécial"
             )
 
-        user = self.db.query(User).filter(User.id == user_id).first()
+        user = self.db.get(User, user_id)
         if not user:
             raise ValidationError("Utilisateur non trouvé")
 
@@ -419,29 +452,48 @@ class UserController(BaseController):
             self.db.rollback()
             raise Exception(f"Erreur lors du changement de mot de passe: {e}")
 
-    def search_users(self, **criteria) -> List[User]:
-        """Rechercher des utilisateurs par critères (gestion uniquement)"""
+    def search_users(self, **criteria) -> List[Row]:
+        """
+        Rechercher des utilisateurs par critères (gestion uniquement).
+
+        Tous les critères sont des prédicats SQL (lower(...) appliqué en SQL
+        au motif comme à la colonne, pour un même repli de casse) et le
+        résultat est une projection des colonnes du tableau
+        (TABLE_COLUMNS) : aucune instance User n'est construite et le mot de
+        passe haché n'est jamais lu.
+        """
         if not self.permission_checker.has_permission(self.current_user, 'read_user'):
             raise AuthorizationError("Permission 'read_user' requise")
 
-        query = self.db.query(User)
+        query = self.db.query(*self.TABLE_COLUMNS)
 
-        if 'full_name' in criteria and criteria['full_name']:
-            query = query.filter(User.full_name.ilike(f"%{criteria['full_name']}%"))
+        filters = []
+        if criteria.get('full_name'):
+            filters.append(func.lower(User.full_name).like(func.lower(f"%{criteria['full_name']}%")))
 
-        if 'email' in criteria and criteria['email']:
-            query = query.filter(User.email.ilike(f"%{criteria['email']}%"))
+        if criteria.get('email'):
+            # Partie de l'email : une adresse bien formée peut aussi n'être qu'un préfixe
+            filters.append(func.lower(User.email).like(func.lower(f"%{criteria['email'].strip()}%")))
 
-        if 'department' in criteria and criteria['department']:
-            try:
-                dept_enum = Department(criteria['department'].lower())
-                query = query.filter(User.department == dept_enum)
-            except ValueError:
-                raise ValidationError(f"Département invalide: {criteria['department']}")
+        if criteria.get('department'):
+            filters.append(User.department == self.to_department(criteria['department']))
 
-        if 'employee_number' in criteria and criteria['employee_number']:
-            query = query.filter(
-                User.employee_number.ilike(f"%{criteria['employee_number']}%")
-            )
+        if criteria.get('employee_number'):
+            employee_number = criteria['employee_number'].strip().upper()
+            if EMPLOYEE_NUMBER_PATTERN.match(employee_number):
+                # Numéro complet : égalité sur l'index unique plutôt qu'un LIKE '%...%'
+                filters.append(User.employee_number == employee_number)
+            else:
+                filters.append(User.employee_number.ilike(f"%{employee_number}%"))
 
-        return query.all()
+        return query.filter(*filters).all()
+
+    @staticmethod
+    def to_department(department) -> Department:
+        """Convertir un département (enum ou nom) en Department, ValidationError sinon"""
+        if isinstance(department, Department):
+            return department
+        try:
+            return Department(department.lower())
+        except ValueError:
+            raise ValidationError(f"Département invalide: {department}")
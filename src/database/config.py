@@ -52,6 +52,10 @@ load_dotenv()
 # Défaut: SQLite local pour développement rapide sans installation
 DATABASE_URL = os.getenv('DATABASE_URL', 'sqlite:///./epic_events.db')
 
+# Taille du cache de compilation SQL de SQLAlchemy (requêtes compilées
+# réutilisées d'un appel à l'autre ; défaut SQLAlchemy : 500)
+QUERY_CACHE_SIZE = int(os.getenv('QUERY_CACHE_SIZE', '1200'))
+
 # DSN Sentry pour monitoring des erreurs en production
 # Permet le suivi automatique des exceptions et performances
 SENTRY_DSN = os.getenv('SENTRY_DSN')
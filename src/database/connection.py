@@ -8,6 +8,7 @@ et fournit la classe de base pour tous les modèles de données.
 Architecture SQLAlchemy:
     1. Engine: Moteur de base de données avec pool de connexions
     2. SessionLocal: Factory pour créer des sessions isolées
+       (ViewSession: session partagée par les vues CLI)
     3. Base: Classe parente pour tous les modèles ORM
     4. get_db(): Générateur de sessions avec gestion automatique du cycle de vie
 
@@ -49,19 +50,28 @@ Performance:
 
 Fichier: src/database/connection.py
 """
+import atexit
 from sqlalchemy import create_engine
-from sqlalchemy.orm import declarative_base, sessionmaker
-from .config import DATABASE_URL
+from sqlalchemy.orm import declarative_base, scoped_session, sessionmaker
+from .config import DATABASE_URL, QUERY_CACHE_SIZE
 
 # Création du moteur SQLAlchemy avec pool de connexions optimisé
 # echo=False désactive le logging SQL (activation possible pour debug)
-engine = create_engine(DATABASE_URL, echo=False)
+# query_cache_size: nombre de requêtes compilées conservées en cache
+engine = create_engine(DATABASE_URL, echo=False, query_cache_size=QUERY_CACHE_SIZE)
 
 # Factory de sessions configurée pour isolation transactionnelle
 # autocommit=False: Contrôle explicite des transactions
 # autoflush=False: Optimisation des performances, flush manuel si nécessaire
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Session partagée par les vues CLI : une seule session par processus (par
+# thread), réutilisée d'une vue et d'une commande à l'autre et fermée à la
+# sortie du programme. expire_on_commit=False: les objets déjà chargés
+# restent utilisables après un commit sans rechargement.
+ViewSession = scoped_session(sessionmaker(bind=engine, expire_on_commit=False))
+atexit.register(ViewSession.remove)
+
 # Classe de base pour tous les modèles ORM
 # Fournit les métadonnées et fonctionnalités communes à toutes les entités
 Base = declarative_base()
@@ -29,7 +29,7 @@ Relations critiques:
 
 Fichier: src/models/contract.py
 """
-from sqlalchemy import Column, Integer, DateTime, Numeric, Boolean, ForeignKey, Enum
+from sqlalchemy import Column, Integer, DateTime, Numeric, Boolean, ForeignKey, Enum, Index, text
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from src.database.connection import Base
@@ -118,6 +118,14 @@ class Contract(Base):
         events: Liste des événements générés par ce contrat
     """
     __tablename__ = "contracts"
+    __table_args__ = (
+        # Listes "non signés" : filtre sur le statut puis sur le commercial
+        Index('ix_contracts_status_commercial', 'status', 'commercial_contact_id'),
+        # Listes "impayés" : index partiel limité aux contrats avec solde dû
+        Index('ix_contracts_amount_due', 'amount_due',
+              sqlite_where=text('amount_due > 0'),
+              postgresql_where=text('amount_due > 0')),
+    )
 
     # Identifiant unique du contrat
     id = Column(Integer, primary_key=True, index=True)
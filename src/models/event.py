@@ -31,7 +31,7 @@ Relations transversales:
 
 Fichier: src/models/event.py
 """
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, Index, text
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from src.database.connection import Base
@@ -93,6 +93,15 @@ class Event(Base):
         commercial_contact: Commercial responsable (accessible via contract.commercial_contact)
     """
     __tablename__ = "events"
+    __table_args__ = (
+        # Recherches et listes "à venir" filtrées/triées par date de début
+        Index('ix_events_start_date', 'start_date'),
+        # Événements d'un support sur une période : index partiel limité aux
+        # événements assignés (les non assignés n'y sont jamais recherchés)
+        Index('ix_events_support_start_date', 'support_contact_id', 'start_date',
+              sqlite_where=text('support_contact_id IS NOT NULL'),
+              postgresql_where=text('support_contact_id IS NOT NULL')),
+    )
 
     # Identifiant unique de l'événement
     id = Column(Integer, primary_key=True, index=True)
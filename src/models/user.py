@@ -72,6 +72,14 @@ class Department(enum.Enum):
     SUPPORT = "support"
     GESTION = "gestion"
 
+    @property
+    def display(self) -> str:
+        """Libellé affiché du département (valeur en majuscules, précalculée)"""
+        return _DEPARTMENT_LABELS[self]
+
+
+_DEPARTMENT_LABELS = {department: department.value.upper() for department in Department}
+
 
 class User(Base):
     """
@@ -33,7 +33,9 @@ Sécurité implémentée:
 
 Fichier: src/services/auth_service.py
 """
-from typing import Optional, Dict, Any
+import hashlib
+import time
+from typing import Optional, Dict, Any, Tuple
 from sqlalchemy.orm import Session
 from src.models.user import User
 from src.utils.hash_utils import verify_password
@@ -91,6 +93,8 @@ class AuthenticationService:
         self.jwt_manager = JWTManager()
         self.permission_checker = PermissionChecker()
         self.sentry_logger = SentryLogger()
+        # Dernier token vérifié : (empreinte SHA-256, utilisateur, échéance monotone)
+        self._verified_user: Optional[Tuple[bytes, User, float]] = None
 
     def login(self, email: str, password: str) -> Optional[User]:
         """
@@ -145,6 +149,7 @@ class AuthenticationService:
             )
 
             # Sauvegarde du token pour validation des requêtes futures
+            self._verified_user = None
             if self.jwt_manager.save_token(token):
                 # Logging du succès et initialisation contexte monitoring
                 self.sentry_logger.log_authentication_attempt(email, True)
@@ -180,6 +185,7 @@ class AuthenticationService:
             Cette méthode ne lève pas d'exception même si l'utilisateur
             n'était pas connecté, permettant une déconnexion "safe".
         """
+        self._verified_user = None
         try:
             # Nettoyage du contexte utilisateur Sentry pour arrêter le tracking
             self.sentry_logger.clear_user_context()
@@ -203,17 +209,35 @@ class AuthenticationService:
             User: Instance de l'utilisateur connecté, None si non connecté
 
         Performance:
-            - Utilise le cache JWT pour éviter les requêtes répétées
-            - Requête base de données uniquement si token valide
-            - Gestion optimisée des sessions expirées
+            - Le token stocké est relu à chaque appel (une déconnexion depuis
+              un autre terminal est donc prise en compte)
+            - Tant qu'il est identique et non expiré, l'utilisateur mémorisé
+              est retourné sans nouveau décodage JWT ni requête
+            - Seule l'empreinte SHA-256 du token est conservée en mémoire
         """
+        token = self.jwt_manager.load_token()
+        if not token:
+            return None
+
+        digest = hashlib.sha256(token.encode()).digest()
+        cached = self._verified_user
+        if cached and cached[0] == digest and time.monotonic() < cached[2]:
+            return cached[1]
+
         # Extraction des données depuis le token JWT
-        user_data = self.jwt_manager.get_current_user_data()
+        user_data = self.jwt_manager.verify_token(token)
         if not user_data:
+            # Token expiré ou invalide - nettoyage automatique
+            self._verified_user = None
+            self.jwt_manager.clear_token()
             return None
 
         # Récupération de l'instance utilisateur complète depuis la base
-        user = self.db.query(User).filter(User.id == user_data['user_id']).first()
+        user = self.db.get(User, user_data['user_id'])
+        if user is not None:
+            # Échéance du token (exp) convertie en horloge monotone
+            expires = time.monotonic() + user_data['exp'] - time.time()
+            self._verified_user = (digest, user, expires)
         return user
 
     def is_authenticated(self) -> bool:
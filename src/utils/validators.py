@@ -54,6 +54,12 @@ from src.models.contract import ContractStatus
 from decimal import Decimal
 from src.config.messages import VALIDATION_MESSAGES
 
+# Formats compilés une seule fois au chargement du module
+EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+PHONE_PATTERN = re.compile(r'^(0[1-9](\.[0-9]{2}){4}|0[1-9][0-9]{8})$')
+# Format Epic Events : EE + 6 chiffres
+EMPLOYEE_NUMBER_PATTERN = re.compile(r'^EE[0-9]{6}$')
+
 
 class ValidationError(Exception):
     """
@@ -137,9 +143,7 @@ class DataValidator:
         email = email.strip().lower()
 
         # Validation du format RFC avec regex robuste
-        email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-
-        if not re.match(email_pattern, email):
+        if not EMAIL_PATTERN.match(email):
             raise ValidationError(VALIDATION_MESSAGES["email_invalid_format"])
 
         # Protection contre emails trop longs (attaque DoS)
@@ -181,9 +185,7 @@ class DataValidator:
 
         phone = phone.strip()
         # Format français : 01.23.45.67.89 ou 0123456789
-        phone_pattern = r'^(0[1-9](\.[0-9]{2}){4}|0[1-9][0-9]{8})$'
-
-        if not re.match(phone_pattern, phone):
+        if not PHONE_PATTERN.match(phone):
             raise ValidationError(VALIDATION_MESSAGES["phone_invalid_format"])
 
         return phone
@@ -223,9 +225,7 @@ class DataValidator:
         employee_number = employee_number.strip().upper()
 
         # Format Epic Events : EE + 6 chiffres
-        pattern = r'^EE[0-9]{6}$'
-
-        if not re.match(pattern, employee_number):
+        if not EMPLOYEE_NUMBER_PATTERN.match(employee_number):
             raise ValidationError(VALIDATION_MESSAGES["employee_number_invalid_format"])
 
         return employee_number
@@ -324,15 +324,16 @@ class DataValidator:
         return company_name
 
     @staticmethod
-    def validate_department(department: str) -> Department:
+    def validate_department(department) -> Department:
         """
         Valider et convertir un département en enum.
 
         Cette méthode vérifie que le département fourni correspond à l'un
         des départements autorisés dans Epic Events et le convertit en enum.
+        Un Department (choix des menus de la vue) est retourné tel quel.
 
         Args:
-            department: Nom du département à valider
+            department: Department ou nom du département à valider
 
         Returns:
             Department: Enum du département validé
@@ -350,6 +351,9 @@ class DataValidator:
             - Protection contre injection de valeurs arbitraires
             - Contrôle d'accès basé sur département validé
         """
+        if isinstance(department, Department):
+            return department
+
         if not department:
             raise ValidationError(VALIDATION_MESSAGES["department_required"])
 
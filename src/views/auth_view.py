@@ -175,7 +175,7 @@ class AuthView(BaseView):
                 welcome_content = f"""
 [bold green]Bienvenue {user.full_name} ![/bold green]
 
-[cyan]Département:[/cyan] {user.department.value.upper()}
+[cyan]Département:[/cyan] {user.department.display}
 [cyan]Numéro employé:[/cyan] {user.employee_number}
 [cyan]Email:[/cyan] {user.email}
                 """
@@ -209,7 +209,7 @@ class AuthView(BaseView):
                     table.add_row("Statut", "[bold green]CONNECTÉ[/bold green]")
                     table.add_row("Utilisateur", current_user.full_name)
                     table.add_row("Email", current_user.email)
-                    table.add_row("Département", current_user.department.value.upper())
+                    table.add_row("Département", current_user.department.display)
                     table.add_row("Numéro employé", current_user.employee_number)
 
                     exp_timestamp = user_data.get('exp')
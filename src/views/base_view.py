@@ -28,9 +28,9 @@ Composants Rich utilisés:
     - Progress: Barres de progression pour opérations longues
 
 Gestion des ressources:
-    - Sessions SQLAlchemy: Création et fermeture automatique
+    - Sessions SQLAlchemy: Session unique par processus (ViewSession)
     - Connexions base: Pool de connexions via engine partagé
-    - Mémoire: Nettoyage automatique via __del__
+    - Mémoire: Fermeture de la session à la sortie du programme (atexit)
     - Contrôleurs: Configuration centralisée avec utilisateur courant
 
 Patterns d'affichage:
@@ -48,6 +48,7 @@ Sécurité et robustesse:
 Fichier: src/views/base_view.py
 """
 
+from functools import cached_property, wraps
 from typing import Dict, Optional
 from rich.console import Console
 from rich.table import Table
@@ -56,12 +57,57 @@ from rich.text import Text
 from rich.prompt import Prompt, Confirm
 from rich import box
 from rich.progress import Progress, SpinnerColumn, TextColumn
-from sqlalchemy.orm import sessionmaker
-from src.database.connection import engine
+from src.database.connection import ViewSession
 from src.services.auth_service import AuthenticationService
+from src.utils.auth_utils import AuthenticationError, AuthorizationError
+from src.utils.validators import ValidationError
 from src.config.messages import VALIDATION_MESSAGES, PROMPTS, GENERAL_MESSAGES
 
 
+# Erreurs attendues des commandes et clé VALIDATION_MESSAGES affichée pour chacune
+# (le message propre à la commande prime pour les erreurs de validation)
+VIEW_ERROR_MESSAGES = {
+    ValidationError: "validation_failed",
+    AuthenticationError: "authorization_error",
+    AuthorizationError: "authorization_error",
+}
+_VIEW_ERRORS = tuple(VIEW_ERROR_MESSAGES)
+
+
+def view_command(error_message: Optional[str] = None):
+    """
+    Décorateur des commandes de vue : authentification et affichage des erreurs.
+
+    L'utilisateur est authentifié (voir require_user) et transmis aux contrôleurs
+    avant d'exécuter la commande ; les erreurs d'accès sont affichées avec le
+    message de VIEW_ERROR_MESSAGES, les erreurs de validation et inattendues
+    avec error_message, au lieu d'être propagées.
+
+    Args:
+        error_message: Message propre à la commande ('{error}' reçoit
+                       l'exception) ; à défaut, VIEW_ERROR_MESSAGES pour les
+                       erreurs de validation, VALIDATION_MESSAGES["general_error"] sinon
+    """
+    def decorator(method):
+        @wraps(method)
+        def wrapper(self, *args, **kwargs):
+            try:
+                self.require_user()
+                return method(self, *args, **kwargs)
+            except _VIEW_ERRORS as e:
+                key = next(key for error, key in VIEW_ERROR_MESSAGES.items() if isinstance(e, error))
+                message = VALIDATION_MESSAGES[key]
+                if error_message and isinstance(e, ValidationError):
+                    message = error_message
+                self.display_error(message.format(error=e))
+            except Exception as e:
+                message = error_message or VALIDATION_MESSAGES["general_error"]
+                self.display_error(message.format(error=e))
+            return None
+        return wrapper
+    return decorator
+
+
 class BaseView:
     """
     Classe de base pour toutes les vues CLI de l'application Epic Events.
@@ -87,7 +133,7 @@ class BaseView:
     Gestion des ressources:
         - Session SQLAlchemy partagée avec auto-commit
         - Service d'authentification centralisé
-        - Nettoyage automatique en fin de vie d'objet
+        - Fermeture de la session partagée en fin de programme
         - Protection contre les fuites mémoire
 
     Attributs:
@@ -100,24 +146,24 @@ class BaseView:
         """
         Initialiser la vue de base avec ressources partagées.
 
-        Configure la console Rich, la session de base de données et
-        le service d'authentification pour utilisation par les vues dérivées.
+        Configure la console Rich ; la session de base de données et le
+        service d'authentification ne sont créés qu'au premier accès.
         """
         self.console = Console()
-        # Initialisation session base de données avec engine partagé
-        SessionLocal = sessionmaker(bind=engine)
-        self.db = SessionLocal()
-        self.auth_service = AuthenticationService(self.db)
+        # Utilisateur transmis aux contrôleurs de la vue (et son département)
+        self._current_user = None
+        self._current_department = None
+        self._controllers = []
 
-    def __del__(self):
-        """
-        Nettoyer les ressources lors de la destruction de l'objet.
+    @cached_property
+    def db(self):
+        """Session base de données partagée par toutes les vues du processus"""
+        return ViewSession()
 
-        Ferme proprement la session de base de données pour éviter
-        les fuites de connexions et garantir la cohérence transactionnelle.
-        """
-        if hasattr(self, 'db'):
-            self.db.close()
+    @cached_property
+    def auth_service(self) -> AuthenticationService:
+        """Service d'authentification créé à la première utilisation"""
+        return AuthenticationService(self.db)
 
     def setup_controller(self, controller_class):
         """
@@ -140,11 +186,67 @@ class BaseView:
             - Permissions utilisateur appliquées
         """
         controller = controller_class(self.db)
-        current_user = self.auth_service.get_current_user()
-        if current_user:
-            controller.set_current_user(current_user)
+        self._set_user(self.auth_service.get_current_user())
+        if self._current_user:
+            controller.set_current_user(self._current_user)
+        self._controllers.append(controller)
         return controller
 
+    def _set_user(self, user):
+        """Retenir l'utilisateur courant et son département"""
+        self._current_user = user
+        self._current_department = user.department if user else None
+
+    def require_user(self):
+        """
+        Retourner l'utilisateur authentifié et le transmettre aux contrôleurs.
+
+        Le service d'authentification est l'unique cache de l'utilisateur
+        vérifié (voir AuthenticationService.get_current_user) : tant que le
+        token stocké ne change pas, l'appel ne décode rien et n'interroge
+        pas la base ; une déconnexion ou un nouveau token est pris en compte
+        à la commande suivante. Un nouvel utilisateur est transmis à tous
+        les contrôleurs de la vue, ce qui rend inutile un appel à
+        set_current_user() dans les commandes.
+
+        Returns:
+            User: Instance de l'utilisateur authentifié
+
+        Raises:
+            AuthenticationError: Si aucun utilisateur n'est connecté
+        """
+        user = self.auth_service.require_authentication()
+        if user is not self._current_user:
+            self._set_user(user)
+            for controller in self._controllers:
+                controller.set_current_user(user)
+        return user
+
+    def role_suffix(self, suffixes: Dict) -> str:
+        """
+        Retourner le suffixe de titre associé au département de l'utilisateur.
+
+        Le département est retenu avec l'utilisateur (voir _set_user) ;
+        chaque commande se limite ainsi à une recherche dans le dictionnaire
+        fourni (Department -> suffixe), chaîne vide par défaut.
+        """
+        return suffixes.get(self._current_department, "")
+
+    @staticmethod
+    def format_datetime(dt) -> str:
+        """
+        Formater une date/heure au format 'AAAA-MM-JJ HH:MM'.
+
+        Équivalent à strftime('%Y-%m-%d %H:%M') sans analyse du format
+        à chaque appel (utilisé dans les boucles d'affichage).
+        """
+        return f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d} {dt.hour:02d}:{dt.minute:02d}"
+
+    @staticmethod
+    def format_date(dt) -> str:
+        """Formater une date au format 'AAAA-MM-JJ' (équivalent strftime('%Y-%m-%d'))"""
+        return f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d}"
+
     def display_success(self, message: str):
         """
         Afficher un message de succès avec formatage vert et icône check.
@@ -205,6 +307,15 @@ class BaseView:
         """
         self.console.print(f"[bold blue]ℹ {message}[/bold blue]")
 
+    def display_info_lines(self, messages):
+        """
+        Afficher plusieurs messages d'information en une seule impression.
+
+        Rendu identique à des appels successifs de display_info, mais le
+        bloc est assemblé puis écrit en une fois.
+        """
+        self.console.print("\n".join(f"[bold blue]ℹ {message}[/bold blue]" for message in messages))
+
     def display_panel(self, content: str, title: str,
                       style: str = "cyan", border_style: str = "blue"):
         """
@@ -234,7 +345,8 @@ class BaseView:
         Args:
             title: Titre du tableau
             columns: Liste des définitions de colonnes avec propriétés
-            data: Données à afficher (liste de listes)
+            data: Lignes à afficher (itérable de séquences, éventuellement
+                  un générateur consommé au fil de la construction)
             style: Style de couleur du tableau (défaut: cyan)
 
         Format des colonnes:
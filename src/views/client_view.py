@@ -433,6 +433,6 @@ class ClientView(BaseView):
 [cyan]Téléphone:[/cyan] {client.phone}
 [cyan]Entreprise:[/cyan] {client.company_name}
 [cyan]Commercial:[/cyan] {commercial_display}
-[cyan]Créé le:[/cyan] {client.created_at.strftime('%Y-%m-%d %H:%M')}
+[cyan]Créé le:[/cyan] {self.format_datetime(client.created_at)}
         """
         self.display_panel(client_content, CLIENT_MESSAGES["client_details_title"], style="blue")
@@ -32,12 +32,16 @@ Permissions par département:
 Fichier: src/views/contract_view.py
 """
 
+import sys
+from decimal import Decimal
+from functools import cached_property
 from typing import List
+from src.controllers.client_controller import ClientController
 from src.controllers.contract_controller import ContractController
 from src.models.contract import Contract, ContractStatus
-from src.utils.auth_utils import AuthenticationError, AuthorizationError
-from src.config.messages import CONTRACT_MESSAGES, VALIDATION_MESSAGES
-from .base_view import BaseView
+from src.models.user import Department
+from src.config.messages import CONTRACT_MESSAGES
+from .base_view import BaseView, view_command
 
 
 class ContractView(BaseView):
@@ -68,6 +72,23 @@ class ContractView(BaseView):
         - Suivi des paiements et encours
     """
 
+    # Nombre maximal de contrats affichés pour une recherche
+    SEARCH_DISPLAY_LIMIT = 50
+    # Suffixes des titres selon le département de l'utilisateur
+    _LIST_SUFFIXES = {
+        Department.COMMERCIAL: " (MES CONTRATS)",
+        Department.SUPPORT: " (CONTRATS AVEC MES EVENEMENTS)",
+    }
+    _SEARCH_SUFFIXES = {
+        Department.COMMERCIAL: " (DANS MES CONTRATS)",
+        Department.SUPPORT: " (DANS MES EVENEMENTS)",
+    }
+    # Ligne du tableau des contrats : la précision (.19) tronque les noms
+    # directement au formatage, sans tranche intermédiaire
+    _TABLE_ROW = "{:<5} {:<20.19} {:<20.19} {:<12} {:<12} {:<10} {:<20.19}"
+    _TABLE_HEADER = _TABLE_ROW.format("ID", "Client", "Entreprise", "Montant",
+                                      "Du", "Statut", "Commercial")
+
     def __init__(self):
         """
         Initialiser la vue de gestion des contrats.
@@ -78,6 +99,12 @@ class ContractView(BaseView):
         super().__init__()
         self.contract_controller = self.setup_controller(ContractController)
 
+    @cached_property
+    def client_controller(self) -> ClientController:
+        """Contrôleur client créé à la première utilisation puis réutilisé"""
+        return self.setup_controller(ClientController)
+
+    @view_command()
     def list_all_contracts_command(self):
         """
         Afficher la liste complète des contrats (administration).
@@ -97,274 +124,352 @@ class ContractView(BaseView):
             - Montants financiers avec formatage
             - Dates de création et signature
         """
-        try:
-            current_user = self.auth_service.require_authentication()
-            self.contract_controller.set_current_user(current_user)
-
-            contracts = self.contract_controller.get_all_contracts()
+        contracts = self.contract_controller.get_contracts_for_table()
 
-            self.display_info(CONTRACT_MESSAGES["list_header"])
-
-            if not contracts:
-                self.display_info(CONTRACT_MESSAGES["no_contracts_found"])
-                return
+        self.display_info(CONTRACT_MESSAGES["list_header"])
 
-            self._display_contracts_table(contracts)
+        if not contracts:
+            self.display_info(CONTRACT_MESSAGES["no_contracts_found"])
+            return
 
-        except (AuthenticationError, AuthorizationError) as e:
-            self.display_error(VALIDATION_MESSAGES["authorization_error"].format(error=e))
-        except Exception as e:
-            self.display_error(VALIDATION_MESSAGES["general_error"].format(error=e))
+        self._display_contracts_table(contracts)
 
+    @view_command()
     def list_my_contracts_command(self):
         """Lister mes contrats (commerciaux seulement)"""
-        try:
-            current_user = self.auth_service.require_authentication()
-            self.contract_controller.set_current_user(current_user)
+        # Utilisateur déjà authentifié et transmis au contrôleur par view_command
+        if not self.contract_controller.current_user.is_commercial:
+            self.display_error(CONTRACT_MESSAGES["permission_commercial_only"])
+            return
 
-            if not current_user.is_commercial:
-                self.display_error(CONTRACT_MESSAGES["permission_commercial_only"])
-                return
-
-            contracts = self.contract_controller.get_my_contracts()
+        contracts = self.contract_controller.get_my_contracts_for_table()
 
-            self.display_info(CONTRACT_MESSAGES["my_contracts_header"])
-
-            if not contracts:
-                self.display_info(CONTRACT_MESSAGES["no_my_contracts"])
-                return
+        self.display_info(CONTRACT_MESSAGES["my_contracts_header"])
 
-            self._display_contracts_table(contracts)
+        if not contracts:
+            self.display_info(CONTRACT_MESSAGES["no_my_contracts"])
+            return
 
-        except (AuthenticationError, AuthorizationError) as e:
-            self.display_error(VALIDATION_MESSAGES["authorization_error"].format(error=e))
-        except Exception as e:
-            self.display_error(VALIDATION_MESSAGES["general_error"].format(error=e))
+        self._display_contracts_table(contracts)
 
+    @view_command()
     def list_unsigned_contracts_command(self):
         """Lister les contrats non signes selon les permissions"""
-        try:
-            current_user = self.auth_service.require_authentication()
-            self.contract_controller.set_current_user(current_user)
+        contracts = self.contract_controller.get_unsigned_contracts_for_table()
 
-            contracts = self.contract_controller.get_unsigned_contracts()
+        role_info = self.role_suffix(self._LIST_SUFFIXES)
 
-            role_info = ""
-            if current_user.is_commercial:
-                role_info = " (MES CONTRATS)"
-            elif current_user.is_support:
-                role_info = " (CONTRATS AVEC MES EVENEMENTS)"
+        self.display_info(f"=== CONTRATS NON SIGNES{role_info} ===")
 
-            self.display_info(f"=== CONTRATS NON SIGNES{role_info} ===")
+        if not contracts:
+            self.display_info(CONTRACT_MESSAGES["no_unsigned_contracts"])
+            return
 
-            if not contracts:
-                self.display_info(CONTRACT_MESSAGES["no_unsigned_contracts"])
-                return
-
-            self._display_contracts_table(contracts)
-
-        except (AuthenticationError, AuthorizationError) as e:
-            self.display_error(VALIDATION_MESSAGES["authorization_error"].format(error=e))
-        except Exception as e:
-            self.display_error(VALIDATION_MESSAGES["general_error"].format(error=e))
+        self._display_contracts_table(contracts)
 
+    @view_command()
     def list_unpaid_contracts_command(self):
         """Lister les contrats avec des montants dus selon les permissions"""
-        try:
-            current_user = self.auth_service.require_authentication()
-            self.contract_controller.set_current_user(current_user)
+        contracts = self.contract_controller.get_unpaid_contracts_for_table()
 
-            contracts = self.contract_controller.get_unpaid_contracts()
+        role_info = self.role_suffix(self._LIST_SUFFIXES)
 
-            role_info = ""
-            if current_user.is_commercial:
-                role_info = " (MES CONTRATS)"
-            elif current_user.is_support:
-                role_info = " (CONTRATS AVEC MES EVENEMENTS)"
+        self.display_info(f"=== CONTRATS AVEC MONTANTS DUS{role_info} ===")
 
-            self.display_info(f"=== CONTRATS AVEC MONTANTS DUS{role_info} ===")
-
-            if not contracts:
-                self.display_info(CONTRACT_MESSAGES["no_pending_contracts"])
-                return
+        if not contracts:
+            self.display_info(CONTRACT_MESSAGES["no_pending_contracts"])
+            return
 
-            self._display_contracts_table(contracts)
-
-        except (AuthenticationError, AuthorizationError) as e:
-            self.display_error(VALIDATION_MESSAGES["authorization_error"].format(error=e))
-        except Exception as e:
-            self.display_error(VALIDATION_MESSAGES["general_error"].format(error=e))
+        self._display_contracts_table(contracts)
 
+    @view_command()
     def view_contract_command(self, contract_id: int):
         """Afficher les details d'un contrat"""
-        try:
-            current_user = self.auth_service.require_authentication()
-            self.contract_controller.set_current_user(current_user)
-
-            contract = self.contract_controller.get_contract_by_id(contract_id)
-            if not contract:
-                self.display_error(CONTRACT_MESSAGES["not_found_or_access_denied"])
-                return
-
-            self._display_contract_details(contract)
+        contract = self.contract_controller.get_contract_by_id(contract_id)
+        if not contract:
+            self.display_error(CONTRACT_MESSAGES["not_found_or_access_denied"])
+            return
 
-        except (AuthenticationError, AuthorizationError) as e:
-            self.display_error(VALIDATION_MESSAGES["authorization_error"].format(error=e))
-        except Exception as e:
-            self.display_error(VALIDATION_MESSAGES["general_error"].format(error=e))
+        self._display_contract_details(contract)
 
+    @view_command()
     def search_contracts_command(self):
-        """Rechercher des contrats selon les permissions"""
-        try:
-            current_user = self.auth_service.require_authentication()
-            self.contract_controller.set_current_user(current_user)
-
-            role_info = ""
-            if current_user.is_commercial:
-                role_info = " (DANS MES CONTRATS)"
-            elif current_user.is_support:
-                role_info = " (DANS MES EVENEMENTS)"
-
-            self.display_info(f"=== RECHERCHE DE CONTRATS{role_info} ===")
-
-            criteria = {}
-
-            client_name = self.get_user_input("Nom du client (optionnel)")
-            if client_name:
-                criteria['client_name'] = client_name
-
-            company_name = self.get_user_input("Nom de l'entreprise (optionnel)")
-            if company_name:
-                criteria['company_name'] = company_name
-
-            status_display = {
-                '1': 'Brouillon',
-                '2': 'Signe',
-                '3': 'Annule',
-                '0': 'Tous'
-            }
+        """
+        Rechercher des contrats selon les permissions.
 
-            status_choice = self.get_user_choice(status_display, "Statut")
-            if status_choice != '0':
-                status_options = {
-                    '1': ContractStatus.DRAFT,
-                    '2': ContractStatus.SIGNED,
-                    '3': ContractStatus.CANCELLED,
-                }
-                criteria['status'] = status_options[status_choice]
+        Si trop de contrats correspondent, l'utilisateur peut afficher les
+        SEARCH_DISPLAY_LIMIT premiers ou revenir à la saisie des critères
+        pour affiner la recherche.
+        """
+        role_info = self.role_suffix(self._SEARCH_SUFFIXES)
 
+        self.display_info(f"=== RECHERCHE DE CONTRATS{role_info} ===")
+
+        while True:
+            criteria = self._prompt_search_criteria()
             if not criteria:
                 self.display_info(CONTRACT_MESSAGES["no_search_criteria"])
                 return
 
-            contracts = self.contract_controller.search_contracts(**criteria)
-
-            if contracts:
-                self.display_success(f"{len(contracts)} contrat(s) trouve(s)")
-                self._display_contracts_table(contracts)
-            else:
+            # Comptage côté base avant de charger les lignes
+            count = self.contract_controller.search_contracts_count(**criteria)
+            if not count:
                 self.display_info(CONTRACT_MESSAGES["no_search_results"])
+                return
+
+            if count <= self.SEARCH_DISPLAY_LIMIT:
+                break
+            self.display_warning(CONTRACT_MESSAGES["search_too_many_results"].format(
+                count=count, limit=self.SEARCH_DISPLAY_LIMIT))
+            if self.confirm_action(CONTRACT_MESSAGES["search_refine_confirm"]):
+                break
+            self.display_info(CONTRACT_MESSAGES["search_refine"])
+
+        contracts = self.contract_controller.search_contracts(
+            limit=self.SEARCH_DISPLAY_LIMIT, **criteria
+        )
+        if len(contracts) < count:
+            self.display_success(CONTRACT_MESSAGES["search_results_partial"].format(
+                shown=len(contracts), count=count))
+        else:
+            self.display_success(CONTRACT_MESSAGES["search_results_count"].format(count=count))
+        self._display_contracts_table(contracts)
+
+    def _prompt_search_criteria(self) -> dict:
+        """Saisir les critères de recherche (dictionnaire vide si aucun)"""
+        criteria = {}
+
+        client_name = self.get_user_input("Nom du client (optionnel)")
+        if client_name:
+            criteria['client_name'] = client_name
+
+        company_name = self.get_user_input("Nom de l'entreprise (optionnel)")
+        if company_name:
+            criteria['company_name'] = company_name
+
+        status_display = {
+            '1': 'Brouillon',
+            '2': 'Signe',
+            '3': 'Annule',
+            '0': 'Tous'
+        }
+
+        status_choice = self.get_user_choice(status_display, "Statut")
+        if status_choice != '0':
+            status_options = {
+                '1': ContractStatus.DRAFT,
+                '2': ContractStatus.SIGNED,
+                '3': ContractStatus.CANCELLED,
+            }
+            criteria['status'] = status_options[status_choice]
 
-        except (AuthenticationError, AuthorizationError) as e:
-            self.display_error(VALIDATION_MESSAGES["authorization_error"].format(error=e))
-        except Exception as e:
-            self.display_error(VALIDATION_MESSAGES["general_error"].format(error=e))
+        return criteria
 
     def _display_contract_details(self, contract: Contract):
-        """Afficher les details d'un contrat"""
-        print(f"\n=== CONTRAT {contract.id} ===")
-        print(f"Client: {contract.client.full_name}")
-        print(f"Entreprise: {contract.client.company_name}")
-        print(f"Commercial: {contract.commercial_contact.full_name}")
-        print(f"Montant total: {contract.total_amount} EUR")
-        print(f"Montant du: {contract.amount_due} EUR")
-        print(f"Statut: {contract.status.value}")
-        print(f"Signe: {'Oui' if contract.signed else 'Non'}")
+        """Afficher les details d'un contrat (une seule écriture sur stdout)"""
+        lines = [
+            f"\n=== CONTRAT {contract.id} ===",
+            f"Client: {contract.client.full_name}",
+            f"Entreprise: {contract.client.company_name}",
+            f"Commercial: {contract.commercial_contact.full_name}",
+            f"Montant total: {contract.total_amount} EUR",
+            f"Montant du: {contract.amount_due} EUR",
+            f"Statut: {contract.status.value}",
+            f"Signe: {'Oui' if contract.signed else 'Non'}",
+        ]
         if contract.signed_at:
-            print(f"Signe le: {contract.signed_at.strftime('%Y-%m-%d %H:%M')}")
-        print(f"Cree le: {contract.created_at.strftime('%Y-%m-%d %H:%M')}")
+            lines.append(f"Signe le: {self.format_datetime(contract.signed_at)}")
+        lines.append(f"Cree le: {self.format_datetime(contract.created_at)}")
         if contract.updated_at:
-            print(f"Modifie le: {contract.updated_at.strftime('%Y-%m-%d %H:%M')}")
+            lines.append(f"Modifie le: {self.format_datetime(contract.updated_at)}")
 
         if contract.events:
-            print(f"\nEvenements associes: {len(contract.events)}")
+            lines.append(f"\nEvenements associes: {len(contract.events)}")
             for event in contract.events:
-                support_name = (event.support_contact.full_name[:14]
+                support_name = (f"{event.support_contact.full_name:.14}"
                                 if event.support_contact else "Non assigne")
-                print(f"  - {event.name} ({event.start_date.strftime('%Y-%m-%d')}) "
-                      f"- Support: {support_name}")
+                lines.append(f"  - {event.name} ({self.format_date(event.start_date)}) "
+                             f"- Support: {support_name}")
+
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def _display_contracts_table(self, contracts: List[Contract]):
-        """Afficher les contrats sous forme de tableau"""
-        header = f"{'ID':<5} {'Client':<20} {'Entreprise':<20} {'Montant':<12} " \
-                 f"{'Du':<12} {'Statut':<10} {'Commercial':<20}"
-        print(header)
-        print("-" * len(header))
+        """
+        Afficher les contrats sous forme de tableau.
 
+        Accepte des objets Contract ou les lignes Core retournées par les
+        méthodes *_for_table() de ContractController ; les noms sont
+        tronqués ici, par le formatage de _TABLE_ROW.
+        """
+        lines = [self._TABLE_HEADER, "-" * len(self._TABLE_HEADER)]
         for contract in contracts:
-            commercial_name = contract.commercial_contact.full_name[:19]
-            status_display = contract.status.value
-            print(f"{contract.id:<5} {contract.client.full_name[:19]:<20} "
-                  f"{contract.client.company_name[:19]:<20} "
-                  f"{contract.total_amount:<12} {contract.amount_due:<12} "
-                  f"{status_display:<10} {commercial_name:<20}")
-
+            if isinstance(contract, Contract):
+                client_name = contract.client.full_name
+                company_name = contract.client.company_name
+                commercial_name = contract.commercial_contact.full_name
+            else:
+                client_name = contract.client_name
+                company_name = contract.company_name
+                commercial_name = contract.commercial_name
+            lines.append(self._TABLE_ROW.format(
+                contract.id, client_name, company_name, contract.total_amount,
+                contract.amount_due, contract.status.value, commercial_name
+            ))
+        sys.stdout.write("\n".join(lines) + "\n")
+
+    @view_command('Erreur lors de la création du contrat: {error}')
     def create_contract_command(self, client_id: int):
         """Créer un nouveau contrat pour un client"""
-        from decimal import Decimal
-
-        try:
-            current_user = self.auth_service.require_authentication()
-            self.contract_controller.set_current_user(current_user)
-
-            # Vérifier que le client existe
-            from src.controllers.client_controller import ClientController
-            client_controller = ClientController(self.db)
-            client_controller.set_current_user(current_user)
+        # Vérifier que le client existe
+        client = self.client_controller.get_client_by_id(client_id)
+        if not client:
+            self.display_error(f"Client avec l'ID {client_id} introuvable")
+            return
+
+        self.display_info(f"\n────────────── CRÉATION D'UN CONTRAT POUR {client.full_name.upper()} ──────────────")
+
+        # Saisie des données du contrat
+        self.display_info(f"\nClient : {client.full_name}")
+        self.display_info(f"Entreprise : {client.company_name}")
+        self.display_info(f"Commercial : {client.commercial_contact.full_name}")
+
+        print()
+
+        # Montant total
+        while True:
+            try:
+                total_amount_input = self.prompt_user("Montant total du contrat (EUR)", required=True)
+                total_amount = Decimal(total_amount_input.replace(',', '.'))
+                if total_amount <= 0:
+                    self.display_error("Le montant doit être positif")
+                    continue
+                break
+            except (ValueError, TypeError):
+                self.display_error("Montant invalide. Utilisez le format : 1000.50")
+
+        # Montant restant dû
+        while True:
+            try:
+                amount_due_input = self.prompt_user("Montant restant dû (EUR)", required=True)
+                amount_due = Decimal(amount_due_input.replace(',', '.'))
+                if amount_due < 0:
+                    self.display_error("Le montant dû ne peut pas être négatif")
+                    continue
+                if amount_due > total_amount:
+                    self.display_error("Le montant dû ne peut pas être supérieur au montant total")
+                    continue
+                break
+            except (ValueError, TypeError):
+                self.display_error("Montant invalide. Utilisez le format : 1000.50")
+
+        # Statut du contrat
+        print("\nChoisissez le statut du contrat :")
+        print("  1 - draft (brouillon)")
+        print("  2 - signed (signé)")
+        print("  3 - cancelled (annulé)")
+
+        while True:
+            choice = self.prompt_user("Votre choix [1/2/3]", required=True)
+            if choice == "1":
+                status = ContractStatus.DRAFT
+                break
+            elif choice == "2":
+                status = ContractStatus.SIGNED
+                break
+            elif choice == "3":
+                status = ContractStatus.CANCELLED
+                break
+            else:
+                self.display_error("Choix invalide. Choisissez 1, 2 ou 3")
+
+        # Créer le contrat
+        contract = self.contract_controller.create_contract(
+            client_id=client_id,
+            total_amount=float(total_amount),
+            amount_due=float(amount_due)
+        )
+
+        # Mettre à jour le statut si ce n'est pas DRAFT
+        if status != ContractStatus.DRAFT:
+            contract = self.contract_controller.update_contract(
+                contract_id=contract.id,
+                status=status
+            )
 
-            client = client_controller.get_client_by_id(client_id)
-            if not client:
-                self.display_error(f"Client avec l'ID {client_id} introuvable")
+        self.display_success_box(
+            "CONTRAT CRÉÉ",
+            f"Contrat créé avec succès !\n\n"
+            f"ID: {contract.id}\n"
+            f"Client: {contract.client.full_name}\n"
+            f"Entreprise: {contract.client.company_name}\n"
+            f"Montant total: {contract.total_amount} EUR\n"
+            f"Montant dû: {contract.amount_due} EUR\n"
+            f"Statut: {contract.status.value.upper()}\n"
+            f"Commercial: {contract.commercial_contact.full_name}"
+        )
+
+    @view_command('Erreur lors de la mise à jour du contrat: {error}')
+    def update_contract_command(self, contract_id: int):
+        """Mettre à jour un contrat existant"""
+        # Récupérer le contrat
+        contract = self.contract_controller.get_contract_by_id(contract_id)
+        if not contract:
+            self.display_error(f"Contrat avec l'ID {contract_id} introuvable")
+            return
+
+        self.display_info(f"\n──────────────── MODIFICATION DU CONTRAT {contract.id} ────────────────")
+
+        # Afficher les détails actuels
+        self.display_info_box(
+            "DÉTAILS DU CONTRAT",
+            f"ID: {contract.id}\n"
+            f"Client: {contract.client.full_name}\n"
+            f"Entreprise: {contract.client.company_name}\n"
+            f"Montant total: {contract.total_amount} EUR\n"
+            f"Montant dû: {contract.amount_due} EUR\n"
+            f"Statut: {contract.status.value.upper()}\n"
+            f"Commercial: {contract.commercial_contact.full_name}\n"
+            f"Créé le: {self.format_datetime(contract.created_at)}"
+        )
+
+        print("\nLaissez vide pour conserver la valeur actuelle")
+
+        # Montant total
+        total_amount = None
+        total_input = self.prompt_user(f"Montant total ({contract.total_amount} EUR)")
+        if total_input.strip():
+            try:
+                total_amount = float(Decimal(total_input.replace(',', '.')))
+                if total_amount <= 0:
+                    self.display_error("Le montant doit être positif")
+                    return
+            except (ValueError, TypeError):
+                self.display_error("Montant invalide")
                 return
 
-            self.display_info(f"\n────────────── CRÉATION D'UN CONTRAT POUR {client.full_name.upper()} ──────────────")
-
-            # Saisie des données du contrat
-            self.display_info(f"\nClient : {client.full_name}")
-            self.display_info(f"Entreprise : {client.company_name}")
-            self.display_info(f"Commercial : {client.commercial_contact.full_name}")
-
-            print()
-
-            # Montant total
-            while True:
-                try:
-                    total_amount_input = self.prompt_user("Montant total du contrat (EUR)", required=True)
-                    total_amount = Decimal(total_amount_input.replace(',', '.'))
-                    if total_amount <= 0:
-                        self.display_error("Le montant doit être positif")
-                        continue
-                    break
-                except (ValueError, TypeError):
-                    self.display_error("Montant invalide. Utilisez le format : 1000.50")
-
-            # Montant restant dû
-            while True:
-                try:
-                    amount_due_input = self.prompt_user("Montant restant dû (EUR)", required=True)
-                    amount_due = Decimal(amount_due_input.replace(',', '.'))
-                    if amount_due < 0:
-                        self.display_error("Le montant dû ne peut pas être négatif")
-                        continue
-                    if amount_due > total_amount:
-                        self.display_error("Le montant dû ne peut pas être supérieur au montant total")
-                        continue
-                    break
-                except (ValueError, TypeError):
-                    self.display_error("Montant invalide. Utilisez le format : 1000.50")
+        # Montant restant dû
+        amount_due = None
+        due_input = self.prompt_user(f"Montant restant dû ({contract.amount_due} EUR)")
+        if due_input.strip():
+            try:
+                amount_due = float(Decimal(due_input.replace(',', '.')))
+                if amount_due < 0:
+                    self.display_error("Le montant dû ne peut pas être négatif")
+                    return
+                check_total = total_amount if total_amount is not None else contract.total_amount
+                if amount_due > check_total:
+                    self.display_error("Le montant dû ne peut pas être supérieur au montant total")
+                    return
+            except (ValueError, TypeError):
+                self.display_error("Montant invalide")
+                return
 
-            # Statut du contrat
-            print("\nChoisissez le statut du contrat :")
+        # Statut du contrat
+        status = None
+        change_status = self.prompt_user("Changer le statut ? [y/n]")
+        if change_status.lower() in ['y', 'yes', 'o', 'oui']:
+            print(f"\nStatut actuel: {contract.status.value}")
+            print("\nNouveau statut :")
             print("  1 - draft (brouillon)")
             print("  2 - signed (signé)")
             print("  3 - cancelled (annulé)")
@@ -383,152 +488,31 @@ class ContractView(BaseView):
                 else:
                     self.display_error("Choix invalide. Choisissez 1, 2 ou 3")
 
-            # Créer le contrat
-            contract = self.contract_controller.create_contract(
-                client_id=client_id,
-                total_amount=float(total_amount),
-                amount_due=float(amount_due)
-            )
-
-            # Mettre à jour le statut si ce n'est pas DRAFT
-            if status != ContractStatus.DRAFT:
-                contract = self.contract_controller.update_contract(
-                    contract_id=contract.id,
-                    status=status
-                )
-
-            self.display_success_box(
-                "CONTRAT CRÉÉ",
-                f"Contrat créé avec succès !\n\n"
-                f"ID: {contract.id}\n"
-                f"Client: {contract.client.full_name}\n"
-                f"Entreprise: {contract.client.company_name}\n"
-                f"Montant total: {contract.total_amount} EUR\n"
-                f"Montant dû: {contract.amount_due} EUR\n"
-                f"Statut: {contract.status.value.upper()}\n"
-                f"Commercial: {contract.commercial_contact.full_name}"
-            )
-
-        except (AuthenticationError, AuthorizationError) as e:
-            self.display_error(VALIDATION_MESSAGES["authorization_error"].format(error=e))
-        except Exception as e:
-            self.display_error(f"Erreur lors de la création du contrat: {e}")
-
-    def update_contract_command(self, contract_id: int):
-        """Mettre à jour un contrat existant"""
-        from decimal import Decimal
-
-        try:
-            current_user = self.auth_service.require_authentication()
-            self.contract_controller.set_current_user(current_user)
-
-            # Récupérer le contrat
-            contract = self.contract_controller.get_contract_by_id(contract_id)
-            if not contract:
-                self.display_error(f"Contrat avec l'ID {contract_id} introuvable")
-                return
-
-            self.display_info(f"\n──────────────── MODIFICATION DU CONTRAT {contract.id} ────────────────")
-
-            # Afficher les détails actuels
-            self.display_info_box(
-                "DÉTAILS DU CONTRAT",
-                f"ID: {contract.id}\n"
-                f"Client: {contract.client.full_name}\n"
-                f"Entreprise: {contract.client.company_name}\n"
-                f"Montant total: {contract.total_amount} EUR\n"
-                f"Montant dû: {contract.amount_due} EUR\n"
-                f"Statut: {contract.status.value.upper()}\n"
-                f"Commercial: {contract.commercial_contact.full_name}\n"
-                f"Créé le: {contract.created_at.strftime('%Y-%m-%d %H:%M')}"
-            )
-
-            print("\nLaissez vide pour conserver la valeur actuelle")
-
-            # Montant total
-            total_amount = None
-            total_input = self.prompt_user(f"Montant total ({contract.total_amount} EUR)")
-            if total_input.strip():
-                try:
-                    total_amount = float(Decimal(total_input.replace(',', '.')))
-                    if total_amount <= 0:
-                        self.display_error("Le montant doit être positif")
-                        return
-                except (ValueError, TypeError):
-                    self.display_error("Montant invalide")
-                    return
-
-            # Montant restant dû
-            amount_due = None
-            due_input = self.prompt_user(f"Montant restant dû ({contract.amount_due} EUR)")
-            if due_input.strip():
-                try:
-                    amount_due = float(Decimal(due_input.replace(',', '.')))
-                    if amount_due < 0:
-                        self.display_error("Le montant dû ne peut pas être négatif")
-                        return
-                    check_total = total_amount if total_amount is not None else contract.total_amount
-                    if amount_due > check_total:
-                        self.display_error("Le montant dû ne peut pas être supérieur au montant total")
-                        return
-                except (ValueError, TypeError):
-                    self.display_error("Montant invalide")
-                    return
-
-            # Statut du contrat
-            status = None
-            change_status = self.prompt_user("Changer le statut ? [y/n]")
-            if change_status.lower() in ['y', 'yes', 'o', 'oui']:
-                print(f"\nStatut actuel: {contract.status.value}")
-                print("\nNouveau statut :")
-                print("  1 - draft (brouillon)")
-                print("  2 - signed (signé)")
-                print("  3 - cancelled (annulé)")
-
-                while True:
-                    choice = self.prompt_user("Votre choix [1/2/3]", required=True)
-                    if choice == "1":
-                        status = ContractStatus.DRAFT
-                        break
-                    elif choice == "2":
-                        status = ContractStatus.SIGNED
-                        break
-                    elif choice == "3":
-                        status = ContractStatus.CANCELLED
-                        break
-                    else:
-                        self.display_error("Choix invalide. Choisissez 1, 2 ou 3")
-
-            # Mettre à jour le contrat
-            update_data = {}
-            if total_amount is not None:
-                update_data['total_amount'] = total_amount
-            if amount_due is not None:
-                update_data['amount_due'] = amount_due
-            if status is not None:
-                update_data['status'] = status
-
-            updated_contract = self.contract_controller.update_contract(
-                contract_id=contract_id,
-                **update_data
-            )
-
-            self.display_success(CONTRACT_MESSAGES["update_success"])
-
-            # Afficher les nouveaux détails
-            self.display_info_box(
-                "DÉTAILS DU CONTRAT",
-                f"ID: {updated_contract.id}\n"
-                f"Client: {updated_contract.client.full_name}\n"
-                f"Entreprise: {updated_contract.client.company_name}\n"
-                f"Montant total: {updated_contract.total_amount} EUR\n"
-                f"Montant dû: {updated_contract.amount_due} EUR\n"
-                f"Statut: {updated_contract.status.value.upper()}\n"
-                f"Commercial: {updated_contract.commercial_contact.full_name}\n"
-                f"Créé le: {updated_contract.created_at.strftime('%Y-%m-%d %H:%M')}"
-            )
-
-        except (AuthenticationError, AuthorizationError) as e:
-            self.display_error(VALIDATION_MESSAGES["authorization_error"].format(error=e))
-        except Exception as e:
-            self.display_error(f"Erreur lors de la mise à jour du contrat: {e}")
+        # Mettre à jour le contrat
+        update_data = {}
+        if total_amount is not None:
+            update_data['total_amount'] = total_amount
+        if amount_due is not None:
+            update_data['amount_due'] = amount_due
+        if status is not None:
+            update_data['status'] = status
+
+        updated_contract = self.contract_controller.update_contract(
+            contract_id=contract_id,
+            **update_data
+        )
+
+        self.display_success(CONTRACT_MESSAGES["update_success"])
+
+        # Afficher les nouveaux détails
+        self.display_info_box(
+            "DÉTAILS DU CONTRAT",
+            f"ID: {updated_contract.id}\n"
+            f"Client: {updated_contract.client.full_name}\n"
+            f"Entreprise: {updated_contract.client.company_name}\n"
+            f"Montant total: {updated_contract.total_amount} EUR\n"
+            f"Montant dû: {updated_contract.amount_due} EUR\n"
+            f"Statut: {updated_contract.status.value.upper()}\n"
+            f"Commercial: {updated_contract.commercial_contact.full_name}\n"
+            f"Créé le: {self.format_datetime(updated_contract.created_at)}"
+        )
@@ -32,12 +32,52 @@ Gestion logistique:
 Fichier: src/views/event_view.py
 """
 
-from typing import List
-from src.controllers.event_controller import EventController
+import re
+import sys
+import time
+from datetime import datetime, timedelta
+from functools import cached_property
+from typing import List, Optional, Tuple
+import click
+from src.controllers.event_controller import EventController, EventRow
 from src.models.event import Event
-from src.utils.auth_utils import AuthenticationError, AuthorizationError
+from src.models.user import Department, User
 from src.config.messages import EVENT_MESSAGES, VALIDATION_MESSAGES
-from .base_view import BaseView
+from rich.table import Table
+from rich.text import Text
+from .base_view import BaseView, view_command
+
+
+# Saisie 'AAAA-MM-JJ HH:MM' : pré-validation par expression compilée, une
+# saisie mal formée est rejetée sans passer par strptime ni exception
+_DT_RE = re.compile(r"^(\d{4})-(\d{2})-(\d{2}) (\d{2}):(\d{2})$")
+# Entier saisi (chiffres ASCII, signe facultatif) : int() ne peut plus échouer
+_INT_RE = re.compile(r"-?[0-9]+")
+
+
+def _match_dt(value: str) -> Optional[datetime]:
+    """Convertir une saisie 'AAAA-MM-JJ HH:MM' en datetime, None si invalide"""
+    match = _DT_RE.match(value.strip())
+    if match is None:
+        return None
+    try:
+        return datetime(*map(int, match.groups()))
+    except ValueError:
+        # Forme correcte mais valeurs hors limites (ex. mois 13)
+        return None
+
+
+def _parse_date(value: str) -> datetime:
+    """
+    Convertir une saisie 'AAAA-MM-JJ' en datetime (ValueError si invalide).
+
+    Format fixe : les champs sont lus par position, sans strptime.
+    """
+    value = value.strip()
+    if (len(value) != 10 or value[4] != "-" or value[7] != "-"
+            or not (value[:4] + value[5:7] + value[8:]).isdigit()):
+        raise ValueError(f"Format de date invalide : {value!r}")
+    return datetime(int(value[:4]), int(value[5:7]), int(value[8:]))
 
 
 class EventView(BaseView):
@@ -70,15 +110,74 @@ class EventView(BaseView):
         - Rapports de suivi et statistiques
     """
 
+    # Colonnes du tableau des événements (titre, largeur fixe) : les textes
+    # trop longs sont tronqués par Rich et terminés par une ellipse
+    _TABLE_COLUMNS = (("ID", 5), ("Nom", 25), ("Client", 20), ("Date", 12),
+                      ("Lieu", 20), ("Support", 15))
+
+    # Parcours des événements à venir par tranches adaptatives :
+    # nombre d'événements visé par tranche, facteur d'agrandissement de la
+    # fenêtre et durée de requête au-delà de laquelle la fenêtre est réduite
+    UPCOMING_BATCH_TARGET = 50
+    UPCOMING_BATCH_GROWTH = 2
+    UPCOMING_BATCH_MAX_SECONDS = 0.5
+
+    # Nombre d'événements affichés par page dans les listes ; en terminal
+    # interactif, la page suivante n'est affichée qu'à la demande
+    PAGE_SIZE = 50
+
+    # Durée (secondes) de conservation de la liste des utilisateurs support,
+    # partagée par les vues et invalidée par UserView (création, modification,
+    # suppression d'un support)
+    SUPPORTS_CACHE_TTL = 60
+    _supports_cache = None
+    _supports_cache_ts = 0.0
+    # Formulaire de saisie d'un événement, partagé par la création et la
+    # modification (voir _collect) : libellé complet en création, libellé
+    # court suivi de la valeur actuelle en modification
+    _EVENT_FORM = (
+        {'key': 'name', 'kind': 'text', 'required': True,
+         'label': "Nom de l'événement", 'short': "Nom"},
+        {'key': 'start_date', 'kind': 'datetime', 'required': True,
+         'label': "Date de début (YYYY-MM-DD HH:MM)", 'short': "Date de début",
+         'check': lambda value, known: value >= datetime.now(),
+         'error': "La date de début ne peut pas être dans le passé"},
+        {'key': 'end_date', 'kind': 'datetime', 'required': True,
+         'label': "Date de fin (YYYY-MM-DD HH:MM)", 'short': "Date de fin",
+         'check': lambda value, known: value > known['start_date'],
+         'error': "La date de fin doit être après la date de début"},
+        {'key': 'location', 'kind': 'text', 'required': True,
+         'label': "Lieu de l'événement", 'short': "Lieu"},
+        {'key': 'attendees', 'kind': 'int', 'required': True,
+         'label': "Nombre d'invités", 'short': "Nombre d'invités",
+         'check': lambda value, known: value >= 0,
+         'error': "Le nombre d'invités doit être positif"},
+        {'key': 'notes', 'kind': 'text', 'required': False,
+         'label': "Notes sur l'événement (optionnel)", 'short': "Notes"},
+    )
+    # Suffixes des titres selon le département de l'utilisateur
+    _MY_EVENTS_SUFFIXES = {
+        Department.SUPPORT: " (ASSIGNES A MOI)",
+        Department.COMMERCIAL: " (MES CONTRATS)",
+    }
+    _ASSIGNMENT_SUFFIXES = {
+        Department.SUPPORT: " (MES ASSIGNATIONS)",
+        Department.COMMERCIAL: " (MES CONTRATS)",
+    }
+
     def __init__(self):
         """
         Initialiser la vue de gestion des événements.
 
-        Configure le contrôleur événement avec session DB
-        et permissions selon département utilisateur.
+        Aucune ressource base de données n'est ouverte ici : les
+        contrôleurs sont créés à la première commande qui les utilise.
         """
         super().__init__()
-        self.event_controller = self.setup_controller(EventController)
+
+    @cached_property
+    def event_controller(self) -> EventController:
+        """Contrôleur événement créé à la première utilisation puis réutilisé"""
+        return self.setup_controller(EventController)
 
     def list_all_events_command(self):
         """
@@ -99,30 +198,12 @@ class EventView(BaseView):
             - Dates et contraintes logistiques
             - Indicateurs de charge et planning
         """
-        try:
-            # Authentification et configuration des permissions utilisateur
-            current_user = self.auth_service.require_authentication()
-            self.event_controller.set_current_user(current_user)
-
-            # Récupération sécurisée de tous les événements système
-            events = self.event_controller.get_all_events()
-
-            self.display_info(EVENT_MESSAGES["all_events_header"])
-
-            if not events:
-                # Aucun événement planifié dans le système
-                self.display_info(EVENT_MESSAGES["no_events_found"])
-                return
-
-            # Affichage du tableau de supervision avec données complètes
-            self._display_events_table(events)
-
-        except (AuthenticationError, AuthorizationError) as e:
-            # Gestion des erreurs d'accès et d'authentification
-            self.display_error(VALIDATION_MESSAGES["authorization_error"].format(error=e))
-        except Exception as e:
-            # Gestion des erreurs système inattendues
-            self.display_error(VALIDATION_MESSAGES["general_error"].format(error=e))
+        # Récupération par lots de lignes projetées (mémoire constante), réservée à GESTION
+        self._run_list(
+            lambda: self.event_controller.iter_all_event_rows(self.PAGE_SIZE),
+            EVENT_MESSAGES["all_events_header"],
+            EVENT_MESSAGES["no_events_found"],
+        )
 
     def list_my_events_command(self):
         """
@@ -143,30 +224,12 @@ class EventView(BaseView):
             - Priorités et échéances personnelles
             - Notifications et alertes contextuelles
         """
-        try:
-            current_user = self.auth_service.require_authentication()
-            self.event_controller.set_current_user(current_user)
-
-            events = self.event_controller.get_my_events()
-
-            role_info = ""
-            if current_user.is_support:
-                role_info = " (ASSIGNES A MOI)"
-            elif current_user.is_commercial:
-                role_info = " (MES CONTRATS)"
-
-            self.display_info(f"=== MES EVENEMENTS{role_info} ===")
-
-            if not events:
-                self.display_info(EVENT_MESSAGES["no_events_found"])
-                return
-
-            self._display_events_table(events)
-
-        except (AuthenticationError, AuthorizationError) as e:
-            self.display_error(VALIDATION_MESSAGES["authorization_error"].format(error=e))
-        except Exception as e:
-            self.display_error(VALIDATION_MESSAGES["general_error"].format(error=e))
+        self._run_list(
+            lambda: self.event_controller.iter_my_event_rows(self.PAGE_SIZE),
+            "=== MES EVENEMENTS{role} ===",
+            EVENT_MESSAGES["no_events_found"],
+            suffixes=self._MY_EVENTS_SUFFIXES,
+        )
 
     def create_event_command(self):
         """
@@ -220,30 +283,14 @@ class EventView(BaseView):
             - COMMERCIAL: Suivi événements clients
             - GESTION: Vue globale planification système
         """
-        try:
-            current_user = self.auth_service.require_authentication()
-            self.event_controller.set_current_user(current_user)
-
-            events = self.event_controller.get_upcoming_events(days_ahead)
-
-            role_info = ""
-            if current_user.is_support:
-                role_info = " (MES ASSIGNATIONS)"
-            elif current_user.is_commercial:
-                role_info = " (MES CONTRATS)"
-
-            self.display_info(f"=== EVENEMENTS A VENIR ({days_ahead} JOURS){role_info} ===")
-
-            if not events:
-                self.display_info(f"Aucun événement dans les {days_ahead} prochains jours")
-                return
-
-            self._display_events_table(events)
-
-        except (AuthenticationError, AuthorizationError) as e:
-            self.display_error(VALIDATION_MESSAGES["authorization_error"].format(error=e))
-        except Exception as e:
-            self.display_error(VALIDATION_MESSAGES["general_error"].format(error=e))
+        # Parcours de la période par tranches : les premières lignes
+        # s'affichent sans attendre le chargement de toute la période
+        self._run_list(
+            lambda: self._iter_upcoming_batches(days_ahead),
+            f"=== EVENEMENTS A VENIR ({days_ahead} JOURS){{role}} ===",
+            f"Aucun événement dans les {days_ahead} prochains jours",
+            suffixes=self._ASSIGNMENT_SUFFIXES,
+        )
 
     def list_unassigned_events_command(self):
         """
@@ -265,25 +312,13 @@ class EventView(BaseView):
             - Optimisation charge travail support
             - Garantie couverture événements système
         """
-        try:
-            current_user = self.auth_service.require_authentication()
-            self.event_controller.set_current_user(current_user)
-
-            events = self.event_controller.get_events_without_support()
-
-            self.display_info(EVENT_MESSAGES["unassigned_header"])
-
-            if not events:
-                self.display_info(EVENT_MESSAGES["no_unassigned_events"])
-                return
-
-            self._display_events_table(events)
-
-        except (AuthenticationError, AuthorizationError) as e:
-            self.display_error(VALIDATION_MESSAGES["authorization_error"].format(error=e))
-        except Exception as e:
-            self.display_error(VALIDATION_MESSAGES["general_error"].format(error=e))
+        self._run_list(
+            lambda: self.event_controller.iter_event_rows_without_support(self.PAGE_SIZE),
+            EVENT_MESSAGES["unassigned_header"],
+            EVENT_MESSAGES["no_unassigned_events"],
+        )
 
+    @view_command()
     def view_event_command(self, event_id: int):
         """
         Afficher les détails complets d'un événement spécifique.
@@ -309,22 +344,15 @@ class EventView(BaseView):
             - Actions disponibles selon permissions
             - Navigation vers modifications si autorisé
         """
-        try:
-            current_user = self.auth_service.require_authentication()
-            self.event_controller.set_current_user(current_user)
+        # Consultation seule : fiche lue en une requête Core, sans objets ORM
+        event = self.event_controller.get_event_by_id_flat(event_id)
+        if not event:
+            self.display_error(EVENT_MESSAGES["not_found_or_access_denied"])
+            return
 
-            event = self.event_controller.get_event_by_id(event_id)
-            if not event:
-                self.display_error(EVENT_MESSAGES["not_found_or_access_denied"])
-                return
-
-            self._display_event_details(event)
-
-        except (AuthenticationError, AuthorizationError) as e:
-            self.display_error(VALIDATION_MESSAGES["authorization_error"].format(error=e))
-        except Exception as e:
-            self.display_error(VALIDATION_MESSAGES["general_error"].format(error=e))
+        self._display_event_details(event)
 
+    @view_command()
     def search_events_command(self):
         """
         Rechercher des événements selon critères et permissions.
@@ -351,139 +379,356 @@ class EventView(BaseView):
             - Export et sauvegarde des recherches
             - Statistiques et synthèses des résultats
         """
-        try:
-            # Authentification et configuration permissions de recherche
-            current_user = self.auth_service.require_authentication()
-            self.event_controller.set_current_user(current_user)
-
-            # Configuration interface selon département utilisateur
-            role_info = ""
-            if current_user.is_support:
-                role_info = " (MES ASSIGNATIONS)"
-            elif current_user.is_commercial:
-                role_info = " (MES CONTRATS)"
-
-            self.display_info(f"=== RECHERCHE D'EVENEMENTS{role_info} ===")
-
-            # Construction interactive des critères de recherche
-            criteria = {}
-
-            # Critère nom événement
-            name = self.get_user_input("Nom de l'événement (optionnel)")
-            if name:
-                criteria['name'] = name
-
-            # Critère lieu événement
-            location = self.get_user_input("Lieu (optionnel)")
-            if location:
-                criteria['location'] = location
-
-            # Critère client associé
-            client_name = self.get_user_input("Nom du client (optionnel)")
-            if client_name:
-                criteria['client_name'] = client_name
-
-            # Critère date de début avec validation
-            start_date_str = self.get_user_input("Date de début (YYYY-MM-DD, optionnel)")
-            if start_date_str:
-                try:
-                    from datetime import datetime
-                    criteria['start_date'] = datetime.strptime(start_date_str, '%Y-%m-%d')
-                except ValueError:
-                    self.display_error("Format de date invalide. Utilisez YYYY-MM-DD")
-                    return
-
-            # Validation présence critères de recherche
-            if not criteria:
-                self.display_info(EVENT_MESSAGES["no_search_criteria"])
+        # Configuration interface selon département utilisateur
+        role_info = self.role_suffix(self._ASSIGNMENT_SUFFIXES)
+
+        self.display_info(f"=== RECHERCHE D'EVENEMENTS{role_info} ===")
+
+        # Construction interactive des critères de recherche
+        criteria = {}
+
+        # Critère nom événement
+        name = self.get_user_input("Nom de l'événement (optionnel)")
+        if name:
+            criteria['name'] = name
+
+        # Critère lieu événement
+        location = self.get_user_input("Lieu (optionnel)")
+        if location:
+            criteria['location'] = location
+
+        # Critère client associé
+        client_name = self.get_user_input("Nom du client (optionnel)")
+        if client_name:
+            criteria['client_name'] = client_name
+
+        # Critère date de début avec validation
+        start_date_str = self.get_user_input("Date de début (YYYY-MM-DD, optionnel)")
+        if start_date_str:
+            try:
+                criteria['start_date'] = _parse_date(start_date_str)
+            except ValueError:
+                self.display_error("Format de date invalide. Utilisez YYYY-MM-DD")
                 return
 
-            # Exécution recherche avec critères validés
-            events = self.event_controller.search_events(**criteria)
+        # Validation présence critères de recherche
+        if not criteria:
+            self.display_info(EVENT_MESSAGES["no_search_criteria"])
+            return
+
+        # Exécution recherche : résultats affichés lot par lot au fil de la lecture
+        total, complete = self._stream_events_table(
+            self.event_controller.iter_search_event_rows(self.PAGE_SIZE, **criteria)
+        )
 
-            if events:
-                # Affichage résultats de recherche avec statistiques
-                self.display_success(f"{len(events)} événement(s) trouvé(s)")
-                self._display_events_table(events)
+        if total:
+            # Synthèse : total des résultats, ou seulement des lignes vues si l'affichage a été arrêté
+            if complete:
+                self.display_success(f"{total} événement(s) trouvé(s)")
             else:
-                # Aucun résultat pour critères spécifiés
-                self.display_info(EVENT_MESSAGES["no_search_results"])
-
-        except (AuthenticationError, AuthorizationError) as e:
-            self.display_error(VALIDATION_MESSAGES["authorization_error"].format(error=e))
-        except Exception as e:
-            self.display_error(VALIDATION_MESSAGES["general_error"].format(error=e))
-
-    def _display_event_details(self, event: Event):
-        """Afficher les détails d'un événement"""
-        print(f"\n=== EVENEMENT {event.id} ===")
-        print(f"Nom: {event.name}")
-        print(f"Lieu: {event.location}")
-        print(f"Participants: {event.attendees}")
-        print(f"Date début: {event.start_date.strftime('%Y-%m-%d %H:%M')}")
-        print(f"Date fin: {event.end_date.strftime('%Y-%m-%d %H:%M')}")
-        print(f"Durée: {event.duration_days} jour(s)")
-
-        if event.support_contact:
-            print(f"Support assigné: {event.support_contact.full_name}")
+                self.display_success(f"{total} événement(s) affiché(s)")
         else:
-            print("Support assigné: Non assigné")
+            # Aucun résultat pour critères spécifiés
+            self.display_info(EVENT_MESSAGES["no_search_results"])
 
-        print(f"Contrat ID: {event.contract_id}")
-        if event.contract:
-            print(f"Client: {event.contract.client.full_name}")
-            print(f"Entreprise: {event.contract.client.company_name}")
-            print(f"Commercial: {event.contract.commercial_contact.full_name}")
+    def _display_event_details(self, event):
+        """
+        Afficher les détails d'un événement (une seule écriture sur stdout).
+
+        Args:
+            event: Ligne nommée renvoyée par EventController.get_event_by_id_flat
+        """
+        duration = (event.end_date.date() - event.start_date.date()).days + 1
+        lines = [
+            f"\n=== EVENEMENT {event.id} ===",
+            f"Nom: {event.name}",
+            f"Lieu: {event.location}",
+            f"Participants: {event.attendees}",
+            f"Date début: {self.format_datetime(event.start_date)}",
+            f"Date fin: {self.format_datetime(event.end_date)}",
+            f"Durée: {duration} jour(s)",
+            f"Support assigné: {event.support_name or 'Non assigné'}",
+            f"Contrat ID: {event.contract_id}",
+            f"Client: {event.client_name}",
+            f"Entreprise: {event.company_name}",
+            f"Commercial: {event.commercial_name}",
+        ]
 
         if event.notes:
-            print(f"Notes: {event.notes}")
+            lines.append(f"Notes: {event.notes}")
 
-        print(f"Créé le: {event.created_at.strftime('%Y-%m-%d %H:%M')}")
+        lines.append(f"Créé le: {self.format_datetime(event.created_at)}")
         if event.updated_at:
-            print(f"Modifié le: {event.updated_at.strftime('%Y-%m-%d %H:%M')}")
+            lines.append(f"Modifié le: {self.format_datetime(event.updated_at)}")
+
+        sys.stdout.write("\n".join(lines) + "\n")
+
+    def _event_summary(self, event: Event, support_label: str = "Support",
+                       with_created: bool = True) -> str:
+        """Corps des encadrés de création/modification (assemblé en une fois)"""
+        support = event.support_contact
+        lines = [
+            f"ID: {event.id}",
+            f"Nom: {event.name}",
+            f"Contrat: #{event.contract.id}",
+            f"Client: {event.contract.client.full_name}",
+            f"Date de début: {self.format_datetime(event.start_date)}",
+            f"Date de fin: {self.format_datetime(event.end_date)}",
+            f"Lieu: {event.location}",
+            f"Invités: {event.attendees}",
+            f"{support_label}: {support.full_name if support else 'Non assigné'}",
+        ]
+        if with_created:
+            lines.append(f"Créé le: {self.format_datetime(event.created_at)}")
+        return "\n".join(lines)
+
+    def _collect(self, spec, current=None) -> dict:
+        """
+        Saisir les champs d'un formulaire décrit par une spécification.
 
-    def _display_events_table(self, events: List[Event]):
+        Chaque champ est demandé jusqu'à obtenir une valeur valide : conversion
+        selon 'kind' ('text', 'datetime', 'int') puis contrôle métier 'check'
+        (prédicat recevant la valeur et les valeurs connues du formulaire).
+
+        Args:
+            spec: Séquence de champs (voir _EVENT_FORM)
+            current: Objet modifié ; si fourni, la valeur actuelle est affichée
+                     et une saisie vide conserve cette valeur
+
+        Returns:
+            dict: En création, tous les champs (None si optionnel et vide) ;
+                  en modification, uniquement les champs saisis
         """
-        Afficher un tableau formaté des événements avec Rich.
+        known = {} if current is None else {f['key']: getattr(current, f['key']) for f in spec}
+        collected = {}
+        for field in spec:
+            key = field['key']
+            if current is None:
+                label, required = field['label'], field['required']
+            else:
+                shown = self._field_text(field, known[key]) or "Aucune"
+                label, required = f"{field['short']} ({shown})", False
 
-        Cette méthode utilitaire présente les événements dans un
-        format tabulaire professionnel avec codes couleur et styles.
+            while True:
+                raw = self.prompt_user(label, required=required).strip()
+                if not raw:
+                    if current is None:
+                        collected[key] = None
+                    break
+                value, error = self._convert_field(field, raw, known)
+                if error:
+                    self.display_error(error)
+                    continue
+                collected[key] = known[key] = value
+                break
+        return collected
+
+    def _field_text(self, field, value) -> str:
+        """Valeur d'un champ du formulaire telle qu'elle est saisie ('' si vide)"""
+        if value is None:
+            return ""
+        if field['kind'] == 'datetime':
+            return self.format_datetime(value)
+        return str(value)
+
+    @staticmethod
+    def _convert_field(field, raw: str, known: dict):
+        """
+        Convertir et contrôler la saisie d'un champ du formulaire.
 
-        Formatage professionnel:
-            - Tableau Rich avec bordures et couleurs
-            - Colonnes optimisées pour informations essentielles
-            - Codes couleur selon statuts et priorités
-            - Truncation intelligente des textes longs
-            - Alignement et espacement optimal
+        Returns:
+            tuple: (valeur, None) si valide, (None, message d'erreur) sinon
+        """
+        kind = field['kind']
+        if kind == 'datetime':
+            value = _match_dt(raw)
+            if value is None:
+                return None, "Format de date invalide. Utilisez : YYYY-MM-DD HH:MM"
+        elif kind == 'int':
+            if not _INT_RE.fullmatch(raw):
+                return None, "Veuillez saisir un nombre valide"
+            value = int(raw)
+        else:
+            value = raw
+        check = field.get('check')
+        if check is not None and not check(value, known):
+            return None, field['error']
+        return value, None
 
-        Informations affichées:
-            - ID événement et nom complet
-            - Client associé via contrat
-            - Personnel support assigné
-            - Dates de début et fin
-            - Lieu et nombre de participants
-            - Statuts visuels avec indicateurs
+    def _collect_in_editor(self, spec, current) -> Optional[dict]:
         """
-        # Construction données tableau avec formatage
-        header = f"{'ID':<5} {'Nom':<25} {'Client':<20} {'Date':<12} " \
-                 f"{'Lieu':<20} {'Support':<15}"
-        print(header)
-        print("-" * len(header))
+        Modifier tous les champs d'un formulaire en une seule fois dans l'éditeur.
 
-        for event in events:
-            # Formatage client avec troncature intelligente
-            client_name = event.contract.client.full_name[:19] if event.contract else "N/A"
+        Le formulaire est présenté sous forme de lignes 'clé=valeur' préremplies
+        avec les valeurs actuelles ($VISUAL / $EDITOR) ; seules les valeurs
+        modifiées sont converties et contrôlées comme dans _collect.
 
-            # Formatage personnel support avec statut assignation
-            support_name = (event.support_contact.full_name[:14]
-                            if event.support_contact else "Non assigné")
+        Returns:
+            dict: Champs modifiés (vide si rien n'a changé), None si une
+                  valeur est invalide (les erreurs sont affichées)
+        """
+        known = {f['key']: getattr(current, f['key']) for f in spec}
+        original = {f['key']: self._field_text(f, known[f['key']]) for f in spec}
+        template = "\n".join(
+            ["# Modifiez les valeurs puis enregistrez (lignes '#' ignorées)"]
+            + [f"{key}={text}" for key, text in original.items()]
+        ) + "\n"
+
+        edited = click.edit(template, extension=".txt")
+        if edited is None:
+            return {}
+
+        fields = {f['key']: f for f in spec}
+        collected, errors = {}, []
+        for line in edited.splitlines():
+            if not line.strip() or line.lstrip().startswith("#"):
+                continue
+            key, sep, raw = line.partition("=")
+            key, raw = key.strip(), raw.strip()
+            if not sep or key not in fields:
+                errors.append(f"Ligne non reconnue : {line}")
+                continue
+            if raw == original[key] or (not raw and not fields[key]['required']):
+                continue
+            if not raw:
+                errors.append(f"{fields[key]['short']} : {VALIDATION_MESSAGES['information_required']}")
+                continue
+            value, error = self._convert_field(fields[key], raw, known)
+            if error:
+                errors.append(f"{fields[key]['short']} : {error}")
+                continue
+            collected[key] = known[key] = value
+
+        for error in errors:
+            self.display_error(error)
+        return None if errors else collected
+
+    @view_command()
+    def _run_list(self, fetch, header: str, empty: str, suffixes=None):
+        """
+        Gabarit commun des commandes de liste d'événements.
+
+        Authentifie l'utilisateur, récupère les lots via fetch(), affiche
+        l'en-tête puis le tableau au fil des lots, ou le message empty si
+        aucun événement n'est trouvé. Les erreurs sont affichées ici.
+
+        Args:
+            fetch: Appelable retournant un itérable de listes d'événements
+            header: Titre de la liste ('{role}' reçoit le suffixe du rôle)
+            empty: Message affiché si la liste est vide
+            suffixes: Suffixes de titre par département (optionnel)
+        """
+        batches = fetch()
 
-            # Formatage date avec validation existence
-            date_str = event.start_date.strftime('%Y-%m-%d')
+        if suffixes is not None:
+            header = header.format(role=self.role_suffix(suffixes))
+        self.display_info(header)
 
-            # Affichage ligne tableau avec alignement optimal
-            print(f"{event.id:<5} {event.name[:24]:<25} {client_name:<20} "
-                  f"{date_str:<12} {event.location[:19]:<20} {support_name:<15}")
+        total, _ = self._stream_events_table(batches)
+        if not total:
+            self.display_info(empty)
+
+    @staticmethod
+    def _write_lines(lines: List[str]):
+        """Écrire des lignes en un seul appel sur stdout, puis vider le tampon"""
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+
+    def _build_events_table(self, rows: List[EventRow], show_header: bool = True) -> Table:
+        """
+        Construire le tableau Rich d'un lot de lignes EventRow.
+
+        Les lignes sont déjà projetées par le contrôleur (noms du client et
+        du support compris) : aucun objet Contract/Client n'est parcouru.
+        Les largeurs étant fixes, des tableaux successifs sans en-tête
+        restent alignés sur le premier.
+        """
+        table = Table(show_header=show_header, header_style="bold cyan",
+                      box=None, pad_edge=False)
+        for title, width in self._TABLE_COLUMNS:
+            table.add_column(title, width=width, no_wrap=True, overflow="ellipsis")
+        for row in rows:
+            # Text : les noms saisis ne sont pas interprétés comme balisage Rich
+            table.add_row(str(row.id), Text(row.name), Text(row.client_name),
+                          row.date, Text(row.location), Text(row.support_name))
+        return table
+
+    def _stream_events_table(self, batches) -> Tuple[int, bool]:
+        """
+        Afficher le tableau des événements par pages de PAGE_SIZE lignes.
+
+        Les lots reçus, de taille fixe ou variable (fenêtres de temps), sont
+        regroupés en pages complètes ; l'en-tête accompagne la première page.
+        Le lot suivant est lu avant d'afficher une page, pour savoir s'il
+        reste des lignes : en terminal interactif, la confirmation n'est
+        demandée qu'après une page suivie d'autres lignes, et un refus
+        arrête la lecture.
+
+        Args:
+            batches: Itérable de listes de lignes EventRow
+
+        Returns:
+            tuple: (nombre d'événements affichés, True si tous les lots ont été lus)
+        """
+        paged = sys.stdin.isatty()
+        page_size = self.PAGE_SIZE
+        total = 0
+        batches_iter = iter(batches)
+        pending: List[EventRow] = []
+        exhausted = False
+        try:
+            while True:
+                # Une page complète plus au moins une ligne, ou la fin des lots
+                while len(pending) <= page_size and not exhausted:
+                    rows = next(batches_iter, None)
+                    if rows is None:
+                        exhausted = True
+                    else:
+                        pending.extend(rows)
+
+                page = pending[:page_size]
+                del pending[:page_size]
+                if page:
+                    self.console.print(self._build_events_table(page, show_header=not total))
+                    total += len(page)
+                if not pending:
+                    return total, True
+                if paged and not self.confirm_action(EVENT_MESSAGES["show_next_page"]):
+                    return total, False
+        finally:
+            # Lecture interrompue : le générateur libère aussitôt son curseur
+            close = getattr(batches, 'close', None)
+            if close is not None:
+                close()
+
+    def _iter_upcoming_batches(self, days_ahead: int):
+        """
+        Produire les événements à venir (lignes EventRow) par fenêtres de temps adaptatives.
+
+        La fenêtre commence à un jour, grandit tant que les lots restent
+        sous UPCOMING_BATCH_TARGET et rétrécit si un lot est trop gros ou
+        trop lent à obtenir.
+        """
+        start = datetime.now()
+        horizon = start + timedelta(days=days_ahead)
+        window = timedelta(days=1)
+
+        while start < horizon:
+            end = min(start + window, horizon)
+            started_at = time.monotonic()
+            events = self.event_controller.get_upcoming_event_rows_range(
+                start, end, include_end=(end == horizon)
+            )
+            elapsed = time.monotonic() - started_at
+            yield events
+
+            # Adaptation de la fenêtre selon la taille et la durée de la tranche
+            if (elapsed > self.UPCOMING_BATCH_MAX_SECONDS
+                    or len(events) > 2 * self.UPCOMING_BATCH_TARGET):
+                window = max(window / self.UPCOMING_BATCH_GROWTH, timedelta(hours=1))
+            elif len(events) < self.UPCOMING_BATCH_TARGET:
+                window = window * self.UPCOMING_BATCH_GROWTH
+            start = end
 
     def _get_available_supports(self):
         """
@@ -499,15 +744,32 @@ class EventView(BaseView):
             - Validation disponibilité et permissions
 
         Retour:
-            - Liste des utilisateurs SUPPORT actifs
-            - Données complètes pour sélection
+            - Lignes (id, full_name, email) des utilisateurs SUPPORT
+            - Triées par nom pour un menu stable
             - Support pour interface assignation
         """
-        # Requête base de données pour personnel support
-        from src.models.user import User, Department
-        supports = self.db.query(User).filter(User.department == Department.SUPPORT).all()
+        # Réutilisation de la liste récente (stable pendant une session CLI)
+        if (self._supports_cache is not None
+                and time.monotonic() - self._supports_cache_ts < self.SUPPORTS_CACHE_TTL):
+            return self._supports_cache
+
+        # Seules les colonnes du menu sont lues : aucun objet User n'est chargé
+        supports = (
+            self.db.query(User.id, User.full_name, User.email)
+            .filter(User.department == Department.SUPPORT)
+            .order_by(User.full_name)
+            .all()
+        )
+        EventView._supports_cache = supports
+        EventView._supports_cache_ts = time.monotonic()
         return supports
 
+    @staticmethod
+    def invalidate_supports_cache():
+        """Forcer le rechargement de la liste des supports (création/suppression)"""
+        EventView._supports_cache = None
+        EventView._supports_cache_ts = 0.0
+
     def _prompt_support_selection(self, current_support_id=None):
         """
         Interface interactive pour sélectionner un personnel support.
@@ -543,34 +805,24 @@ class EventView(BaseView):
             self.display_warning("Aucun utilisateur support disponible")
             return None
 
-        # Affichage menu de sélection avec options claires
-        print("\nSupport assigné :")
-        print("  0 - Aucun support (non assigné)")
-
-        # Liste numérotée avec indications visuelles
+        # Affichage menu de sélection (liste numérotée, écrite en une fois) et
+        # table des choix valides : saisie -> id du support (None = aucun)
+        lines = ["\nSupport assigné :", "  0 - Aucun support (non assigné)"]
+        choices = {"0": None}
         for i, support in enumerate(supports, 1):
             current_marker = " (actuel)" if current_support_id == support.id else ""
-            print(f"  {i} - {support.full_name} ({support.email}){current_marker}")
+            lines.append(f"  {i} - {support.full_name} ({support.email}){current_marker}")
+            choices[str(i)] = support.id
+        self._write_lines(lines)
 
-        # Boucle de validation saisie utilisateur
+        # Boucle de validation : toute saisie absente de la table est refusée
         while True:
-            try:
-                choice = self.prompt_user(f"Votre choix [0-{len(supports)}]", required=True)
-                choice_int = int(choice)
-
-                if choice_int == 0:
-                    # Choix désassignation
-                    return None
-                elif 1 <= choice_int <= len(supports):
-                    # Choix support valide
-                    return supports[choice_int - 1].id
-                else:
-                    # Choix hors limites
-                    self.display_error(f"Choix invalide. Choisissez entre 0 et {len(supports)}")
-            except ValueError:
-                # Saisie non numérique
-                self.display_error("Veuillez saisir un nombre valide")
+            choice = self.prompt_user(f"Votre choix [0-{len(supports)}]", required=True).strip()
+            if choice in choices:
+                return choices[choice]
+            self.display_error(f"Choix invalide. Choisissez entre 0 et {len(supports)}")
 
+    @view_command("Erreur lors de la création de l'événement: {error}")
     def create_event_command_for_contract(self, contract_id: int):
         """
         Créer un nouvel événement pour un contrat spécifique.
@@ -591,282 +843,102 @@ class EventView(BaseView):
             - Validation contraintes temporelles et logistiques
             - Enregistrement avec liens contrat-événement
         """
-        from datetime import datetime
-
-        try:
-            # Authentification et configuration permissions
-            current_user = self.auth_service.require_authentication()
-            self.event_controller.set_current_user(current_user)
-
-            # Validation et récupération du contrat cible
-            from src.controllers.contract_controller import ContractController
-            contract_controller = ContractController(self.db)
-            contract_controller.set_current_user(current_user)
-
-            contract = contract_controller.get_contract_by_id(contract_id)
-            if not contract:
-                self.display_error(f"Contrat avec l'ID {contract_id} introuvable")
-                return
-
-            # Vérification statut contrat pour création événement
-            from src.models.contract import ContractStatus
-            if contract.status != ContractStatus.SIGNED:
-                self.display_error("Seuls les contrats signés peuvent avoir des événements")
-                return
-
-            # En-tête de création avec contexte contrat
-            self.display_info(f"\n─────────── CRÉATION D'UN ÉVÉNEMENT POUR LE CONTRAT {contract.id} ───────────")
-
-            # Affichage informations contrat pour contexte
-            self.display_info(f"\nContrat : #{contract.id}")
-            self.display_info(f"Client : {contract.client.full_name}")
-            self.display_info(f"Entreprise : {contract.client.company_name}")
-            self.display_info(f"Commercial : {contract.commercial_contact.full_name}")
-
-            print()
-
-            # Saisie des données de l'événement
-            name = self.prompt_user("Nom de l'événement", required=True)
-
-            # Date et heure de début
-            while True:
-                try:
-                    start_date_str = self.prompt_user("Date de début (YYYY-MM-DD HH:MM)", required=True)
-                    start_date = datetime.strptime(start_date_str, "%Y-%m-%d %H:%M")
-
-                    if start_date < datetime.now():
-                        self.display_error("La date de début ne peut pas être dans le passé")
-                        continue
-                    break
-                except ValueError:
-                    self.display_error("Format de date invalide. Utilisez : YYYY-MM-DD HH:MM")
-
-            # Date et heure de fin
-            while True:
-                try:
-                    end_date_str = self.prompt_user("Date de fin (YYYY-MM-DD HH:MM)", required=True)
-                    end_date = datetime.strptime(end_date_str, "%Y-%m-%d %H:%M")
-
-                    if end_date <= start_date:
-                        self.display_error("La date de fin doit être après la date de début")
-                        continue
-                    break
-                except ValueError:
-                    self.display_error("Format de date invalide. Utilisez : YYYY-MM-DD HH:MM")
-
-            # Lieu
-            location = self.prompt_user("Lieu de l'événement", required=True)
-
-            # Nombre d'invités
-            while True:
-                try:
-                    attendees_str = self.prompt_user("Nombre d'invités", required=True)
-                    attendees = int(attendees_str)
-                    if attendees < 0:
-                        self.display_error("Le nombre d'invités doit être positif")
-                        continue
-                    break
-                except ValueError:
-                    self.display_error("Veuillez saisir un nombre valide")
-
-            # Notes (optionnel)
-            notes = self.prompt_user("Notes sur l'événement (optionnel)")
-            if not notes.strip():
-                notes = None
-
-            # Sélection du support (optionnel)
-            support_contact_id = self._prompt_support_selection()
-
-            # Créer l'événement
-            event = self.event_controller.create_event(
-                contract_id=contract_id,
-                name=name,
-                start_date=start_date,
-                end_date=end_date,
-                location=location,
-                attendees=attendees,
-                notes=notes,
-                support_contact_id=support_contact_id
-            )
-
-            self.display_success_box(
-                "ÉVÉNEMENT CRÉÉ",
-                f"Événement créé avec succès !\n\n"
-                f"ID: {event.id}\n"
-                f"Nom: {event.name}\n"
-                f"Contrat: #{event.contract.id}\n"
-                f"Client: {event.contract.client.full_name}\n"
-                f"Date de début: {event.start_date.strftime('%Y-%m-%d %H:%M')}\n"
-                f"Date de fin: {event.end_date.strftime('%Y-%m-%d %H:%M')}\n"
-                f"Lieu: {event.location}\n"
-                f"Invités: {event.attendees}\n"
-                f"Support assigné: {'Non assigné' if not event.support_contact else event.support_contact.full_name}"
+        # Résumé du contrat cible, filtré sur le statut signé par la base
+        # (permissions vérifiées avant la saisie du formulaire)
+        contract = self.event_controller.get_signed_contract_summary(contract_id)
+        if not contract:
+            self.display_error(
+                EVENT_MESSAGES["signed_contract_not_found"].format(contract_id=contract_id)
             )
+            return
+
+        # En-tête de création et contexte contrat, écrits en un seul bloc
+        self.display_info_lines((
+            f"\n─────────── CRÉATION D'UN ÉVÉNEMENT POUR LE CONTRAT {contract.id} ───────────",
+            f"\nContrat : #{contract.id}",
+            f"Client : {contract.client_name}",
+            f"Entreprise : {contract.company_name}",
+            f"Commercial : {contract.commercial_name}",
+        ))
+        print()
+
+        # Saisie des données de l'événement (formulaire déclaratif)
+        values = self._collect(self._EVENT_FORM)
+
+        # Sélection du support (optionnel)
+        support_contact_id = self._prompt_support_selection()
+
+        # Créer l'événement
+        event = self.event_controller.create_event(
+            contract_id=contract_id,
+            support_contact_id=support_contact_id,
+            **values
+        )
+
+        self.display_success_box(
+            "ÉVÉNEMENT CRÉÉ",
+            "Événement créé avec succès !\n\n"
+            + self._event_summary(event, support_label="Support assigné", with_created=False)
+        )
+
+    @view_command("Erreur lors de la mise à jour de l'événement: {error}")
+    def update_event_command(self, event_id: int, use_editor: bool = False):
+        """
+        Mettre à jour un événement existant
 
-        except (AuthenticationError, AuthorizationError) as e:
-            self.display_error(VALIDATION_MESSAGES["authorization_error"].format(error=e))
-        except Exception as e:
-            self.display_error(f"Erreur lors de la création de l'événement: {e}")
-
-    def update_event_command(self, event_id: int):
-        """Mettre à jour un événement existant"""
-        from datetime import datetime
-
-        try:
-            current_user = self.auth_service.require_authentication()
-            self.event_controller.set_current_user(current_user)
-
-            # Récupérer l'événement
-            event = self.event_controller.get_event_by_id(event_id)
-            if not event:
-                self.display_error(f"Événement avec l'ID {event_id} introuvable")
+        Args:
+            event_id: Identifiant de l'événement
+            use_editor: Saisir tous les champs en une fois dans l'éditeur
+                        ($VISUAL / $EDITOR) au lieu de champ par champ
+        """
+        # Récupérer l'événement
+        event = self.event_controller.get_event_by_id(event_id)
+        if not event:
+            self.display_error(f"Événement avec l'ID {event_id} introuvable")
+            return
+
+        self.display_info(f"\n────────────── MODIFICATION DE L'ÉVÉNEMENT {event.id} ──────────────")
+
+        # Afficher les détails actuels
+        self.display_info_box("DÉTAILS DE L'ÉVÉNEMENT", self._event_summary(event))
+
+        # Saisie des champs modifiés (même formulaire que la création) : en une
+        # seule fois dans l'éditeur si demandé (--editor), sinon champ par champ
+        if use_editor:
+            update_data = self._collect_in_editor(self._EVENT_FORM, event)
+            if update_data is None:
                 return
-
-            self.display_info(f"\n────────────── MODIFICATION DE L'ÉVÉNEMENT {event.id} ──────────────")
-
-            # Afficher les détails actuels
-            self.display_info_box(
-                "DÉTAILS DE L'ÉVÉNEMENT",
-                f"ID: {event.id}\n"
-                f"Nom: {event.name}\n"
-                f"Contrat: #{event.contract.id}\n"
-                f"Client: {event.contract.client.full_name}\n"
-                f"Date de début: {event.start_date.strftime('%Y-%m-%d %H:%M')}\n"
-                f"Date de fin: {event.end_date.strftime('%Y-%m-%d %H:%M')}\n"
-                f"Lieu: {event.location}\n"
-                f"Invités: {event.attendees}\n"
-                f"Support: {'Non assigné' if not event.support_contact else event.support_contact.full_name}\n"
-                f"Créé le: {event.created_at.strftime('%Y-%m-%d %H:%M')}"
-            )
-
+        else:
             print("\nLaissez vide pour conserver la valeur actuelle")
+            update_data = self._collect(self._EVENT_FORM, current=event)
 
-            # Nom de l'événement
-            name = self.prompt_user(f"Nom ({event.name})")
-            if not name.strip():
-                name = None
-
-            # Date de début
-            start_date = None
-            start_input = self.prompt_user(f"Date de début ({event.start_date.strftime('%Y-%m-%d %H:%M')})")
-            if start_input.strip():
-                try:
-                    start_date = datetime.strptime(start_input, "%Y-%m-%d %H:%M")
-                    if start_date < datetime.now():
-                        self.display_error("La date de début ne peut pas être dans le passé")
-                        return
-                except ValueError:
-                    self.display_error("Format de date invalide")
-                    return
-
-            # Date de fin
-            end_date = None
-            end_input = self.prompt_user(f"Date de fin ({event.end_date.strftime('%Y-%m-%d %H:%M')})")
-            if end_input.strip():
-                try:
-                    end_date = datetime.strptime(end_input, "%Y-%m-%d %H:%M")
-                    check_start = start_date if start_date is not None else event.start_date
-                    if end_date <= check_start:
-                        self.display_error("La date de fin doit être après la date de début")
-                        return
-                except ValueError:
-                    self.display_error("Format de date invalide")
-                    return
-
-            # Lieu
-            location = self.prompt_user(f"Lieu ({event.location})")
-            if not location.strip():
-                location = None
-
-            # Nombre d'invités
-            attendees = None
-            attendees_input = self.prompt_user(f"Nombre d'invités ({event.attendees})")
-            if attendees_input.strip():
-                try:
-                    attendees = int(attendees_input)
-                    if attendees < 0:
-                        self.display_error("Le nombre d'invités doit être positif")
-                        return
-                except ValueError:
-                    self.display_error("Nombre invalide")
-                    return
-
-            # Notes
-            notes = self.prompt_user(f"Notes ({event.notes or 'Aucune'})")
-            if not notes.strip():
-                notes = None
-
-            # Support assigné
-            support_contact_id = None
-            change_support = self.prompt_user("Changer le support assigné ? [y/n]")
-            if change_support.lower() in ['y', 'yes', 'o', 'oui']:
-                current_support_id = event.support_contact_id
-                support_contact_id = self._prompt_support_selection(current_support_id)
-
-            # Mettre à jour l'événement
-            update_data = {}
-            if name is not None:
-                update_data['name'] = name
-            if start_date is not None:
-                update_data['start_date'] = start_date
-            if end_date is not None:
-                update_data['end_date'] = end_date
-            if location is not None:
-                update_data['location'] = location
-            if attendees is not None:
-                update_data['attendees'] = attendees
-            if notes is not None:
-                update_data['notes'] = notes
-            if support_contact_id is not None or change_support.lower() in ['y', 'yes', 'o', 'oui']:
-                update_data['support_contact_id'] = support_contact_id
-
-            updated_event = self.event_controller.update_event(
-                event_id=event_id,
-                **update_data
+        # Support assigné (None est une valeur valide : désassignation)
+        change_support = self.prompt_user("Changer le support assigné ? [y/n]")
+        if change_support.lower() in ('y', 'yes', 'o', 'oui'):
+            update_data['support_contact_id'] = self._prompt_support_selection(
+                event.support_contact_id
             )
 
-            self.display_success(EVENT_MESSAGES["update_success"])
-
-            support_display = ("Non assigné" if not updated_event.support_contact
-                               else updated_event.support_contact.full_name)
-
-            # Afficher les nouveaux détails
-            self.display_info_box(
-                "DÉTAILS DE L'ÉVÉNEMENT",
-                f"ID: {updated_event.id}\n"
-                f"Nom: {updated_event.name}\n"
-                f"Contrat: #{updated_event.contract.id}\n"
-                f"Client: {updated_event.contract.client.full_name}\n"
-                f"Date de début: {updated_event.start_date.strftime('%Y-%m-%d %H:%M')}\n"
-                f"Date de fin: {updated_event.end_date.strftime('%Y-%m-%d %H:%M')}\n"
-                f"Lieu: {updated_event.location}\n"
-                f"Invités: {updated_event.attendees}\n"
-                f"Support: {support_display}\n"
-                f"Créé le: {updated_event.created_at.strftime('%Y-%m-%d %H:%M')}"
-            )
+        # Mettre à jour l'événement
+        updated_event = self.event_controller.update_event(
+            event_id=event_id,
+            **update_data
+        )
 
-        except (AuthenticationError, AuthorizationError) as e:
-            self.display_error(VALIDATION_MESSAGES["authorization_error"].format(error=e))
-        except Exception as e:
-            self.display_error(f"Erreur lors de la mise à jour de l'événement: {e}")
+        self.display_success(EVENT_MESSAGES["update_success"])
 
+        # Afficher les nouveaux détails
+        self.display_info_box("DÉTAILS DE L'ÉVÉNEMENT", self._event_summary(updated_event))
+
+    @view_command("Erreur lors de l'assignation: {error}")
     def assign_support_command(self, event_id: int, support_id: int):
         """Assigner un support à un événement"""
-        try:
-            current_user = self.auth_service.require_authentication()
-            self.event_controller.set_current_user(current_user)
-
-            updated_event = self.event_controller.assign_support_to_event(event_id, support_id)
-
-            self.display_success_box(
-                "SUPPORT ASSIGNÉ",
-                f"Support assigné avec succès !\n\n"
-                f"Événement: {updated_event.name}\n"
-                f"Support: {updated_event.support_contact.full_name}\n"
-                f"Client: {updated_event.contract.client.full_name}"
-            )
-
-        except (AuthenticationError, AuthorizationError) as e:
-            self.display_error(VALIDATION_MESSAGES["authorization_error"].format(error=e))
-        except Exception as e:
-            self.display_error(f"Erreur lors de l'assignation: {e}")
+        updated_event = self.event_controller.assign_support_to_event(event_id, support_id)
+
+        self.display_success_box(
+            "SUPPORT ASSIGNÉ",
+            f"Support assigné avec succès !\n\n"
+            f"Événement: {updated_event.name}\n"
+            f"Support: {updated_event.support_contact.full_name}\n"
+            f"Client: {updated_event.contract.client.full_name}"
+        )
@@ -35,13 +35,33 @@ Gestion des données RH:
 Fichier: src/views/user_view.py
 """
 
+from functools import cached_property, wraps
+from types import MappingProxyType
 from typing import Optional
 from src.controllers.user_controller import UserController
-from src.models.user import User
-from src.utils.auth_utils import AuthenticationError, AuthorizationError
-from src.utils.validators import ValidationError
-from src.config.messages import USER_MESSAGES, STATUS_MESSAGES, VALIDATION_MESSAGES
-from .base_view import BaseView
+from src.models.user import Department, User
+from src.config.messages import USER_MESSAGES, STATUS_MESSAGES
+from .base_view import BaseView, view_command
+from .event_view import EventView
+
+
+def gestion_command(permission_message: str):
+    """
+    Décorateur des commandes réservées au département GESTION.
+
+    Reprend view_command (authentification via require_user, affichage
+    des erreurs) et refuse la commande avec permission_message si
+    l'utilisateur n'est pas gestionnaire.
+    """
+    def decorator(method):
+        @wraps(method)
+        def wrapper(self, *args, **kwargs):
+            if not self.require_user().is_gestion:
+                self.display_error(permission_message)
+                return None
+            return method(self, *args, **kwargs)
+        return view_command()(wrapper)
+    return decorator
 
 
 class UserView(BaseView):
@@ -74,16 +94,44 @@ class UserView(BaseView):
         - Navigation intuitive dans l'annuaire
     """
 
-    def __init__(self):
+    # Colonnes du tableau et gabarits des panneaux, construits une seule fois
+    _TABLE_COLUMNS = (
+        {'name': 'ID', 'style': 'cyan', 'justify': 'right'},
+        {'name': 'Nom', 'style': 'white'},
+        {'name': 'Email', 'style': 'blue'},
+        {'name': 'Département', 'style': 'green'},
+        {'name': 'N° Employé', 'style': 'yellow'},
+    )
+    _USER_SUMMARY = (
+        "[cyan]ID:[/cyan] {id}\n"
+        "[cyan]Nom:[/cyan] {full_name}\n"
+        "[cyan]Email:[/cyan] {email}\n"
+        "[cyan]Département:[/cyan] {department}\n"
+        "[cyan]Numéro d'employé:[/cyan] {employee_number}\n"
+    )
+    # Choix de département proposés à la création et à la modification :
+    # numéro saisi -> Department transmis tel quel au contrôleur, et menu affiché
+    _DEPARTMENT_CHOICES = MappingProxyType(
+        {str(index): department for index, department in enumerate(Department, 1)}
+    )
+    _DEPARTMENT_MENU = MappingProxyType(
+        {key: department.value for key, department in _DEPARTMENT_CHOICES.items()}
+    )
+    _CREATED_PANEL = "\n[bold green]Collaborateur créé avec succès ![/bold green]\n\n" + _USER_SUMMARY
+    _DETAILS_PANEL = "\n" + _USER_SUMMARY + "[cyan]Créé le:[/cyan] {created_at}\n"
+
+    @cached_property
+    def user_controller(self) -> UserController:
         """
-        Initialiser la vue d'administration utilisateurs.
+        Contrôleur utilisateur créé à la première utilisation puis réutilisé.
 
-        Configure le contrôleur utilisateur avec session DB
-        et permissions administratives requises.
+        La vue s'instancie ainsi sans ouvrir de session ni lire le jeton :
+        la session partagée (ViewSession) n'est sollicitée que par une
+        commande qui en a besoin.
         """
-        super().__init__()
-        self.user_controller = self.setup_controller(UserController)
+        return self.setup_controller(UserController)
 
+    @gestion_command(USER_MESSAGES["permission_create_only"])
     def create_user_command(self):
         """
         Interface de création d'un nouveau collaborateur.
@@ -110,304 +158,237 @@ class UserView(BaseView):
             - Département d'affectation (enum validé)
             - Mot de passe sécurisé (politique appliquée)
         """
-        try:
-            current_user = self.auth_service.require_authentication()
-            self.user_controller.set_current_user(current_user)
-
-            if not current_user.is_gestion:
-                self.display_error(USER_MESSAGES["permission_create_only"])
-                return
-
-            self.display_header(USER_MESSAGES["create_header"])
-
-            # Collecter les informations utilisateur
-            email = self.get_user_input(USER_MESSAGES["prompt_email"])
-            full_name = self.get_user_input(USER_MESSAGES["prompt_full_name"])
-            password = self.get_user_input(USER_MESSAGES["prompt_password"], password=True)
-
-            departments = {
-                '1': 'commercial',
-                '2': 'support',
-                '3': 'gestion'
-            }
-            department_choice = self.get_user_choice(
-                departments, USER_MESSAGES["prompt_department"]
+        self.display_header(USER_MESSAGES["create_header"])
+
+        # Collecter les informations utilisateur
+        email = self.get_user_input(USER_MESSAGES["prompt_email"])
+        full_name = self.get_user_input(USER_MESSAGES["prompt_full_name"])
+        password = self.get_user_input(USER_MESSAGES["prompt_password"], password=True)
+
+        department_choice = self.get_user_choice(
+            self._DEPARTMENT_MENU, USER_MESSAGES["prompt_department"]
+        )
+
+        with self.console.status(STATUS_MESSAGES["creating_user"]):
+            new_user = self.user_controller.create_user(
+                email=email,
+                password=password,
+                full_name=full_name,
+                department=self._DEPARTMENT_CHOICES[department_choice]
             )
+        if new_user.is_support:
+            EventView.invalidate_supports_cache()
 
-            with self.console.status(STATUS_MESSAGES["creating_user"]):
-                new_user = self.user_controller.create_user(
-                    email=email,
-                    password=password,
-                    full_name=full_name,
-                    department=departments[department_choice]
-                )
-
-            success_content = f"""
-[bold green]Collaborateur créé avec succès ![/bold green]
-
-[cyan]ID:[/cyan] {new_user.id}
-[cyan]Nom:[/cyan] {new_user.full_name}
-[cyan]Email:[/cyan] {new_user.email}
-[cyan]Département:[/cyan] {new_user.department.value.upper()}
-[cyan]Numéro d'employé:[/cyan] {new_user.employee_number}
-            """
-            self.display_panel(success_content, USER_MESSAGES["title_user_created"], style="green")
-
-        except ValidationError as e:
-            self.display_error(VALIDATION_MESSAGES["validation_failed"].format(error=e))
-        except (AuthenticationError, AuthorizationError) as e:
-            self.display_error(VALIDATION_MESSAGES["authorization_error"].format(error=e))
-        except Exception as e:
-            self.display_error(VALIDATION_MESSAGES["general_error"].format(error=e))
-
-    def list_users_command(self, department: Optional[str] = None):
-        """Lister les utilisateurs (gestion uniquement)"""
-        try:
-            current_user = self.auth_service.require_authentication()
-            self.user_controller.set_current_user(current_user)
-
-            if not current_user.is_gestion:
-                self.display_error(USER_MESSAGES["permission_list_only"])
-                return
-
-            if department:
-                self.display_header(USER_MESSAGES["list_header_department"].format(department=department.upper()))
-            else:
-                self.display_header(USER_MESSAGES["list_header"])
-
-            users = self.user_controller.get_all_users(department)
-
-            if not users:
-                self.display_info(USER_MESSAGES["no_users_found"])
-                return
-
-            self._display_users_table(users)
+        self.display_panel(self._CREATED_PANEL.format(**self._panel_fields(new_user)),
+                           USER_MESSAGES["title_user_created"], style="green")
 
-        except (AuthenticationError, AuthorizationError) as e:
-            self.display_error(VALIDATION_MESSAGES["authorization_error"].format(error=e))
-        except Exception as e:
-            self.display_error(VALIDATION_MESSAGES["general_error"].format(error=e))
+    @gestion_command(USER_MESSAGES["permission_list_only"])
+    def list_users_command(self, department: Optional[str] = None,
+                           page: int = 1, page_size: int = 50):
+        """
+        Lister les utilisateurs page par page (gestion uniquement).
 
+        Seule la page demandée est lue ; un comptage avec les mêmes filtres
+        fournit le nombre de pages affiché en pied de tableau.
+        """
+        if department:
+            self.display_header(USER_MESSAGES["list_header_department"].format(department=department.upper()))
+        else:
+            self.display_header(USER_MESSAGES["list_header"])
+
+        total = self.user_controller.count_users(department)
+        if not total:
+            self.display_info(USER_MESSAGES["no_users_found"])
+            return
+
+        pages = -(-total // page_size)
+        if page > pages:
+            self.display_error(USER_MESSAGES["page_out_of_range"].format(page=page, pages=pages))
+            return
+
+        self._display_users_table(self.user_controller.iter_users(
+            department, offset=(page - 1) * page_size, limit=page_size
+        ))
+        self.display_info(USER_MESSAGES["page_footer"].format(page=page, pages=pages, total=total))
+        if page < pages:
+            self.display_info(USER_MESSAGES["page_next_hint"].format(page=page + 1))
+
+    @gestion_command(USER_MESSAGES["permission_update_only"])
     def update_user_command(self, user_id: int):
         """Modifier un collaborateur (gestion uniquement)"""
-        try:
-            current_user = self.auth_service.require_authentication()
-            self.user_controller.set_current_user(current_user)
-
-            if not current_user.is_gestion:
-                self.display_error(USER_MESSAGES["permission_update_only"])
-                return
+        user = self.user_controller.get_user_by_id(user_id)
+        if not user:
+            self.display_error(USER_MESSAGES["user_not_found"])
+            return
 
-            user = self.user_controller.get_user_by_id(user_id)
-            if not user:
-                self.display_error(USER_MESSAGES["user_not_found"])
-                return
+        self.display_header(USER_MESSAGES["update_header"].format(name=user.full_name))
+        self._display_user_details(user)
 
-            self.display_header(USER_MESSAGES["update_header"].format(name=user.full_name))
-            self._display_user_details(user)
+        self.console.print(USER_MESSAGES["update_instruction"])
 
-            self.console.print(USER_MESSAGES["update_instruction"])
+        # Collecter les modifications
+        update_data = {}
 
-            # Collecter les modifications
-            update_data = {}
+        new_email = self.get_user_input(USER_MESSAGES["prompt_email_current"].format(current=user.email))
+        if new_email:
+            update_data['email'] = new_email
 
-            new_email = self.get_user_input(USER_MESSAGES["prompt_email_current"].format(current=user.email))
-            if new_email:
-                update_data['email'] = new_email
+        new_full_name = self.get_user_input(
+            USER_MESSAGES["prompt_full_name_current"].format(current=user.full_name)
+        )
+        if new_full_name:
+            update_data['full_name'] = new_full_name
 
-            new_full_name = self.get_user_input(
-                USER_MESSAGES["prompt_full_name_current"].format(current=user.full_name)
+        if self.confirm_action(USER_MESSAGES["confirm_change_department"]):
+            current_dept = user.department.value
+            self.console.print(USER_MESSAGES["current_department"].format(department=current_dept))
+            department_choice = self.get_user_choice(
+                self._DEPARTMENT_MENU, USER_MESSAGES["prompt_new_department"]
             )
-            if new_full_name:
-                update_data['full_name'] = new_full_name
-
-            if self.confirm_action(USER_MESSAGES["confirm_change_department"]):
-                departments = {
-                    '1': 'commercial',
-                    '2': 'support',
-                    '3': 'gestion'
-                }
-                current_dept = user.department.value
-                self.console.print(USER_MESSAGES["current_department"].format(department=current_dept))
-                department_choice = self.get_user_choice(
-                    departments, USER_MESSAGES["prompt_new_department"]
-                )
-                update_data['department'] = departments[department_choice]
+            update_data['department'] = self._DEPARTMENT_CHOICES[department_choice]
 
-            if self.confirm_action(USER_MESSAGES["confirm_change_password"]):
-                new_password = self.get_user_input(USER_MESSAGES["prompt_new_password"], password=True)
-                update_data['password'] = new_password
-
-            if not update_data:
-                self.display_info(USER_MESSAGES["no_modifications"])
-                return
+        if self.confirm_action(USER_MESSAGES["confirm_change_password"]):
+            new_password = self.get_user_input(USER_MESSAGES["prompt_new_password"], password=True)
+            update_data['password'] = new_password
 
-            with self.console.status(STATUS_MESSAGES["updating_user"]):
-                updated_user = self.user_controller.update_user(user_id, **update_data)
+        if not update_data:
+            self.display_info(USER_MESSAGES["no_modifications"])
+            return
 
-            self.display_success(USER_MESSAGES["update_success"])
-            self._display_user_details(updated_user)
+        was_support = user.is_support
+        with self.console.status(STATUS_MESSAGES["updating_user"]):
+            updated_user = self.user_controller.update_user(user_id, **update_data)
+        # Nom, email ou département : le menu d'assignation des supports change
+        if was_support or updated_user.is_support:
+            EventView.invalidate_supports_cache()
 
-        except ValidationError as e:
-            self.display_error(VALIDATION_MESSAGES["validation_failed"].format(error=e))
-        except (AuthenticationError, AuthorizationError) as e:
-            self.display_error(VALIDATION_MESSAGES["authorization_error"].format(error=e))
-        except Exception as e:
-            self.display_error(VALIDATION_MESSAGES["general_error"].format(error=e))
+        self.display_success(USER_MESSAGES["update_success"])
+        self._display_user_details(updated_user)
 
+    @gestion_command(USER_MESSAGES["permission_delete_only"])
     def delete_user_command(self, user_id: int):
         """Supprimer un collaborateur (gestion uniquement)"""
-        try:
-            current_user = self.auth_service.require_authentication()
-            self.user_controller.set_current_user(current_user)
-
-            if not current_user.is_gestion:
-                self.display_error(USER_MESSAGES["permission_delete_only"])
-                return
-
-            user = self.user_controller.get_user_by_id(user_id)
-            if not user:
-                self.display_error(USER_MESSAGES["user_not_found"])
-                return
-
-            self.display_header(USER_MESSAGES["delete_header"])
-            self._display_user_details(user)
+        user = self.user_controller.get_user_by_id(user_id)
+        if not user:
+            self.display_error(USER_MESSAGES["user_not_found"])
+            return
 
-            if not self.confirm_action(USER_MESSAGES["confirm_delete"].format(name=user.full_name)):
-                self.display_info(USER_MESSAGES["delete_cancelled"])
-                return
+        self.display_header(USER_MESSAGES["delete_header"])
+        self._display_user_details(user)
 
-            with self.console.status(STATUS_MESSAGES["deleting_user"]):
-                success = self.user_controller.delete_user(user_id)
+        if not self.confirm_action(USER_MESSAGES["confirm_delete"].format(name=user.full_name)):
+            self.display_info(USER_MESSAGES["delete_cancelled"])
+            return
 
-            if success:
-                self.display_success(USER_MESSAGES["delete_success"])
+        was_support = user.is_support
+        with self.console.status(STATUS_MESSAGES["deleting_user"]):
+            success = self.user_controller.delete_user(user_id)
+        if success and was_support:
+            EventView.invalidate_supports_cache()
 
-        except (AuthenticationError, AuthorizationError) as e:
-            self.display_error(VALIDATION_MESSAGES["authorization_error"].format(error=e))
-        except Exception as e:
-            self.display_error(VALIDATION_MESSAGES["general_error"].format(error=e))
+        if success:
+            self.display_success(USER_MESSAGES["delete_success"])
 
+    @view_command()
     def change_password_command(self, user_id: Optional[int] = None):
         """Changer le mot de passe"""
-        try:
-            current_user = self.auth_service.require_authentication()
-            self.user_controller.set_current_user(current_user)
-
-            # Si pas d'ID spécifié, changer son propre mot de passe
-            if user_id is None:
-                user_id = current_user.id
-                target_user = current_user
-                self.display_header(USER_MESSAGES["change_my_password_header"])
-            else:
-                if not current_user.is_gestion:
-                    self.display_error(
-                        USER_MESSAGES["permission_change_password_only"]
-                    )
-                    return
-
-                target_user = self.user_controller.get_user_by_id(user_id)
-                if not target_user:
-                    self.display_error(USER_MESSAGES["user_not_found"])
-                    return
-
-                self.display_header(USER_MESSAGES["change_user_password_header"].format(name=target_user.full_name))
-
-            new_password = self.get_user_input(USER_MESSAGES["prompt_new_password"], password=True)
-            confirm_password = self.get_user_input(USER_MESSAGES["prompt_confirm_password"], password=True)
+        current_user = self.require_user()
+
+        # Si pas d'ID spécifié, changer son propre mot de passe
+        if user_id is None:
+            user_id = current_user.id
+            target_user = current_user
+            self.display_header(USER_MESSAGES["change_my_password_header"])
+        else:
+            if not current_user.is_gestion:
+                self.display_error(
+                    USER_MESSAGES["permission_change_password_only"]
+                )
+                return
 
-            if new_password != confirm_password:
-                self.display_error(USER_MESSAGES["password_mismatch"])
+            target_user = self.user_controller.get_user_by_id(user_id)
+            if not target_user:
+                self.display_error(USER_MESSAGES["user_not_found"])
                 return
 
-            with self.console.status(STATUS_MESSAGES["updating_user"]):
-                success = self.user_controller.change_password(user_id, new_password)
+            self.display_header(USER_MESSAGES["change_user_password_header"].format(name=target_user.full_name))
 
-            if success:
-                self.display_success(USER_MESSAGES["password_change_success"])
+        new_password = self.get_user_input(USER_MESSAGES["prompt_new_password"], password=True)
+        confirm_password = self.get_user_input(USER_MESSAGES["prompt_confirm_password"], password=True)
 
-        except (AuthenticationError, AuthorizationError) as e:
-            self.display_error(VALIDATION_MESSAGES["authorization_error"].format(error=e))
-        except Exception as e:
-            self.display_error(VALIDATION_MESSAGES["general_error"].format(error=e))
+        if new_password != confirm_password:
+            self.display_error(USER_MESSAGES["password_mismatch"])
+            return
 
-    def search_users_command(self):
-        """Rechercher des collaborateurs (gestion uniquement)"""
-        try:
-            current_user = self.auth_service.require_authentication()
-            self.user_controller.set_current_user(current_user)
+        with self.console.status(STATUS_MESSAGES["updating_user"]):
+            success = self.user_controller.change_password(user_id, new_password)
 
-            if not current_user.is_gestion:
-                self.display_error(USER_MESSAGES["permission_search_only"])
-                return
+        if success:
+            self.display_success(USER_MESSAGES["password_change_success"])
 
-            self.display_header(USER_MESSAGES["search_header"])
+    @gestion_command(USER_MESSAGES["permission_search_only"])
+    def search_users_command(self, full_name: Optional[str] = None, email: Optional[str] = None,
+                             employee_number: Optional[str] = None,
+                             department: Optional[str] = None):
+        """
+        Rechercher des collaborateurs (gestion uniquement).
 
-            criteria = {}
+        Les critères passés en options de la commande sont utilisés tels
+        quels, sans aucune saisie ; sans option, ils sont demandés un à un.
+        """
+        self.display_header(USER_MESSAGES["search_header"])
 
+        if not any((full_name, email, employee_number, department)):
             full_name = self.get_user_input(USER_MESSAGES["prompt_search_name"])
-            if full_name:
-                criteria['full_name'] = full_name
-
             email = self.get_user_input(USER_MESSAGES["prompt_search_email"])
-            if email:
-                criteria['email'] = email
-
             employee_number = self.get_user_input(USER_MESSAGES["prompt_search_employee"])
-            if employee_number:
-                criteria['employee_number'] = employee_number
-
             department = self.get_user_input(USER_MESSAGES["prompt_search_department"])
-            if department:
-                criteria['department'] = department
 
-            if not criteria:
-                self.display_info(USER_MESSAGES["no_search_criteria"])
-                return
-
-            users = self.user_controller.search_users(**criteria)
-
-            if users:
-                self.display_success(USER_MESSAGES["search_results"].format(count=len(users)))
-                self._display_users_table(users)
-            else:
-                self.display_info(USER_MESSAGES["no_search_results"])
-
-        except (AuthenticationError, AuthorizationError) as e:
-            self.display_error(VALIDATION_MESSAGES["authorization_error"].format(error=e))
-        except Exception as e:
-            self.display_error(VALIDATION_MESSAGES["general_error"].format(error=e))
+        criteria = {}
+        if full_name:
+            criteria['full_name'] = full_name
+        if email:
+            criteria['email'] = email
+        if employee_number:
+            criteria['employee_number'] = employee_number
+        if department:
+            # Département converti (et validé) avant toute requête
+            criteria['department'] = self.user_controller.to_department(department)
+
+        if not criteria:
+            self.display_info(USER_MESSAGES["no_search_criteria"])
+            return
+
+        users = self.user_controller.search_users(**criteria)
+
+        if users:
+            self.display_success(USER_MESSAGES["search_results"].format(count=len(users)))
+            self._display_users_table(users)
+        else:
+            self.display_info(USER_MESSAGES["no_search_results"])
 
     def _display_users_table(self, users):
-        """Afficher les utilisateurs sous forme de tableau"""
-        columns = [
-            {'name': 'ID', 'style': 'cyan', 'justify': 'right'},
-            {'name': 'Nom', 'style': 'white'},
-            {'name': 'Email', 'style': 'blue'},
-            {'name': 'Département', 'style': 'green'},
-            {'name': 'N° Employé', 'style': 'yellow'}
-        ]
-
-        data = []
-        for user in users:
-            data.append([
-                str(user.id),
-                user.full_name,
-                user.email,
-                user.department.value.upper(),
-                user.employee_number
-            ])
-
-        self.display_table(USER_MESSAGES["table_title"], columns, data)
+        """Afficher les lignes utilisateur (liste ou itérateur) sous forme de tableau"""
+        # Lignes produites à la demande, consommées une à une par le tableau
+        data = (
+            (user.id, user.full_name, user.email, user.department.display, user.employee_number)
+            for user in users
+        )
+
+        self.display_table(USER_MESSAGES["table_title"], self._TABLE_COLUMNS, data)
 
     def _display_user_details(self, user: User):
         """Afficher les détails d'un utilisateur"""
-        user_content = f"""
-[cyan]ID:[/cyan] {user.id}
-[cyan]Nom:[/cyan] {user.full_name}
-[cyan]Email:[/cyan] {user.email}
-[cyan]Département:[/cyan] {user.department.value.upper()}
-[cyan]Numéro d'employé:[/cyan] {user.employee_number}
-[cyan]Créé le:[/cyan] {user.created_at.strftime('%Y-%m-%d %H:%M')}
-        """
-        self.display_panel(user_content, USER_MESSAGES["title_user_details"], style="blue")
+        self.display_panel(self._DETAILS_PANEL.format(**self._panel_fields(user)),
+                           USER_MESSAGES["title_user_details"], style="blue")
+
+    def _panel_fields(self, user: User) -> dict:
+        """Valeurs des champs des panneaux collaborateur"""
+        return {
+            'id': user.id,
+            'full_name': user.full_name,
+            'email': user.email,
+            'department': user.department.display,
+            'employee_number': user.employee_number,
+            'created_at': self.format_datetime(user.created_at),
+        }
@@ -2,43 +2,94 @@
 Configuration globale pour les tests - Tests simples sans mock
 """
 import pytest
-import tempfile
 import os
 import sys
+from contextlib import contextmanager
+from decimal import Decimal
 
 # Ajouter le répertoire racine au PYTHONPATH pour les imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from sqlalchemy import create_engine
+from argon2 import PasswordHasher, profiles
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 from src.database.connection import Base
+from src.services.auth_service import AuthenticationService
+from src.utils import hash_utils
 from src.models.user import User, Department
 from src.models.client import Client
 # Import nécessaires pour enregistrer tous les modèles SQLAlchemy
-from src.models.contract import Contract, ContractStatus  # noqa: F401
+from src.models.contract import Contract, ContractStatus
 from src.models.event import Event  # noqa: F401
+from src.views.base_view import BaseView
 
 
-@pytest.fixture(scope="function")
-def db_session():
-    """Créer une base de données temporaire pour chaque test"""
-    # Fichier temporaire pour la base
-    db_fd, db_path = tempfile.mkstemp(suffix='.db')
+@pytest.fixture(autouse=True)
+def fast_password_hasher(monkeypatch):
+    """Argon2 avec les paramètres minimaux : hachages réels mais quasi instantanés"""
+    monkeypatch.setattr(hash_utils, "ph", PasswordHasher.from_parameters(profiles.CHEAPEST))
+
+
+@pytest.fixture(scope="session")
+def engine():
+    """Base SQLite en mémoire, schéma créé une seule fois pour toute la session de tests"""
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool
+    )
+
+    # pysqlite gère lui-même BEGIN, ce qui casse les SAVEPOINT : on le laisse à SQLAlchemy
+    @event.listens_for(engine, "connect")
+    def disable_pysqlite_begin(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def emit_begin(connection):
+        connection.exec_driver_sql("BEGIN")
 
-    # Créer l'engine et les tables
-    engine = create_engine(f'sqlite:///{db_path}')
     Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
 
-    # Session
-    Session = sessionmaker(bind=engine)
+
+@pytest.fixture(scope="function")
+def db_session(engine):
+    """Session isolée par test : tout est annulé par un ROLLBACK en fin de test"""
+    connection = engine.connect()
+    transaction = connection.begin()
+
+    # Les commit() des contrôleurs ne libèrent que des SAVEPOINT
+    Session = sessionmaker(bind=connection, join_transaction_mode="create_savepoint")
     session = Session()
 
     yield session
 
     # Nettoyer
     session.close()
-    os.close(db_fd)
-    os.unlink(db_path)
+    transaction.rollback()
+    connection.close()
+
+
+@pytest.fixture
+def count_queries(db_session):
+    """Compte les requêtes SQL d'un bloc : ``with count_queries() as statements``"""
+    @contextmanager
+    def counter():
+        statements = []
+        connection = db_session.get_bind()
+
+        def record_statement(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(connection, "before_cursor_execute", record_statement)
+        try:
+            yield statements
+        finally:
+            event.remove(connection, "before_cursor_execute", record_statement)
+
+    return counter
 
 
 @pytest.fixture
@@ -99,3 +150,34 @@ def client_example(db_session, commercial_user):
     db_session.add(client)
     db_session.commit()
     return client
+
+
+@pytest.fixture
+def signed_contract(db_session, client_example):
+    """Contrat signé du client d'exemple pour les tests"""
+    contract = Contract(
+        client_id=client_example.id,
+        commercial_contact_id=client_example.commercial_contact_id,
+        total_amount=Decimal("8000.00"),
+        amount_due=Decimal("4000.00"),
+        status=ContractStatus.SIGNED
+    )
+    db_session.add(contract)
+    db_session.commit()
+    return contract
+
+
+@pytest.fixture
+def logged_in_admin(db_session, admin_user, tmp_path, monkeypatch):
+    """Vues connectées en tant qu'admin : session de test et token dans tmp_path"""
+    service = AuthenticationService(db_session)
+    service.jwt_manager.token_file = tmp_path / "token"
+    service.jwt_manager.save_token(service.jwt_manager.generate_token(
+        user_id=admin_user.id,
+        email=admin_user.email,
+        department=admin_user.department.value,
+        employee_number=admin_user.employee_number
+    ))
+    monkeypatch.setattr(BaseView, "db", db_session)
+    monkeypatch.setattr(BaseView, "auth_service", service)
+    return admin_user
@@ -0,0 +1,75 @@
+"""
+Tests simples pour le service d'authentification - Sans mock
+"""
+import pytest
+from src.controllers.event_controller import EventController
+from src.services.auth_service import AuthenticationService
+from src.utils.auth_utils import AuthenticationError
+from src.views.base_view import BaseView
+
+
+def _login_token(service, user):
+    """Enregistrer un token valide pour user, comme après une connexion"""
+    service.jwt_manager.save_token(service.jwt_manager.generate_token(
+        user_id=user.id,
+        email=user.email,
+        department=user.department.value,
+        employee_number=user.employee_number
+    ))
+
+
+def test_get_current_user_reuses_verified_token(db_session, admin_user, tmp_path,
+                                                count_queries):
+    """Le même token n'est vérifié et chargé qu'une fois, jusqu'à la déconnexion"""
+    service = AuthenticationService(db_session)
+    service.jwt_manager.token_file = tmp_path / "token"
+    _login_token(service, admin_user)
+    db_session.expire_all()
+
+    assert service.require_authentication().id == admin_user.id
+
+    with count_queries() as statements:
+        assert service.require_authentication() is service.get_current_user()
+
+    assert statements == []
+
+    service.logout()
+    assert service.get_current_user() is None
+
+
+def test_get_current_user_follows_token_change(db_session, admin_user, support_user, tmp_path):
+    """Un nouveau token stocké remplace l'utilisateur mémorisé"""
+    service = AuthenticationService(db_session)
+    service.jwt_manager.token_file = tmp_path / "token"
+    _login_token(service, admin_user)
+    assert service.get_current_user() is admin_user
+
+    # Connexion depuis un autre terminal : seul le fichier du token change
+    other = AuthenticationService(db_session)
+    other.jwt_manager.token_file = service.jwt_manager.token_file
+    _login_token(other, support_user)
+    assert service.get_current_user() is support_user
+
+    other.jwt_manager.clear_token()
+    assert service.get_current_user() is None
+
+
+def test_view_user_follows_auth_service(db_session, admin_user, support_user, tmp_path):
+    """La vue ne garde pas de cache propre : déconnexion et changement de token sont suivis"""
+    service = AuthenticationService(db_session)
+    service.jwt_manager.token_file = tmp_path / "token"
+    view = BaseView()
+    view.__dict__.update(db=db_session, auth_service=service)
+
+    _login_token(service, admin_user)
+    controller = view.setup_controller(EventController)
+    assert view.require_user() is admin_user
+    assert controller.current_user is admin_user
+
+    _login_token(service, support_user)
+    assert view.require_user() is support_user
+    assert controller.current_user is support_user
+
+    service.logout()
+    with pytest.raises(AuthenticationError):
+        view.require_user()
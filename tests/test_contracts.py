@@ -2,10 +2,14 @@
 Tests simples pour les contrats - Sans mock
 """
 import pytest
+from datetime import datetime, timedelta, timezone
 from decimal import Decimal
 from src.controllers.contract_controller import ContractController
+from src.controllers.event_controller import EventController
 from src.models.contract import Contract, ContractStatus
+from src.models.event import Event
 from src.utils.validators import ValidationError
+from src.views.contract_view import ContractView
 
 
 def test_create_contract_commercial(db_session, admin_user, client_example):
@@ -24,12 +28,12 @@ def test_create_contract_commercial(db_session, admin_user, client_example):
     assert contract.client_id == client_example.id
 
 
-def test_get_all_contracts_admin(db_session, admin_user, client_example):
-    """Un admin peut voir tous les contrats"""
+def test_get_contracts_for_table_admin(db_session, admin_user, client_example):
+    """Les lignes du tableau sont projetées sans objets ORM, noms complets"""
     controller = ContractController(db_session)
     controller.set_current_user(admin_user)
 
-    # Créer un contrat d'abord
+    client_example.company_name = "Entreprise au nom particulièrement long"
     contract = Contract(
         client_id=client_example.id,
         commercial_contact_id=client_example.commercial_contact_id,
@@ -40,19 +44,62 @@ def test_get_all_contracts_admin(db_session, admin_user, client_example):
     db_session.add(contract)
     db_session.commit()
 
-    contracts = controller.get_all_contracts()
+    rows = controller.get_contracts_for_table()
 
-    assert len(contracts) >= 1
-    contract_ids = [c.id for c in contracts]
-    assert contract.id in contract_ids
+    assert len(rows) == 1
+    assert rows[0].id == contract.id
+    assert rows[0].client_name == "Client Test"
+    assert rows[0].company_name == "Entreprise au nom particulièrement long"
+    assert rows[0].commercial_name == "Commercial Test"
+    assert rows[0].status == ContractStatus.SIGNED
 
 
-def test_get_my_contracts_commercial(db_session, commercial_user, client_example):
-    """Un commercial voit ses contrats"""
+def test_get_unpaid_contracts_for_table_support(db_session, support_user, client_example):
+    """Un support obtient une seule ligne par contrat impayé lié à ses événements"""
+    controller = ContractController(db_session)
+    controller.set_current_user(support_user)
+
+    contract = Contract(
+        client_id=client_example.id,
+        commercial_contact_id=client_example.commercial_contact_id,
+        total_amount=Decimal("9000.00"),
+        amount_due=Decimal("2000.00"),
+        status=ContractStatus.SIGNED
+    )
+    other = Contract(
+        client_id=client_example.id,
+        commercial_contact_id=client_example.commercial_contact_id,
+        total_amount=Decimal("3000.00"),
+        amount_due=Decimal("3000.00"),
+        status=ContractStatus.SIGNED
+    )
+    db_session.add_all([contract, other])
+    db_session.commit()
+
+    start_date = datetime.now(timezone.utc) + timedelta(days=10)
+    for name in ("Soirée", "Séminaire"):
+        db_session.add(Event(
+            name=name,
+            contract_id=contract.id,
+            support_contact_id=support_user.id,
+            start_date=start_date,
+            end_date=start_date + timedelta(hours=4),
+            location="Paris",
+            attendees=20
+        ))
+    db_session.commit()
+
+    rows = controller.get_unpaid_contracts_for_table()
+
+    assert [row.id for row in rows] == [contract.id]
+
+
+def test_get_my_contracts_for_table_commercial(db_session, commercial_user, admin_user,
+                                               client_example):
+    """Un commercial voit les lignes de ses seuls contrats"""
     controller = ContractController(db_session)
     controller.set_current_user(commercial_user)
 
-    # Créer un contrat
     contract = Contract(
         client_id=client_example.id,
         commercial_contact_id=commercial_user.id,
@@ -60,37 +107,40 @@ def test_get_my_contracts_commercial(db_session, commercial_user, client_example
         amount_due=Decimal("4000.00"),
         status=ContractStatus.DRAFT
     )
-    db_session.add(contract)
+    other = Contract(
+        client_id=client_example.id,
+        commercial_contact_id=admin_user.id,
+        total_amount=Decimal("1000.00"),
+        amount_due=Decimal("0.00"),
+        status=ContractStatus.DRAFT
+    )
+    db_session.add_all([contract, other])
     db_session.commit()
 
-    contracts = controller.get_my_contracts()
-
-    assert len(contracts) >= 1
-    contract_ids = [c.id for c in contracts]
-    assert contract.id in contract_ids
+    assert [row.id for row in controller.get_my_contracts_for_table()] == [contract.id]
 
 
-def test_get_unsigned_contracts(db_session, admin_user, client_example):
-    """Récupérer les contrats non signés"""
+def test_get_unsigned_contracts_for_table(db_session, admin_user, client_example):
+    """Seuls les contrats non signés sont listés"""
     controller = ContractController(db_session)
     controller.set_current_user(admin_user)
 
-    # Créer un contrat non signé
-    contract = Contract(
-        client_id=client_example.id,
-        commercial_contact_id=client_example.commercial_contact_id,
-        total_amount=Decimal("5000.00"),
-        amount_due=Decimal("5000.00"),
-        status=ContractStatus.DRAFT
+    contract, signed = (
+        Contract(
+            client_id=client_example.id,
+            commercial_contact_id=client_example.commercial_contact_id,
+            total_amount=Decimal("5000.00"),
+            amount_due=Decimal("5000.00"),
+            status=status
+        )
+        for status in (ContractStatus.DRAFT, ContractStatus.SIGNED)
     )
-    db_session.add(contract)
+    db_session.add_all([contract, signed])
     db_session.commit()
 
-    contracts = controller.get_unsigned_contracts()
+    rows = controller.get_unsigned_contracts_for_table()
 
-    assert len(contracts) >= 1
-    contract_ids = [c.id for c in contracts]
-    assert contract.id in contract_ids
+    assert [row.id for row in rows] == [contract.id]
 
 
 def test_sign_contract_admin(db_session, admin_user, client_example):
@@ -161,6 +211,91 @@ def test_get_contract_by_id(db_session, commercial_user, client_example):
     assert found_contract.total_amount == Decimal("6000.00")
 
 
+def test_get_contract_by_id_cache(db_session, commercial_user, client_example):
+    """Le contrat consulté est réutilisé puis invalidé après mise à jour"""
+    controller = ContractController(db_session)
+    controller.set_current_user(commercial_user)
+
+    contract = Contract(
+        client_id=client_example.id,
+        commercial_contact_id=commercial_user.id,
+        total_amount=Decimal("6000.00"),
+        amount_due=Decimal("3000.00"),
+        status=ContractStatus.SIGNED
+    )
+    db_session.add(contract)
+    db_session.commit()
+
+    first = controller.get_contract_by_id(contract.id)
+    assert contract.id in controller._contract_cache
+    assert controller.get_contract_by_id(contract.id) is first
+
+    controller.update_contract(contract.id, amount_due=Decimal("1000.00"))
+    assert contract.id not in controller._contract_cache
+    assert controller.get_contract_by_id(contract.id).amount_due == Decimal("1000.00")
+
+
+def test_contract_cache_cleared_by_other_writes(db_session, admin_user, signed_contract,
+                                               monkeypatch):
+    """Signature ou création d'événement par un autre contrôleur : la relecture est à jour"""
+    # Comme la session de l'application : les objets ne sont pas expirés au commit
+    monkeypatch.setattr(db_session, "expire_on_commit", False)
+    controller = ContractController(db_session)
+    controller.set_current_user(admin_user)
+    draft = controller.create_contract(
+        client_id=signed_contract.client_id,
+        total_amount=Decimal("2000.00"),
+        amount_due=Decimal("2000.00")
+    )
+
+    assert controller.get_contract_by_id(draft.id).status == ContractStatus.DRAFT
+    controller.sign_contract(draft.id)
+    assert controller.get_contract_by_id(draft.id).status == ContractStatus.SIGNED
+
+    assert controller.get_contract_by_id(signed_contract.id).events == []
+    events = EventController(db_session)
+    events.set_current_user(admin_user)
+    start_date = datetime.now(timezone.utc) + timedelta(days=10)
+    event = events.create_event(
+        contract_id=signed_contract.id, name="Lancement", start_date=start_date,
+        end_date=start_date + timedelta(hours=3), location="Lyon", attendees=40
+    )
+    assert controller.get_contract_by_id(signed_contract.id).events == [event]
+
+
+def test_get_contract_by_id_loads_event_supports(db_session, admin_user, support_user,
+                                                 signed_contract, count_queries):
+    """La fiche contrat charge les supports de ses événements dans la même requête"""
+    controller = ContractController(db_session)
+    controller.set_current_user(admin_user)
+
+    start_date = datetime.now(timezone.utc) + timedelta(days=10)
+    for name, support_id in (("Soirée", support_user.id), ("Séminaire", None)):
+        db_session.add(Event(
+            name=name,
+            contract_id=signed_contract.id,
+            support_contact_id=support_id,
+            start_date=start_date,
+            end_date=start_date + timedelta(hours=4),
+            location="Paris",
+            attendees=20
+        ))
+    db_session.commit()
+    contract_id = signed_contract.id
+    db_session.expire_all()
+    db_session.refresh(admin_user)  # recharger l'utilisateur courant hors comptage
+
+    with count_queries() as statements:
+        found = controller.get_contract_by_id(contract_id)
+        supports = sorted(
+            event.support_contact.full_name if event.support_contact else ""
+            for event in found.events
+        )
+
+    assert supports == ["", "Support Test"]
+    assert len(statements) == 1
+
+
 def test_create_contract_montant_negatif(db_session, admin_user, client_example):
     """Validation montant négatif"""
     controller = ContractController(db_session)
@@ -185,3 +320,66 @@ def test_create_contract_restant_superieur(db_session, admin_user, client_exampl
             total_amount=Decimal("1000.00"),
             amount_due=Decimal("1500.00")
         )
+
+
+def test_search_contracts_count_and_limit(db_session, admin_user, client_example):
+    """Le comptage de recherche n'instancie pas les contrats et la limite s'applique"""
+    controller = ContractController(db_session)
+    controller.set_current_user(admin_user)
+
+    for amount in ("1000.00", "2000.00", "3000.00"):
+        db_session.add(Contract(
+            client_id=client_example.id,
+            commercial_contact_id=client_example.commercial_contact_id,
+            total_amount=Decimal(amount),
+            amount_due=Decimal(amount),
+            status=ContractStatus.DRAFT
+        ))
+    db_session.commit()
+
+    criteria = {'client_name': "Client", 'company_name': "Test"}
+    assert controller.search_contracts_count(**criteria) == 3
+    assert len(controller.search_contracts(limit=2, **criteria)) == 2
+    assert controller.search_contracts_count(status=ContractStatus.SIGNED) == 0
+
+
+def test_search_contracts_command_refines(db_session, logged_in_admin, signed_contract,
+                                          monkeypatch):
+    """Trop de résultats : refuser ramène aux critères, puis le nombre affiché est annoncé"""
+    db_session.add(Contract(
+        client_id=signed_contract.client_id,
+        commercial_contact_id=signed_contract.commercial_contact_id,
+        total_amount=Decimal("1000.00"),
+        amount_due=Decimal("1000.00"),
+        status=ContractStatus.DRAFT
+    ))
+    db_session.commit()
+    view = ContractView()
+    monkeypatch.setattr(view, "SEARCH_DISPLAY_LIMIT", 1)
+    choices, confirms = iter(["0", "2", "0"]), iter([False, True])
+    shown, messages = [], []
+    monkeypatch.setattr(view, "get_user_input", lambda prompt: "client" if "client" in prompt else "")
+    monkeypatch.setattr(view, "get_user_choice", lambda options, prompt: next(choices))
+    monkeypatch.setattr(view, "confirm_action", lambda message: next(confirms))
+    monkeypatch.setattr(view, "display_success", messages.append)
+    monkeypatch.setattr(view, "_display_contracts_table", shown.append)
+
+    # 1er tour : tous statuts, refus ; 2e tour : signés seulement ; 3e tour : tous, accepté
+    view.search_contracts_command()
+    assert [contract.id for contract in shown[0]] == [signed_contract.id]
+    assert messages == ["1 contrat(s) trouve(s)"]
+
+    view.search_contracts_command()
+    assert len(shown[1]) == 1
+    assert messages[1] == "1 contrat(s) affiché(s) sur 2 trouvé(s)"
+
+
+def test_list_my_contracts_command_commercial_only(logged_in_admin, monkeypatch):
+    """La liste « mes contrats » est refusée à un utilisateur non commercial"""
+    view = ContractView()
+    errors = []
+    monkeypatch.setattr(view, "display_error", errors.append)
+
+    view.list_my_contracts_command()
+
+    assert errors == ["Cette commande est réservée aux commerciaux"]
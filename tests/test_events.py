@@ -2,37 +2,40 @@
 Tests simples pour les événements - Sans mock
 """
 import pytest
+from types import SimpleNamespace
 from datetime import datetime, timedelta, timezone
-from src.controllers.event_controller import EventController
+from src.controllers.contract_controller import ContractController
+from src.controllers.event_controller import EventController, EventRow
 from src.models.event import Event
 from src.models.contract import Contract, ContractStatus
-from src.models.user import User, Department
 from src.utils.validators import ValidationError
+from src.utils.auth_utils import AuthorizationError
+from src.views.event_view import EventView
 from decimal import Decimal
 
 
-def test_create_event_commercial(db_session, commercial_user, client_example):
+def _add_event(db_session, contract, name, start_date=None, **fields):
+    """Enregistrer un événement du contrat (dans 10 jours, 2 heures, à Lyon par défaut)"""
+    start_date = start_date or datetime.now(timezone.utc) + timedelta(days=10)
+    values = dict(end_date=start_date + timedelta(hours=2), location="Lyon", attendees=10)
+    values.update(fields)
+    event = Event(name=name, contract_id=contract.id, start_date=start_date, **values)
+    db_session.add(event)
+    db_session.commit()
+    return event
+
+
+def test_create_event_commercial(db_session, commercial_user, signed_contract):
     """Un commercial peut créer un événement pour son contrat signé"""
     controller = EventController(db_session)
     controller.set_current_user(commercial_user)
 
-    # Créer un contrat signé d'abord
-    contract = Contract(
-        client_id=client_example.id,
-        commercial_contact_id=commercial_user.id,
-        total_amount=Decimal("10000.00"),
-        amount_due=Decimal("5000.00"),
-        status=ContractStatus.SIGNED
-    )
-    db_session.add(contract)
-    db_session.commit()
-
     start_date = datetime.now(timezone.utc) + timedelta(days=15)
     end_date = start_date + timedelta(hours=6)
 
     event = controller.create_event(
         name="Nouveau Événement",
-        contract_id=contract.id,
+        contract_id=signed_contract.id,
         start_date=start_date,
         end_date=end_date,
         location="Lyon",
@@ -41,235 +44,136 @@ def test_create_event_commercial(db_session, commercial_user, client_example):
     )
 
     assert event.name == "Nouveau Événement"
-    assert event.contract_id == contract.id
+    assert event.contract_id == signed_contract.id
     assert event.location == "Lyon"
     assert event.attendees == 50
 
 
-def test_get_all_events_admin(db_session, admin_user, client_example, support_user):
+def test_all_event_rows_admin(db_session, admin_user, signed_contract, support_user):
     """Un admin peut voir tous les événements"""
     controller = EventController(db_session)
     controller.set_current_user(admin_user)
+    event = _add_event(db_session, signed_contract, "Événement Test",
+                       support_contact_id=support_user.id)
 
-    # Créer un contrat signé et un événement
-    contract = Contract(
-        client_id=client_example.id,
-        commercial_contact_id=client_example.commercial_contact_id,
-        total_amount=Decimal("8000.00"),
-        amount_due=Decimal("4000.00"),
-        status=ContractStatus.SIGNED
-    )
-    db_session.add(contract)
-    db_session.commit()
+    rows = [row for batch in controller.iter_all_event_rows() for row in batch]
 
-    start_date = datetime.now(timezone.utc) + timedelta(days=30)
-    end_date = start_date + timedelta(hours=8)
+    assert [row.id for row in rows] == [event.id]
 
-    event = Event(
-        name="Événement Test",
-        contract_id=contract.id,
-        start_date=start_date,
-        end_date=end_date,
-        location="Paris",
-        attendees=100,
-        support_contact_id=support_user.id
-    )
-    db_session.add(event)
-    db_session.commit()
 
-    events = controller.get_all_events()
+@pytest.mark.parametrize("fetch", [
+    lambda controller: controller.iter_all_event_rows(),
+    lambda controller: controller.iter_my_event_rows(),
+    lambda controller: controller.iter_event_rows_without_support(),
+    lambda controller: controller.iter_search_event_rows(location="Lyon"),
+    lambda controller: [controller.get_upcoming_event_rows_range(
+        datetime.now(timezone.utc), datetime.now(timezone.utc) + timedelta(days=30))],
+], ids=["all", "mine", "unassigned", "search", "upcoming"])
+def test_event_listings_single_query(db_session, admin_user, signed_contract,
+                                     count_queries, fetch):
+    """Chaque liste d'événements est lue, client et support compris, en une requête"""
+    controller = EventController(db_session)
+    controller.set_current_user(admin_user)
+    for index in range(3):
+        _add_event(db_session, signed_contract, f"Atelier {index}")
+    db_session.refresh(admin_user)  # recharger l'utilisateur courant hors comptage
+
+    with count_queries() as statements:
+        rows = [row for batch in fetch(controller) for row in batch]
 
-    assert len(events) == 1
-    assert events[0].id == event.id
+    assert [row.client_name for row in rows] == ["Client Test"] * 3
+    assert [row.support_name for row in rows] == ["Non assigné"] * 3
+    assert len(statements) == 1
 
 
-def test_get_my_events_support(db_session, support_user, client_example):
+def test_my_event_rows_support(db_session, support_user, signed_contract):
     """Un support voit ses événements assignés"""
     controller = EventController(db_session)
     controller.set_current_user(support_user)
+    event = _add_event(db_session, signed_contract, "Mon Événement",
+                       support_contact_id=support_user.id)
 
-    # Créer un contrat et un événement assigné
-    contract = Contract(
-        client_id=client_example.id,
-        commercial_contact_id=client_example.commercial_contact_id,
-        total_amount=Decimal("6000.00"),
-        amount_due=Decimal("3000.00"),
-        status=ContractStatus.SIGNED
-    )
-    db_session.add(contract)
-    db_session.commit()
+    rows = [row for batch in controller.iter_my_event_rows() for row in batch]
 
-    start_date = datetime.now(timezone.utc) + timedelta(days=20)
-    end_date = start_date + timedelta(hours=4)
+    assert [row.id for row in rows] == [event.id]
 
-    event = Event(
-        name="Mon Événement",
-        contract_id=contract.id,
-        start_date=start_date,
-        end_date=end_date,
-        location="Marseille",
-        attendees=75,
-        support_contact_id=support_user.id
-    )
-    db_session.add(event)
-    db_session.commit()
 
-    events = controller.get_my_events()
+def test_upcoming_event_rows(db_session, admin_user, signed_contract):
+    """Récupérer les événements à venir"""
+    controller = EventController(db_session)
+    controller.set_current_user(admin_user)
+    event = _add_event(db_session, signed_contract, "Événement Futur")
 
-    assert len(events) == 1
-    assert events[0].id == event.id
+    now = datetime.now(timezone.utc)
+    rows = controller.get_upcoming_event_rows_range(now, now + timedelta(days=30))
 
+    assert event.id in [row.id for row in rows]
 
-def test_get_upcoming_events(db_session, admin_user, client_example):
-    """Récupérer les événements à venir"""
+
+def test_upcoming_event_rows_range(db_session, admin_user, signed_contract):
+    """Les tranches [début, fin[ consécutives ne se chevauchent pas"""
     controller = EventController(db_session)
     controller.set_current_user(admin_user)
 
-    # Créer un contrat et un événement futur
-    contract = Contract(
-        client_id=client_example.id,
-        commercial_contact_id=client_example.commercial_contact_id,
-        total_amount=Decimal("7000.00"),
-        amount_due=Decimal("3500.00"),
-        status=ContractStatus.SIGNED
-    )
-    db_session.add(contract)
-    db_session.commit()
+    boundary = datetime(2030, 6, 1, 12, 0)
+    _add_event(db_session, signed_contract, "Avant", boundary - timedelta(hours=2))
+    _add_event(db_session, signed_contract, "Limite", boundary)
 
-    start_date = datetime.now(timezone.utc) + timedelta(days=10)
-    end_date = start_date + timedelta(hours=3)
+    first = controller.get_upcoming_event_rows_range(boundary - timedelta(days=1), boundary)
+    second = controller.get_upcoming_event_rows_range(boundary, boundary + timedelta(days=1))
 
-    event = Event(
-        name="Événement Futur",
-        contract_id=contract.id,
-        start_date=start_date,
-        end_date=end_date,
-        location="Nice",
-        attendees=60
-    )
-    db_session.add(event)
-    db_session.commit()
-
-    events = controller.get_upcoming_events()
+    assert [row.name for row in first] == ["Avant"]
+    assert [row.name for row in second] == ["Limite"]
 
-    assert len(events) >= 1
-    event_ids = [e.id for e in events]
-    assert event.id in event_ids
+    rows = controller.get_upcoming_event_rows_range(boundary - timedelta(days=1), boundary,
+                                                    include_end=True)
+    assert [(row.name, row.date) for row in rows] == [("Avant", "2030-06-01"),
+                                                      ("Limite", "2030-06-01")]
 
 
-def test_get_events_without_support(db_session, admin_user, client_example):
-    """Récupérer les événements sans support assigné"""
+def test_event_rows_format_start_date(db_session, admin_user, signed_contract):
+    """La date des lignes de tableau est au format 'AAAA-MM-JJ'"""
     controller = EventController(db_session)
     controller.set_current_user(admin_user)
+    _add_event(db_session, signed_contract, "Vernissage", datetime(2031, 3, 9, 18, 30))
+    db_session.expire_all()
 
-    # Créer un contrat et un événement sans support
-    contract = Contract(
-        client_id=client_example.id,
-        commercial_contact_id=client_example.commercial_contact_id,
-        total_amount=Decimal("5000.00"),
-        amount_due=Decimal("2500.00"),
-        status=ContractStatus.SIGNED
-    )
-    db_session.add(contract)
-    db_session.commit()
+    rows = next(controller.iter_all_event_rows())
 
-    start_date = datetime.now(timezone.utc) + timedelta(days=25)
-    end_date = start_date + timedelta(hours=5)
+    assert rows[0].date == "2031-03-09"
+    assert rows[0].client_name == "Client Test"
+    assert rows[0].support_name == "Non assigné"
 
-    event = Event(
-        name="Événement Sans Support",
-        contract_id=contract.id,
-        start_date=start_date,
-        end_date=end_date,
-        location="Bordeaux",
-        attendees=40,
-        support_contact_id=None
-    )
-    db_session.add(event)
-    db_session.commit()
 
-    events = controller.get_events_without_support()
+def test_event_rows_without_support(db_session, admin_user, signed_contract):
+    """Récupérer les événements sans support assigné"""
+    controller = EventController(db_session)
+    controller.set_current_user(admin_user)
+    event = _add_event(db_session, signed_contract, "Événement Sans Support")
 
-    assert len(events) >= 1
-    event_ids = [e.id for e in events]
-    assert event.id in event_ids
+    rows = [row for batch in controller.iter_event_rows_without_support() for row in batch]
 
+    assert event.id in [row.id for row in rows]
 
-def test_assign_support_to_event(db_session, admin_user, support_user, client_example):
+
+def test_assign_support_to_event(db_session, admin_user, support_user, signed_contract):
     """Assigner un support à un événement"""
     controller = EventController(db_session)
     controller.set_current_user(admin_user)
-
-    # Créer un contrat et un événement sans support
-    contract = Contract(
-        client_id=client_example.id,
-        commercial_contact_id=client_example.commercial_contact_id,
-        total_amount=Decimal("9000.00"),
-        amount_due=Decimal("4500.00"),
-        status=ContractStatus.SIGNED
-    )
-    db_session.add(contract)
-    db_session.commit()
-
-    start_date = datetime.now(timezone.utc) + timedelta(days=35)
-    end_date = start_date + timedelta(hours=7)
-
-    event = Event(
-        name="Événement À Assigner",
-        contract_id=contract.id,
-        start_date=start_date,
-        end_date=end_date,
-        location="Toulouse",
-        attendees=90
-    )
-    db_session.add(event)
-    db_session.commit()
+    event = _add_event(db_session, signed_contract, "Événement À Assigner")
 
     updated_event = controller.assign_support_to_event(event.id, support_user.id)
 
     assert updated_event.support_contact_id == support_user.id
 
 
-def test_update_event(db_session, support_user, client_example):
+def test_update_event(db_session, support_user, signed_contract):
     """Modifier un événement"""
     controller = EventController(db_session)
     controller.set_current_user(support_user)
-
-    # Créer un contrat signé avec un commercial
-    commercial_user = User(
-        full_name="Commercial Test",
-        email="commercial-unique@test.com",  # Email unique
-        employee_number="789012",  # Numéro unique aussi
-        department=Department.COMMERCIAL,
-        hashed_password="$argon2id$v=19$m=65536,t=3,p=4$test"  # Hash factice
-    )
-    db_session.add(commercial_user)
-    db_session.commit()
-
-    contract = Contract(
-        client_id=client_example.id,
-        commercial_contact_id=commercial_user.id,
-        total_amount=Decimal("12000.00"),
-        amount_due=Decimal("6000.00"),
-        status=ContractStatus.SIGNED
-    )
-    db_session.add(contract)
-    db_session.commit()
-
-    start_date = datetime.now(timezone.utc) + timedelta(days=40)
-    end_date = start_date + timedelta(hours=6)
-
-    event = Event(
-        name="Événement À Modifier",
-        contract_id=contract.id,
-        support_contact_id=support_user.id,  # Assigner au support qui va modifier
-        start_date=start_date,
-        end_date=end_date,
-        location="Lille",
-        attendees=80
-    )
-    db_session.add(event)
-    db_session.commit()
+    # Assigné au support qui va le modifier
+    event = _add_event(db_session, signed_contract, "Événement À Modifier",
+                       support_contact_id=support_user.id, location="Lille", attendees=80)
 
     updated_event = controller.update_event(
         event.id,
@@ -281,29 +185,106 @@ def test_update_event(db_session, support_user, client_example):
     assert updated_event.attendees == 100
 
 
-def test_create_event_fin_avant_debut(db_session, commercial_user, client_example):
-    """Validation : fin avant début invalide"""
+def test_get_event_by_id_cache(db_session, admin_user, signed_contract):
+    """L'événement consulté est réutilisé puis invalidé après mise à jour"""
     controller = EventController(db_session)
-    controller.set_current_user(commercial_user)
+    controller.set_current_user(admin_user)
+    event = _add_event(db_session, signed_contract, "Conférence", location="Bordeaux")
 
-    # Créer un contrat signé
-    contract = Contract(
-        client_id=client_example.id,
+    first = controller.get_event_by_id(event.id)
+    assert event.id in controller._event_cache
+    assert controller.get_event_by_id(event.id) is first
+
+    controller.update_event(event.id, location="Toulouse")
+    assert event.id not in controller._event_cache
+    assert controller.get_event_by_id(event.id).location == "Toulouse"
+
+
+def test_event_cache_cleared_by_other_writes(db_session, admin_user, support_user,
+                                            signed_contract, monkeypatch):
+    """Assignation ou mise à jour du contrat par un autre contrôleur : la relecture est à jour"""
+    # Comme la session de l'application : les objets ne sont pas expirés au commit
+    monkeypatch.setattr(db_session, "expire_on_commit", False)
+    controller = EventController(db_session)
+    controller.set_current_user(admin_user)
+    start_date = datetime.now(timezone.utc) + timedelta(days=10)
+    event = controller.create_event(
+        contract_id=signed_contract.id, name="Séminaire", start_date=start_date,
+        end_date=start_date + timedelta(hours=4), location="Lille", attendees=25
+    )
+
+    assert controller.get_event_by_id(event.id).support_contact is None
+    controller.assign_support_to_event(event.id, support_user.id)
+    assert controller.get_event_by_id(event.id).support_contact is support_user
+
+    contracts = ContractController(db_session)
+    contracts.set_current_user(admin_user)
+    contracts.update_contract(signed_contract.id, amount_due=Decimal("0.00"))
+    assert event.id not in controller._event_cache
+    assert controller.get_event_by_id(event.id).contract.amount_due == Decimal("0.00")
+
+
+def test_get_event_by_id_flat(db_session, support_user, signed_contract):
+    """La fiche en lecture seule est une ligne nommée, avec contrôle d'accès"""
+    mine = _add_event(db_session, signed_contract, "Conférence",
+                      support_contact_id=support_user.id)
+    other = _add_event(db_session, signed_contract, "Gala")
+
+    controller = EventController(db_session)
+    controller.set_current_user(support_user)
+
+    row = controller.get_event_by_id_flat(mine.id)
+    assert row.name == "Conférence"
+    assert row.client_name == "Client Test"
+    assert row.commercial_name == "Commercial Test"
+    assert row.support_name == support_user.full_name
+    assert controller.get_event_by_id_flat(-1) is None
+    with pytest.raises(AuthorizationError):
+        controller.get_event_by_id_flat(other.id)
+
+
+def test_get_signed_contract_summary(db_session, admin_user, commercial_user,
+                                     support_user, signed_contract):
+    """Le résumé du contrat cible n'existe que pour un contrat signé accessible"""
+    draft = Contract(
+        client_id=signed_contract.client_id,
         commercial_contact_id=commercial_user.id,
-        total_amount=Decimal("4000.00"),
-        amount_due=Decimal("2000.00"),
-        status=ContractStatus.SIGNED
+        total_amount=Decimal("5000.00"),
+        amount_due=Decimal("0.00"),
+        status=ContractStatus.DRAFT
     )
-    db_session.add(contract)
+    db_session.add(draft)
     db_session.commit()
 
+    controller = EventController(db_session)
+    controller.set_current_user(admin_user)
+
+    summary = controller.get_signed_contract_summary(signed_contract.id)
+    assert summary.client_name == "Client Test"
+    assert summary.commercial_name == "Commercial Test"
+    assert controller.get_signed_contract_summary(draft.id) is None
+    assert controller.get_signed_contract_summary(-1) is None
+
+    controller.set_current_user(commercial_user)
+    assert controller.get_signed_contract_summary(signed_contract.id).id == signed_contract.id
+
+    controller.set_current_user(support_user)
+    with pytest.raises(AuthorizationError):
+        controller.get_signed_contract_summary(signed_contract.id)
+
+
+def test_create_event_fin_avant_debut(db_session, commercial_user, signed_contract):
+    """Validation : fin avant début invalide"""
+    controller = EventController(db_session)
+    controller.set_current_user(commercial_user)
+
     start_date = datetime.now(timezone.utc) + timedelta(days=10)
     end_date = start_date - timedelta(hours=2)  # Fin avant début !
 
     with pytest.raises(ValidationError):
         controller.create_event(
             name="Événement Invalide",
-            contract_id=contract.id,
+            contract_id=signed_contract.id,
             start_date=start_date,
             end_date=end_date,
             location="Test",
@@ -311,31 +292,197 @@ def test_create_event_fin_avant_debut(db_session, commercial_user, client_exampl
         )
 
 
-def test_create_event_participants_negatif(db_session, commercial_user, client_example):
+def test_create_event_participants_negatif(db_session, commercial_user, signed_contract):
     """Validation : nombre de participants négatif"""
     controller = EventController(db_session)
     controller.set_current_user(commercial_user)
 
-    # Créer un contrat signé
-    contract = Contract(
-        client_id=client_example.id,
-        commercial_contact_id=commercial_user.id,
-        total_amount=Decimal("3000.00"),
-        amount_due=Decimal("1500.00"),
-        status=ContractStatus.SIGNED
-    )
-    db_session.add(contract)
-    db_session.commit()
-
     start_date = datetime.now(timezone.utc) + timedelta(days=10)
     end_date = start_date + timedelta(hours=2)
 
     with pytest.raises(ValidationError):
         controller.create_event(
             name="Événement Invalide",
-            contract_id=contract.id,
+            contract_id=signed_contract.id,
             start_date=start_date,
             end_date=end_date,
             location="Test",
             attendees=-5
         )
+
+
+def test_search_events_case_insensitive(db_session, commercial_user, client_example,
+                                        signed_contract):
+    """La recherche par nom d'événement, lieu et client ignore la casse"""
+    controller = EventController(db_session)
+    controller.set_current_user(commercial_user)
+    event = _add_event(db_session, signed_contract, "Gala Annuel", location="Bordeaux")
+
+    def search(**criteria):
+        return [row.id for batch in controller.iter_search_event_rows(**criteria) for row in batch]
+
+    assert search(name="gala") == [event.id]
+    assert search(name="GALA", client_name="client") == [event.id]
+    assert search(location="BORDEAUX") == [event.id]
+    assert search(name="concert") == []
+    batches = list(controller.iter_search_event_rows(name="GALA", client_name="client"))
+    assert [[(row.id, row.client_name) for row in batch] for batch in batches] == [
+        [(event.id, "Client Test")]
+    ]
+    assert list(controller.iter_search_event_rows(location="lyon")) == []
+
+    # lower() SQLite ne replie que l'ASCII : les majuscules accentuées doivent correspondre telles quelles
+    client_example.full_name = "Émile Client"
+    accented = _add_event(db_session, signed_contract, "Élection annuelle", location="Évry")
+
+    assert search(name="Élection") == [accented.id]
+    assert search(name="ÉLECTION ANNUELLE") == [accented.id]
+    assert len(search(client_name="Émile")) == 2
+    assert search(location="Évry") == [accented.id]
+    assert search(location="ÉVRY") == [accented.id]
+
+
+def test_iter_all_event_rows(db_session, admin_user, commercial_user, support_user,
+                             signed_contract):
+    """Les lignes du tableau sont projetées par lots, sans objets ORM, pour la gestion seule"""
+    controller = EventController(db_session)
+    controller.set_current_user(admin_user)
+    for index, support_id in enumerate((support_user.id, None, None)):
+        _add_event(db_session, signed_contract, f"Concert {index}", datetime(2032, 7, 14, 20, 0),
+                   support_contact_id=support_id)
+
+    batches = list(controller.iter_all_event_rows(chunk=2))
+    rows = [row for batch in batches for row in batch]
+
+    assert [len(batch) for batch in batches] == [2, 1]
+    assert [row.name for row in rows] == ["Concert 0", "Concert 1", "Concert 2"]
+    assert rows[0].support_name == support_user.full_name
+    assert rows[1].support_name == "Non assigné"
+    assert rows[0].client_name == "Client Test"
+    assert rows[0].date == "2032-07-14"
+
+    controller.set_current_user(commercial_user)
+    with pytest.raises(AuthorizationError):
+        controller.iter_all_event_rows()
+
+
+def test_event_rows_by_role(db_session, support_user, commercial_user, signed_contract):
+    """Les lignes projetées appliquent les filtres de rôle de l'utilisateur"""
+    controller = EventController(db_session)
+    _add_event(db_session, signed_contract, "Assigné", support_contact_id=support_user.id)
+    _add_event(db_session, signed_contract, "Libre")
+
+    controller.set_current_user(support_user)
+    assert [[row.name for row in batch] for batch in controller.iter_my_event_rows()] == [["Assigné"]]
+
+    controller.set_current_user(commercial_user)
+    assert [[row.name for row in batch] for batch in controller.iter_my_event_rows(1)] == [
+        ["Assigné"], ["Libre"]
+    ]
+    assert [[row.name for row in batch]
+            for batch in controller.iter_event_rows_without_support(1)] == [["Libre"]]
+
+
+def _rows(*names):
+    """Lot de lignes EventRow nommées (pour les tests d'affichage)"""
+    return [EventRow(0, name, "Client", "2030-01-01", "Lyon", "Non assigné") for name in names]
+
+
+@pytest.mark.parametrize("batches, pages, questions", [
+    # Lots de taille fixe : pas de question après la dernière page, même complète
+    ([_rows("a", "b"), _rows("c", "d"), _rows("e")], ["ab", "cd", "e"], 2),
+    ([_rows("a", "b"), _rows("c", "d")], ["ab", "cd"], 1),
+    # Fenêtres de taille variable, éventuellement vides : regroupées en pages pleines
+    ([[], _rows("a"), [], _rows("b", "c"), _rows("d"), []], ["ab", "cd"], 1),
+    ([_rows("a"), [], []], ["a"], 0),
+])
+def test_stream_events_table_pages(monkeypatch, batches, pages, questions):
+    """Les lots sont affichés par pages pleines, la suite n'est proposée que s'il en reste"""
+    view = EventView()
+    view.PAGE_SIZE = 2
+    printed, asked = [], []
+    monkeypatch.setattr("sys.stdin.isatty", lambda: True)
+    monkeypatch.setattr(view, "confirm_action", lambda message: asked.append(message) or True)
+    monkeypatch.setattr(view, "_build_events_table",
+                        lambda rows, show_header=True: "".join(row.name for row in rows))
+    monkeypatch.setattr(view.console, "print", printed.append)
+
+    assert view._stream_events_table(iter(batches)) == (sum(map(len, pages)), True)
+    assert printed == pages
+    assert len(asked) == questions
+
+
+def test_stream_events_table_stop(monkeypatch):
+    """Un refus arrête la lecture et ferme le générateur de lots"""
+    view = EventView()
+    view.PAGE_SIZE = 2
+    read = []
+
+    def batches():
+        for batch in (_rows("a", "b"), _rows("c"), _rows("d", "e"), _rows("f")):
+            read.append(batch)
+            yield batch
+
+    monkeypatch.setattr("sys.stdin.isatty", lambda: True)
+    monkeypatch.setattr(view, "confirm_action", lambda message: False)
+    monkeypatch.setattr(view.console, "print", lambda table: None)
+    stream = batches()
+
+    assert view._stream_events_table(stream) == (2, False)
+    assert len(read) == 2  # une page plus le lot lu d'avance
+    assert stream.gi_frame is None
+
+
+def _edit_event_form(monkeypatch, abort=False, extra=(), **lines):
+    """
+    Simuler l'éditeur sur le formulaire d'un événement.
+
+    Les lignes 'clé=valeur' données remplacent celles du modèle, extra est
+    ajouté à la fin et abort simule un éditeur fermé sans enregistrer.
+    """
+    view, errors = EventView(), []
+    monkeypatch.setattr(view, "display_error", errors.append)
+
+    def fake_edit(text, extension):
+        if abort:
+            return None
+        edited = [lines.get(line.partition("=")[0], line) for line in text.splitlines()]
+        return "\n".join(edited + list(extra))
+
+    monkeypatch.setattr("click.edit", fake_edit)
+    current = SimpleNamespace(name="Gala", start_date=datetime(2030, 6, 1, 14, 0),
+                              end_date=datetime(2030, 6, 1, 23, 0), location="Paris",
+                              attendees=50, notes=None)
+    return view._collect_in_editor(EventView._EVENT_FORM, current), errors
+
+
+def test_collect_in_editor_changed_fields(monkeypatch):
+    """Seules les valeurs modifiées sont converties et retournées"""
+    collected, errors = _edit_event_form(
+        monkeypatch, start_date="start_date=2030-06-02 10:00", attendees="attendees= 80 ",
+        notes="notes=Traiteur confirmé", extra=["", "# commentaire ignoré"]
+    )
+
+    assert errors == []
+    assert collected == {"start_date": datetime(2030, 6, 2, 10, 0), "attendees": 80,
+                         "notes": "Traiteur confirmé"}
+
+
+def test_collect_in_editor_unchanged(monkeypatch):
+    """Formulaire inchangé ou éditeur fermé sans enregistrer : aucune modification"""
+    assert _edit_event_form(monkeypatch) == ({}, [])
+    assert _edit_event_form(monkeypatch, abort=True) == ({}, [])
+
+
+@pytest.mark.parametrize("lines, error", [
+    ({"start_date": "start_date=02/06/2030"},
+     "Date de début : Format de date invalide. Utilisez : YYYY-MM-DD HH:MM"),
+    ({"end_date": "end_date=2030-06-01 10:00"},
+     "Date de fin : La date de fin doit être après la date de début"),
+    ({"attendees": "attendees=beaucoup"}, "Nombre d'invités : Veuillez saisir un nombre valide"),
+    ({"attendees": "attendees=-5"}, "Nombre d'invités : Le nombre d'invités doit être positif"),
+    ({"extra": ["lieu: Lyon"]}, "Ligne non reconnue : lieu: Lyon"),
+])
+def test_collect_in_editor_invalid(monkeypatch, lines, error):
+    """Une valeur invalide annule la saisie et l'erreur est affichée avec le champ"""
+    assert _edit_event_form(monkeypatch, **lines) == (None, [error])
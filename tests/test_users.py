@@ -6,6 +6,9 @@ from src.controllers.user_controller import UserController
 from src.models.user import User, Department
 from src.utils.validators import ValidationError
 from src.utils.auth_utils import AuthorizationError
+from src.services.auth_service import AuthenticationService
+from src.views.event_view import EventView
+from src.views.user_view import UserView
 
 
 def test_create_user_admin(db_session, admin_user):
@@ -25,6 +28,21 @@ def test_create_user_admin(db_session, admin_user):
     assert new_user.department == Department.COMMERCIAL
 
 
+def test_create_user_with_department_enum(db_session, admin_user):
+    """Le département peut être transmis directement sous forme d'enum"""
+    controller = UserController(db_session)
+    controller.set_current_user(admin_user)
+
+    new_user = controller.create_user(
+        full_name="Support Enum",
+        email="enum@user.com",
+        password="Password123!",
+        department=Department.SUPPORT
+    )
+
+    assert new_user.department == Department.SUPPORT
+
+
 def test_create_user_commercial_interdit(db_session, commercial_user):
     """Un commercial ne peut pas créer d'utilisateur"""
     controller = UserController(db_session)
@@ -91,6 +109,53 @@ def test_search_users(db_session, admin_user, commercial_user):
     assert commercial_user.id in user_ids
 
 
+def test_search_users_criteria(db_session, admin_user, commercial_user, support_user):
+    """Les critères de recherche ignorent la casse et le département est validé"""
+    controller = UserController(db_session)
+    controller.set_current_user(admin_user)
+
+    users = controller.search_users(full_name="COMMERCIAL", email="@")
+    assert [u.id for u in users] == [commercial_user.id]
+    assert users[0]._fields == ('id', 'full_name', 'email', 'department', 'employee_number')
+    assert [u.id for u in controller.search_users(department=Department.SUPPORT)] == [support_user.id]
+    assert [u.id for u in controller.search_users(department="Support")] == [support_user.id]
+
+    with pytest.raises(ValidationError):
+        controller.search_users(department="marketing")
+
+    commercial_user.employee_number = "EE123456"
+    db_session.commit()
+    assert [u.id for u in controller.search_users(employee_number=" ee123456")] == [commercial_user.id]
+    assert [u.id for u in controller.search_users(employee_number="e12")] == [commercial_user.id]
+    assert [u.id for u in controller.search_users(email="Commercial@Test.com")] == [commercial_user.id]
+    # Une adresse bien formée reste une partie de l'email recherché
+    assert [u.id for u in controller.search_users(email="commercial@test.co")] == [commercial_user.id]
+    assert [u.id for u in controller.search_users(email="ercial@TEST")] == [commercial_user.id]
+
+    # lower() SQLite ne replie que l'ASCII : le motif est replié en SQL comme la colonne
+    support_user.full_name = "Éric Dupont"
+    db_session.commit()
+    assert [u.id for u in controller.search_users(full_name="Éric")] == [support_user.id]
+    assert [u.id for u in controller.search_users(full_name="ÉRIC DUPONT")] == [support_user.id]
+
+
+def test_iter_users(db_session, admin_user, commercial_user, support_user):
+    """Les utilisateurs sont parcourus dans l'ordre des ids, par page et par département"""
+    controller = UserController(db_session)
+    controller.set_current_user(admin_user)
+
+    ids = [u.id for u in controller.iter_users(chunk=1)]
+    assert ids == sorted([admin_user.id, commercial_user.id, support_user.id])
+    assert [u.id for u in controller.iter_users("commercial")] == [commercial_user.id]
+    assert [u.id for u in controller.iter_users(offset=1, limit=1)] == ids[1:2]
+    assert controller.count_users() == 3
+    assert controller.count_users("support") == 1
+
+    controller.set_current_user(support_user)
+    with pytest.raises(AuthorizationError):
+        controller.iter_users()
+
+
 def test_delete_user(db_session, admin_user):
     """Supprimer un utilisateur"""
     controller = UserController(db_session)
@@ -117,6 +182,30 @@ def test_delete_user(db_session, admin_user):
     assert deleted_user is None
 
 
+def test_delete_support_refreshes_event_supports(db_session, admin_user, support_user,
+                                                 tmp_path, monkeypatch):
+    """Un support supprimé disparaît aussitôt du menu d'assignation des événements"""
+    service = AuthenticationService(db_session)
+    service.jwt_manager.token_file = tmp_path / "token"
+    service.jwt_manager.save_token(service.jwt_manager.generate_token(
+        user_id=admin_user.id,
+        email=admin_user.email,
+        department=admin_user.department.value,
+        employee_number=admin_user.employee_number
+    ))
+    event_view, user_view = EventView(), UserView()
+    for view in (event_view, user_view):
+        view.__dict__.update(db=db_session, auth_service=service)
+    monkeypatch.setattr(EventView, "_supports_cache", None)
+    monkeypatch.setattr(user_view, "confirm_action", lambda message: True)
+
+    assert [support.id for support in event_view._get_available_supports()] == [support_user.id]
+
+    user_view.delete_user_command(support_user.id)
+
+    assert event_view._get_available_supports() == []
+
+
 def test_create_user_email_invalide(db_session, admin_user):
     """Validation email invalide"""
     controller = UserController(db_session)